@@ -0,0 +1,34 @@
+import unittest
+from dataclasses import fields
+from unittest.mock import patch
+
+from dailies.constant.main import ENV_VAR_CONFIG, EnvConfig, get_env_config
+
+
+class TestEnvConfig(unittest.TestCase):
+
+    def test_fields_match_env_var_config(self):
+        """
+        Test that EnvConfig has one field per ENV_VAR_CONFIG key, so no variable goes unread.
+        """
+        self.assertEqual(
+            {field.name for field in fields(EnvConfig)}, set(ENV_VAR_CONFIG)
+        )
+
+    def test_get_env_config_reads_variables(self):
+        """
+        Test that get_env_config reads the ENV_VAR_CONFIG variables, with None for the unset ones.
+        """
+        get_env_config.cache_clear()
+        self.addCleanup(get_env_config.cache_clear)
+
+        with patch.dict("os.environ", {"PROJECT": "pipeline_test", "TASK_ID": "42"}, clear=True):
+            env = get_env_config()
+
+        self.assertEqual(env.project, "pipeline_test")
+        self.assertEqual(env.task_id, "42")
+        self.assertIsNone(env.artist_name)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,18 +1,38 @@
 import unittest
 import os
-import time
+import pathlib
+import tempfile
+import uuid
+from unittest.mock import patch
 
-from dailies.engine import FFmpegEngine, RVIOEngine, NukeEngine
+from dailies.engine import FFmpegEngine, RVIOEngine, NukeEngine, NukeTemplateEngine
 
+# The encoder tests run real renders, set DAILIES_RUN_ENCODER_TESTS=1 to enable them.
+# They are independent and can run in parallel: pytest -n 3 test/test_engines.py
+# The test image sequence is read from $DAILIES_TEST_DATA/ezgif-split (defaults to the temp directory).
+RUN_ENCODER_TESTS = bool(os.environ.get("DAILIES_RUN_ENCODER_TESTS"))
 
+
+@unittest.skipUnless(RUN_ENCODER_TESTS, "slow encoder test")
 class TestVideoEngines(unittest.TestCase):
 
+    @classmethod
+    def setUpClass(cls):
+        cls.BASE = pathlib.Path(os.environ.get("DAILIES_TEST_DATA", tempfile.gettempdir())) / "ezgif-split"
+        cls.INPUT = os.fspath(cls.BASE / "ezgif-frame-%03d.jpg")  # Example image sequence
+
+    def get_output_path(self):
+        """
+        Returns a unique output path, so the tests do not overwrite each other's output.
+        """
+        return os.fspath(self.BASE / f"ezgif-frame-v001-{uuid.uuid4().hex}.mov")
+
     def test_ffmpeg_create_video(self):
         ffmpeg_engine = FFmpegEngine()
 
         # Define test paths
-        input_path = "C:/Users/info/Downloads/ezgif-split/ezgif-frame-%03d.jpg"  # Example image sequence
-        output_path = "C:/Users/info/Downloads/ezgif-split/ezgif-frame-v001.mov"
+        input_path = self.INPUT
+        output_path = self.get_output_path()
         resolution = (1920, 1080)  # Resolution for the output video
         extension = "mov"  # Output video format
         fps = 30  # Frames per second for the video
@@ -27,7 +47,7 @@ class TestVideoEngines(unittest.TestCase):
         )
 
         # Check if the output file exists
-        time.sleep(2)  # Wait a bit for the file to be generated
+        # create_media only returns once the render is done, so the output exists right away
         self.assertTrue(
             os.path.exists(output_path), f"Output file not found: {output_path}"
         )
@@ -36,8 +56,8 @@ class TestVideoEngines(unittest.TestCase):
         rvio_engine = RVIOEngine()
 
         # Define test paths
-        input_path = "C:/Users/info/Downloads/ezgif-split/ezgif-frame-%03d.jpg"  # Example image sequence
-        output_path = "C:/Users/info/Downloads/ezgif-split/ezgif-frame-v001.mov"
+        input_path = self.INPUT
+        output_path = self.get_output_path()
         resolution = (1920, 1080)  # Resolution for the output video
         extension = "mov"  # Output video format
         fps = 30  # Frames per second for the video
@@ -50,7 +70,7 @@ class TestVideoEngines(unittest.TestCase):
         )
 
         # Check if the output file exists
-        time.sleep(2)  # Wait a bit for the file to be generated
+        # create_media only returns once the render is done, so the output exists right away
         self.assertTrue(
             os.path.exists(output_path), f"Output file not found: {output_path}"
         )
@@ -59,8 +79,8 @@ class TestVideoEngines(unittest.TestCase):
         nuke_engine = NukeEngine()
 
         # Define test paths
-        input_path = "C:/Users/info/Downloads/ezgif-split/ezgif-frame-%03d.jpg"  # Example image sequence
-        output_path = "C:/Users/info/Downloads/ezgif-split/ezgif-frame-v001.mov"
+        input_path = self.INPUT
+        output_path = self.get_output_path()
         resolution = (1920, 1080)  # Resolution for the output video
         extension = "mov"  # Output video format
         fps = 30  # Frames per second for the video
@@ -73,11 +93,216 @@ class TestVideoEngines(unittest.TestCase):
         )
 
         # Check if the output file exists
-        time.sleep(2)  # Wait a bit for the file to be generated
+        # create_media only returns once the render is done, so the output exists right away
         self.assertTrue(
             os.path.exists(output_path), f"Output file not found: {output_path}"
         )
 
 
+class TestNukeTemplateCache(unittest.TestCase):
+
+    def setUp(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.dir = pathlib.Path(tmp_dir.name)
+
+        for frame in range(1, 4):
+            (self.dir / f"plate.{frame:03d}.exr").write_bytes(b"frame")
+        self.template = os.fspath(self.dir / "template.nk")
+        pathlib.Path(self.template).write_text("Root {}")
+
+        self.input = os.fspath(self.dir / "plate.###.exr")
+        self.output = os.fspath(self.dir / "daily.mov")
+        self.engine = NukeTemplateEngine()
+
+        patcher = patch("dailies.engine.nuke_template_engine.NUKE_TEMPLATE_CACHE", True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_get_frame_path(self):
+        """
+        Test that both padding styles are replaced by the zero padded frame number.
+        """
+        self.assertEqual(
+            NukeTemplateEngine._get_frame_path("/shots/plate.###.exr", 7), "/shots/plate.007.exr"
+        )
+        self.assertEqual(
+            NukeTemplateEngine._get_frame_path("/shots/plate.%04d.exr", 7), "/shots/plate.0007.exr"
+        )
+        self.assertEqual(
+            NukeTemplateEngine._get_frame_path("/shots/plate.###.exr", 1001), "/shots/plate.1001.exr"
+        )
+
+    def test_cache_path_is_stable(self):
+        """
+        Test that the same frames and template lead to the same cache path.
+        """
+        cache_path = self.engine._get_cache_path(self.input, self.output, self.template)
+
+        self.assertIsNotNone(cache_path)
+        self.assertTrue(cache_path.endswith(".mov"))
+        self.assertEqual(
+            cache_path, self.engine._get_cache_path(self.input, self.output, self.template)
+        )
+
+    def test_cache_path_changes_with_middle_frame(self):
+        """
+        Test that re-rendering a frame in the middle of the sequence leads to a new cache path.
+        """
+        cache_path = self.engine._get_cache_path(self.input, self.output, self.template)
+
+        middle_frame = self.dir / "plate.002.exr"
+        middle_frame.write_bytes(b"new frame")
+        os.utime(middle_frame, ns=(1, 1))
+
+        self.assertNotEqual(
+            cache_path, self.engine._get_cache_path(self.input, self.output, self.template)
+        )
+
+    def test_cache_path_changes_with_template(self):
+        """
+        Test that editing the template leads to a new cache path.
+        """
+        cache_path = self.engine._get_cache_path(self.input, self.output, self.template)
+
+        pathlib.Path(self.template).write_text("Root { edited }")
+
+        self.assertNotEqual(
+            cache_path, self.engine._get_cache_path(self.input, self.output, self.template)
+        )
+
+    def test_uncached_renders(self):
+        """
+        Test that movie inputs, image sequence outputs and a disabled cache are not cached.
+        """
+        movie = os.fspath(self.dir / "plate.mov")
+        sequence_output = os.fspath(self.dir / "daily.###.jpg")
+
+        self.assertIsNone(self.engine._get_cache_path(movie, self.output, self.template))
+        self.assertIsNone(
+            self.engine._get_cache_path(self.input, sequence_output, self.template)
+        )
+        with patch("dailies.engine.nuke_template_engine.NUKE_TEMPLATE_CACHE", False):
+            self.assertIsNone(
+                self.engine._get_cache_path(self.input, self.output, self.template)
+            )
+
+
+class TestSequenceRange(unittest.TestCase):
+
+    def setUp(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.dir = pathlib.Path(tmp_dir.name)
+
+        # Frames crossing 999, with unrelated files next to the sequence
+        for frame in (998, 999, 1000, 1001):
+            (self.dir / f"plate.{frame:03d}.exr").write_bytes(b"frame")
+        for name in ("plate.abc.exr", "plate.1002.exr.bak", "other.0500.exr", "plate.exr"):
+            (self.dir / name).write_bytes(b"other")
+
+        self.engines = (NukeEngine(), NukeTemplateEngine())
+
+    def test_hash_padding(self):
+        """
+        Test that the frame range is detected from a ### padded path.
+        """
+        input_path = os.fspath(self.dir / "plate.###.exr")
+        for engine in self.engines:
+            with self.subTest(engine=type(engine).__name__):
+                self.assertEqual(engine._get_sequence_range(input_path), (998, 1001))
+
+    def test_printf_padding(self):
+        """
+        Test that the frame range is detected from a %03d padded path.
+        """
+        input_path = os.fspath(self.dir / "plate.%03d.exr")
+        for engine in self.engines:
+            with self.subTest(engine=type(engine).__name__):
+                self.assertEqual(engine._get_sequence_range(input_path), (998, 1001))
+
+    def test_missing_sequence(self):
+        """
+        Test that None is returned when no frame of the sequence exists.
+        """
+        input_path = os.fspath(self.dir / "comp.###.exr")
+        for engine in self.engines:
+            with self.subTest(engine=type(engine).__name__):
+                self.assertIsNone(engine._get_sequence_range(input_path))
+
+    def test_no_padding(self):
+        """
+        Test that a path without frame padding is rejected.
+        """
+        input_path = os.fspath(self.dir / "plate.exr")
+        for engine in self.engines:
+            with self.subTest(engine=type(engine).__name__):
+                with self.assertRaises(ValueError):
+                    engine._get_sequence_range(input_path)
+
+
+class TestFFmpegStreamCommand(unittest.TestCase):
+
+    def create_media_from_stream(self, extension, options=None):
+        """
+        Runs create_media_from_stream with a mocked FFmpeg process and returns the FFmpeg command.
+        """
+        with patch("dailies.engine.ffmpeg_engine.get_hw_encoder", return_value=None), patch(
+            "dailies.engine.ffmpeg_engine.subprocess.Popen"
+        ) as mock_popen:
+            mock_popen.return_value.wait.return_value = 0
+            created = FFmpegEngine().create_media_from_stream(
+                [b"\0" * 12], f"/tmp/daily.{extension}", (2, 2), extension, options=options
+            )
+
+        self.assertTrue(created)
+        return mock_popen.call_args[0][0]
+
+    def assert_arguments(self, command, *arguments):
+        """
+        Asserts that the arguments appear next to each other in the command.
+        """
+        index = command.index(arguments[0])
+        self.assertEqual(command[index : index + len(arguments)], list(arguments))
+
+    def test_mov_codec(self):
+        """
+        Test that RGB frames are encoded to a playable H.264 yuv420p movie.
+        """
+        command = self.create_media_from_stream("mov")
+
+        self.assert_arguments(command, "-f", "rawvideo", "-pix_fmt", "rgb24")
+        self.assert_arguments(command, "-c:v", "libx264", "-pix_fmt", "yuv420p")
+        self.assertEqual(command[-1], "/tmp/daily.mov")
+
+    def test_mxf_codec(self):
+        """
+        Test that MXF outputs are encoded with DNxHD.
+        """
+        command = self.create_media_from_stream("mxf")
+
+        self.assert_arguments(command, "-c:v", "dnxhd", "-pix_fmt", "yuv422p")
+
+    def test_forced_codec(self):
+        """
+        Test that a codec forced in the options replaces the default codec and pixel format.
+        """
+        command = self.create_media_from_stream("mov", options={"c:v": "prores_ks"})
+
+        self.assertNotIn("libx264", command)
+        self.assertNotIn("yuv420p", command)
+        self.assert_arguments(command, "-c:v", "prores_ks")
+
+    def test_unsupported_extension(self):
+        """
+        Test that image sequence formats cannot be streamed.
+        """
+        with patch("dailies.engine.ffmpeg_engine.subprocess.Popen") as mock_popen:
+            self.assertFalse(
+                FFmpegEngine().create_media_from_stream([], "/tmp/daily.png", (2, 2), "png")
+            )
+        mock_popen.assert_not_called()
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,99 @@
+import unittest
+from unittest.mock import patch
+
+from dailies.environment import Environment
+
+
+class FakeTracking:
+    """
+    Tracking software recording the project in which each entity is looked up.
+    """
+
+    def __init__(self):
+        self.project_id = None
+        self.entity_id = None
+        self.task_id = None
+        self.artist_id = None
+        self.entity_lookups = []
+
+    def get_project_id(self, project_name):
+        return f"{project_name}-id"
+
+    def get_entity_id(self, entity_name, entity_type=None):
+        self.entity_lookups.append((self.project_id, entity_name))
+        return f"{self.project_id}/{entity_name}"
+
+    def get_task_id(self, entity_id, task_name):
+        return f"{entity_id}/{task_name}"
+
+    def get_artist_id(self, artist_name):
+        return f"{artist_name}-id"
+
+
+class TestEnvironment(unittest.TestCase):
+
+    def setUp(self):
+        # No IDs from the environment variables, and no IDs cached by previous tests
+        patcher = patch.dict("os.environ", {}, clear=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        Environment.invalidate()
+        self.addCleanup(Environment.invalidate)
+
+        self.tracking = FakeTracking()
+        patcher = patch(
+            "dailies.factory.TrackingSoftwareFactory.get_tracking_software",
+            return_value=self.tracking,
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def create_environment(self):
+        return Environment(
+            project_name="first",
+            entity_name="SH010",
+            entity_type="shot",
+            task_name="fx",
+            artist_name="User",
+        )
+
+    def test_ids_are_fetched(self):
+        """
+        Test that the IDs are fetched and set on the tracking software.
+        """
+        environment = self.create_environment()
+
+        self.assertEqual(environment.project_id, "first-id")
+        self.assertEqual(environment.entity_id, "first-id/SH010")
+        self.assertEqual(environment.task_id, "first-id/SH010/fx")
+        self.assertEqual(environment.artist_id, "User-id")
+        self.assertEqual(self.tracking.project_id, "first-id")
+
+    def test_update_project_looks_up_entity_in_new_project(self):
+        """
+        Test that after the project is edited, the entity is looked up in the new project.
+        """
+        environment = self.create_environment()
+
+        self.assertTrue(environment.update(project_name="second"))
+
+        self.assertEqual(self.tracking.entity_lookups[-1], ("second-id", "SH010"))
+        self.assertEqual(environment.project_id, "second-id")
+        self.assertEqual(environment.entity_id, "second-id/SH010")
+        self.assertEqual(environment.task_id, "second-id/SH010/fx")
+        self.assertEqual(environment.artist_id, "User-id")
+
+    def test_update_unchanged_names(self):
+        """
+        Test that updating with the same (or empty) names does not look anything up again.
+        """
+        environment = self.create_environment()
+        lookups = len(self.tracking.entity_lookups)
+
+        self.assertFalse(environment.update(project_name="first", entity_name=""))
+        self.assertEqual(len(self.tracking.entity_lookups), lookups)
+        self.assertEqual(environment.entity_id, "first-id/SH010")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -63,6 +63,73 @@ class TestKitsuTracking(unittest.TestCase):
 
         self.assertEqual(mock_response.status_code, 400)
 
+    def create_batch_tracking(self, mock_gazu):
+        """
+        Returns a KitsuTracking instance logged in, with the gazu lookups of a shot task mocked.
+        """
+        kitsu_tracking = KitsuTracking.__new__(KitsuTracking)
+        kitsu_tracking.session = Mock()
+        kitsu_tracking.environment = Mock(
+            entity_id="shot-id", entity_name="SH010", entity_type="shot", task_name="Animation"
+        )
+
+        mock_gazu.task.get_task_type_by_name.return_value = {"id": "type-id", "name": "Animation"}
+        mock_gazu.task.all_tasks_for_entity_and_task_type.return_value = [{"id": "task-id"}]
+        mock_gazu.task.get_task.return_value = {"id": "task-id", "task_status_id": "status-id"}
+        return kitsu_tracking
+
+    @patch("dailies.tracking.kitsu_tracking.GAZU_AVAILABLE", True)
+    @patch("dailies.tracking.kitsu_tracking.gazu", create=True)
+    def test_insert_versions_bulk(self, mock_gazu):
+        """
+        Test that insert_versions looks up the entity, task and status once for all the versions.
+        """
+        kitsu_tracking = self.create_batch_tracking(mock_gazu)
+
+        versions = [
+            ("v001", "/path/to/v001.mov", "First"),
+            ("v002", "/path/to/v002.mov", "Second"),
+            ("v003", "/path/to/v003.mov", "Third"),
+        ]
+        kitsu_tracking.insert_versions(versions)
+
+        # The lookups are shared by the whole batch
+        mock_gazu.shot.get_shot.assert_called_once_with("shot-id")
+        mock_gazu.task.all_tasks_for_entity_and_task_type.assert_called_once_with(
+            "shot-id", "type-id"
+        )
+        mock_gazu.task.get_task.assert_called_once_with("task-id")
+        mock_gazu.task.get_task_status.assert_called_once_with("status-id")
+        mock_gazu.task.new_task.assert_not_called()
+
+        # A comment and a preview are created for each version
+        self.assertEqual(mock_gazu.task.add_comment.call_count, len(versions))
+        self.assertEqual(mock_gazu.task.add_preview.call_count, len(versions))
+        self.assertEqual(
+            [call.args[2] for call in mock_gazu.task.add_preview.call_args_list],
+            [video_path for _, video_path, _ in versions],
+        )
+
+    @patch("dailies.tracking.kitsu_tracking.GAZU_AVAILABLE", True)
+    @patch("dailies.tracking.kitsu_tracking.gazu", create=True)
+    def test_insert_versions_continues_after_failure(self, mock_gazu):
+        """
+        Test that a failed upload is logged with its version name and does not stop the next versions.
+        """
+        kitsu_tracking = self.create_batch_tracking(mock_gazu)
+        mock_gazu.task.add_preview.side_effect = [RuntimeError("upload failed"), {"id": "p2"}]
+
+        versions = [
+            ("v001", "/path/to/v001.mov", "First"),
+            ("v002", "/path/to/v002.mov", "Second"),
+        ]
+        with self.assertLogs("dailies.tracking.kitsu_tracking", level="ERROR") as logs:
+            kitsu_tracking.insert_versions(versions)
+
+        self.assertEqual(mock_gazu.task.add_preview.call_count, len(versions))
+        self.assertEqual(len(logs.records), 1)
+        self.assertIn("v001", logs.output[0])
+
 
 if __name__ == "__main__":
     unittest.main()
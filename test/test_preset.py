@@ -0,0 +1,86 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from dailies import preset
+from dailies.constant.main import PRESET_BUNDLE_FILENAME
+
+
+class TestLoadPresets(unittest.TestCase):
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.folder)
+        # Presets loaded by previous tests must not be reused
+        preset._PRESETS_CACHE.clear()
+        self.addCleanup(preset._PRESETS_CACHE.clear)
+
+        self.write_preset("review", {"engine": "ffmpeg", "frame_rate": 24})
+        self.write_preset("client", {"engine": "nuke", "frame_rate": 25})
+
+    def write_preset(self, name, data, mtime_ns=None):
+        path = os.path.join(self.folder, f"{name}.json")
+        with open(path, "w") as file:
+            json.dump(data, file)
+        if mtime_ns is not None:
+            os.utime(path, ns=(mtime_ns, mtime_ns))
+
+    def test_load_presets(self):
+        presets = preset.load_presets_from_folder(self.folder)
+
+        self.assertEqual(presets["review"], {"engine": "ffmpeg", "frame_rate": 24})
+        self.assertEqual(presets["client"], {"engine": "nuke", "frame_rate": 25})
+        self.assertTrue(os.path.isfile(os.path.join(self.folder, PRESET_BUNDLE_FILENAME)))
+
+    def test_bundle_hit(self):
+        expected = preset.load_presets_from_folder(self.folder)
+        preset._PRESETS_CACHE.clear()
+
+        # An up to date bundle is read instead of the individual preset files
+        with patch("builtins.open", wraps=open) as mock_open:
+            presets = preset.load_presets_from_folder(self.folder)
+
+        self.assertEqual(presets, expected)
+        opened = [os.path.basename(call.args[0]) for call in mock_open.call_args_list]
+        self.assertEqual(opened, [PRESET_BUNDLE_FILENAME])
+
+    def test_bundle_miss_after_edit(self):
+        preset.load_presets_from_folder(self.folder)
+        preset._PRESETS_CACHE.clear()
+
+        self.write_preset("review", {"engine": "rvio", "frame_rate": 30}, mtime_ns=10**18)
+        presets = preset.load_presets_from_folder(self.folder)
+
+        self.assertEqual(presets["review"], {"engine": "rvio", "frame_rate": 30})
+        self.assertEqual(presets["client"], {"engine": "nuke", "frame_rate": 25})
+
+    def test_cache_invalidated_after_edit(self):
+        preset.load_presets_from_folder(self.folder)
+
+        self.write_preset("client", {"engine": "ffmpeg", "frame_rate": 50}, mtime_ns=10**18)
+        self.write_preset("archive", {"engine": "ffmpeg", "frame_rate": 24})
+        presets = preset.load_presets_from_folder(self.folder)
+
+        self.assertEqual(presets["client"], {"engine": "ffmpeg", "frame_rate": 50})
+        self.assertIn("archive", presets)
+
+    def test_cached_presets_are_not_modified(self):
+        presets = preset.load_presets_from_folder(self.folder)
+        presets["review"]["frame_rate"] = 60
+        del presets["client"]
+
+        presets = preset.load_presets_from_folder(self.folder)
+
+        self.assertEqual(presets["review"]["frame_rate"], 24)
+        self.assertIn("client", presets)
+
+    def test_missing_folder(self):
+        with self.assertRaises(FileNotFoundError):
+            preset.load_presets_from_folder(os.path.join(self.folder, "missing"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -75,6 +75,49 @@ class TestShotgunTracking(unittest.TestCase):
         # Check that the mock response has the expected status code
         self.assertEqual(mock_response.status_code, 400)
 
+    def test_insert_versions_bulk(self):
+        """
+        Test that insert_versions creates all the versions and notes with a single batch request.
+        """
+        shotgun_tracking = ShotgunTracking.__new__(ShotgunTracking)
+        shotgun_tracking.sg = Mock()
+        shotgun_tracking.sg.find_one.return_value = {"id": 7}
+        shotgun_tracking.project_id = 123
+        shotgun_tracking.entity_id = 456
+        shotgun_tracking.entity_type = "Shot"
+
+        versions = [
+            ("v001", "/path/to/v001.mov", "First"),
+            ("v002", "/path/to/v002.mov", "Second"),
+        ]
+        with patch("dailies.tracking.shotgun_tracking.SHOTGUN_API_AVAILABLE", True):
+            shotgun_tracking.insert_versions(versions)
+
+        self.assertEqual(shotgun_tracking.sg.batch.call_count, 1)
+        shotgun_tracking.sg.create.assert_not_called()
+        requests = shotgun_tracking.sg.batch.call_args[0][0]
+        self.assertEqual(
+            [request["entity_type"] for request in requests],
+            ["Version", "Note", "Version", "Note"],
+        )
+        self.assertEqual(requests[2]["data"]["code"], "v002")
+
+    @patch.dict("dailies.tracking.shotgun_tracking._SHOTGUN_CONNECTIONS", clear=True)
+    @patch("dailies.tracking.shotgun_tracking.shotgun_api3", create=True)
+    def test_connection_is_shared(self, mock_shotgun_api3):
+        """
+        Test that the Shotgun connection is created once and reused for the same site and user.
+        """
+        from dailies.tracking.shotgun_tracking import _get_connection
+
+        first = _get_connection("https://site.shotgrid.autodesk.com", "user", "token")
+        second = _get_connection("https://site.shotgrid.autodesk.com", "user", "token")
+
+        self.assertIs(first, second)
+        mock_shotgun_api3.Shotgun.assert_called_once_with(
+            "https://site.shotgrid.autodesk.com", login="user", password="token"
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -7,12 +7,18 @@ from .test_flow import TestFlowTracking
 
 
 def suite():
-    suite = unittest.TestSuite()
-    suite.addTest(unittest.makeSuite(TestShotgunTracking))
-    suite.addTest(unittest.makeSuite(TestFtrackTracking))
-    suite.addTest(unittest.makeSuite(TestKitsuTracking))
-    suite.addTest(unittest.makeSuite(TestFlowTracking))
-    return suite
+    loader = unittest.TestLoader()
+    return unittest.TestSuite(
+        [
+            loader.loadTestsFromTestCase(test_case)
+            for test_case in (
+                TestShotgunTracking,
+                TestFtrackTracking,
+                TestKitsuTracking,
+                TestFlowTracking,
+            )
+        ]
+    )
 
 
 if __name__ == "__main__":
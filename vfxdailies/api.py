@@ -1,17 +1,9 @@
 import json
 import logging
-from constant import LOG_FORMAT, LOG_FILE_PATH
 from factory import TrackingSoftwareFactory, VideoEngineFactory
 
-# Set up logging
-logging.basicConfig(
-    level=logging.INFO,
-    format=LOG_FORMAT,
-    handlers=[
-        logging.StreamHandler(),  # Log to the console
-        logging.FileHandler(LOG_FILE_PATH),  # Log to a file for persistence
-    ],
-)
+# Set up logger
+logger = logging.getLogger(__name__)
 
 
 # Function to create media (video or image sequence) with tracking flag
@@ -44,17 +36,17 @@ def create_media_with_tracking(
             else:
                 video_engine.create_media(input_path, output_path, frame_rate)
 
-        logging.info(f"Media created successfully at {output_path} using {engine_type} engine.")
+        logger.info(f"Media created successfully at {output_path} using {engine_type} engine.")
 
         # If tracking is required, insert the version into the specified tracking software
         if tracking_software and project_id and version_number:
             insert_version_into_tracking(
                 tracking_software, project_id, version_number, output_path
             )
-            logging.info(f"Version {version_number} inserted into {tracking_software}.")
+            logger.info(f"Version {version_number} inserted into {tracking_software}.")
 
     except Exception as e:
-        logging.error(f"Error creating media with tracking: {e}")
+        logger.error(f"Error creating media with tracking: {e}")
         raise
 
 
@@ -85,10 +77,10 @@ def create_media_without_tracking(
             else:
                 video_engine.create_media(input_path, output_path, frame_rate)
 
-        logging.info(f"Media created successfully at {output_path} using {engine_type} engine.")
+        logger.info(f"Media created successfully at {output_path} using {engine_type} engine.")
 
     except Exception as e:
-        logging.error(f"Error creating media without tracking: {e}")
+        logger.error(f"Error creating media without tracking: {e}")
         raise
 
 
@@ -102,17 +94,17 @@ def insert_version_into_tracking(
             tracking_software_type
         )
 
-        logging.info(
+        logger.info(
             f"Inserting version {version_number} into {tracking_software_type}."
         )
         # Insert version into tracking software
         tracking_software.insert_version(version_number, video_path)
 
-        logging.info(
+        logger.info(
             f"Version {version_number} inserted into {tracking_software_type}."
         )
     except Exception as e:
-        logging.error(f"Error inserting version into tracking: {e}")
+        logger.error(f"Error inserting version into tracking: {e}")
         raise
 
 
@@ -126,7 +118,7 @@ def handle_slate_data(slate_data: str):
             try:
                 # Attempt to parse slate data as JSON
                 slate_data = json.loads(slate_data)
-                logging.info(f"Slate data parsed as JSON: {slate_data}")
+                logger.info(f"Slate data parsed as JSON: {slate_data}")
             except json.JSONDecodeError:
                 # If JSON fails, treat as key-value pair string (e.g., artist=John, project=Test)
                 slate_data = dict(
@@ -135,14 +127,14 @@ def handle_slate_data(slate_data: str):
                         item.split("=") for item in slate_data.split(",")
                     )
                 )
-                logging.info(f"Slate data parsed as key-value pairs: {slate_data}")
+                logger.info(f"Slate data parsed as key-value pairs: {slate_data}")
 
             return slate_data
         else:
             return {}
 
     except Exception as e:
-        logging.error(f"Error parsing slate data: {e}")
+        logger.error(f"Error parsing slate data: {e}")
         raise
 
 
@@ -165,11 +157,11 @@ def create_media_with_slate(
             )
 
         video_engine = VideoEngineFactory.get_video_engine(engine_type)
-        logging.info(f"Creating media with slate using {engine_type} engine.")
+        logger.info(f"Creating media with slate using {engine_type} engine.")
         video_engine.create_media_with_slate(
             input_path, output_path, frame_rate, slate_data
         )
 
     except Exception as e:
-        logging.error(f"Error creating media with slate: {e}")
+        logger.error(f"Error creating media with slate: {e}")
         raise
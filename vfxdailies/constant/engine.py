@@ -1,3 +1,6 @@
+import os
+from types import MappingProxyType
+
 # Engine classes
 ENGINE_CLASSES = {
     "ffmpeg": "dailies.engine.ffmpeg_engine.FFmpegEngine",
@@ -11,14 +14,60 @@ NUKE_READ_NODE = "Read1"  # Name of the Read node in the Nuke template
 NUKE_WRITE_NODE = "Write1"  # Name of the Write node in the Nuke template
 # Nuke image sequence padding format
 NUKE_FRAME_PADDING_FORMAT = "###"
+# Number of Nuke processes rendering an image sequence output in parallel with the Nuke template
+# engine, set via the NUKE_RENDER_WORKERS environment variable (1 renders in the current session)
+NUKE_RENDER_WORKERS = max(1, int(os.getenv("NUKE_RENDER_WORKERS") or 1))
+# The Nuke template engine can reuse a previous movie render when the input frames, the template
+# and the output format did not change. Set NUKE_TEMPLATE_CACHE=1 in the environment to enable it.
+NUKE_TEMPLATE_CACHE = os.getenv("NUKE_TEMPLATE_CACHE", "0") not in ("0", "false", "False", "")
 
 # Slate settings
 FFMPEG_FONT_SIZE = 18
 FFMPEG_SPACING_SIZE = 8
 FFMPEG_FONT_PATH = "/Windows/Fonts/arial.ttf"
 
+# Hardware H.264 encoders, in order of preference, with the FFmpeg arguments they need.
+# "input_args" go before the inputs, "filter" replaces the "-s" scaling (hardware frames
+# must be scaled before being uploaded) and "output_args" tune the encoder.
+FFMPEG_HW_ENCODERS = {
+    "h264_nvenc": {
+        "input_args": [],
+        "filter": None,
+        "pix_fmt": "yuv420p",
+        "output_args": ["-preset", "p4", "-tune", "hq", "-rc", "vbr", "-cq", "23", "-b:v", "0"],
+    },
+    "h264_qsv": {
+        "input_args": [],
+        "filter": None,
+        "pix_fmt": "nv12",
+        "output_args": ["-global_quality", "23"],
+    },
+    "h264_videotoolbox": {
+        "input_args": [],
+        "filter": None,
+        "pix_fmt": "yuv420p",
+        "output_args": ["-q:v", "65"],
+    },
+    "h264_vaapi": {
+        "input_args": ["-vaapi_device", "/dev/dri/renderD128"],
+        "filter": "scale={width}:{height},format=nv12,hwupload",
+        "pix_fmt": None,
+        "output_args": ["-qp", "23"],
+    },
+}
+
+# Output file types for which a hardware encoder is used when available
+FFMPEG_HW_FILE_TYPES = ("mov", "mp4")
+
+# Set FFMPEG_HW_ENCODING=0 in the environment to always encode on the CPU (libx264)
+FFMPEG_HW_ENCODING = os.getenv("FFMPEG_HW_ENCODING", "1") not in ("0", "false", "False")
+
+# Maximum number of media encoded at the same time by the batch methods of the engines,
+# set via the VFXDAILIES_CONCURRENT environment variable (defaults to half of the CPU cores)
+VFXDAILIES_CONCURRENT = max(1, int(os.getenv("VFXDAILIES_CONCURRENT") or (os.cpu_count() or 2) // 2))
+
 # Supported file types by engine
-SUPPORTED_FILE_TYPES = {
+_SUPPORTED_FILE_TYPES = {
     "nuke": [
         "cin",
         "dpx",
@@ -57,7 +106,7 @@ SUPPORTED_FILE_TYPES = {
 }
 
 # Format and codec mappings
-FORMAT_CODECS = {
+_FORMAT_CODECS = {
     "ffmpeg": {
         "dpx": ("dpx", "rawvideo"),
         "exr": ("exr", "rawvideo"),
@@ -89,27 +138,44 @@ FORMAT_CODECS = {
     },
 }
 
-# List of supported image sequence formats for detection
-IMAGE_SEQUENCES_FILE_TYPES = [
-    "dpx",
-    "exr",
-    "gif",
-    "hdr",
-    "jpg",
-    "jpeg",
-    "mxf",
-    "png",
-    "sgi",
-    "targa",
-    "tiff",
-    "xpm",
-    "yuv",
-]
+# Set of supported image sequence formats for detection
+IMAGE_SEQUENCES_FILE_TYPES = frozenset(
+    [
+        "dpx",
+        "exr",
+        "gif",
+        "hdr",
+        "jpg",
+        "jpeg",
+        "mxf",
+        "png",
+        "sgi",
+        "targa",
+        "tiff",
+        "xpm",
+        "yuv",
+    ]
+)
+
+# Set of supported video formats
+VIDEO_FILE_TYPES = frozenset(
+    [
+        "mov",
+        "mp4",
+        "mxf",
+        "jpeg2000",
+    ]
+)
 
-# List of supported video formats
-VIDEO_FILE_TYPES = [
-    "mov",
-    "mp4",
-    "mxf",
-    "jpeg2000",
-]
+# Read-only views of the mappings above, they can be shared across threads.
+# The file types keep their order (the first one is the default of the UI extension list),
+# SUPPORTED_FILE_TYPE_SETS holds the same file types for hashed membership tests.
+SUPPORTED_FILE_TYPES = MappingProxyType(
+    {engine: tuple(file_types) for engine, file_types in _SUPPORTED_FILE_TYPES.items()}
+)
+SUPPORTED_FILE_TYPE_SETS = MappingProxyType(
+    {engine: frozenset(file_types) for engine, file_types in _SUPPORTED_FILE_TYPES.items()}
+)
+FORMAT_CODECS = MappingProxyType(
+    {engine: MappingProxyType(codecs) for engine, codecs in _FORMAT_CODECS.items()}
+)
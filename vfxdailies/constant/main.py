@@ -1,5 +1,8 @@
 import os
 import tempfile
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional
 
 from dailies.constant.util import get_daily_tmp_directory, get_package_root_directory
 
@@ -14,12 +17,19 @@ LOG_FILE_PATH = os.path.join(get_package_root_directory(), 'dailies.log')
 DEFAULT_PRESET_DIRECTORY = os.path.join(get_package_root_directory(), 'preset')
 DEFAULT_TEMPLATE_DIRECTORY = os.path.join(get_package_root_directory(), 'template')
 
-# Get the system's base temporary directory (cross-platform)
-BASE_TMP_DIRECTORY = tempfile.gettempdir()
+# Name of the file, stored next to the presets, bundling all of them into a single JSON document.
+# It is rebuilt automatically whenever a preset file is added, removed or modified.
+PRESET_BUNDLE_FILENAME = 'presets.bundle'
 
-# Use the utility function to generate the path for the daily TMP directory.
-# This directory will be used to store daily-specific temporary files.
-DEFAULT_TMP_DIRECTORY = get_daily_tmp_directory(BASE_TMP_DIRECTORY)
+# The temporary directories below are resolved lazily (see __getattr__ at the end of this module),
+# so importing the constants does not touch the file system:
+# - BASE_TMP_DIRECTORY: the system's base temporary directory (cross-platform).
+# - DEFAULT_TMP_DIRECTORY: the daily TMP directory, created under BASE_TMP_DIRECTORY if needed.
+#   This directory will be used to store daily-specific temporary files.
+_LAZY_DIRECTORIES = {
+    "BASE_TMP_DIRECTORY": tempfile.gettempdir,
+    "DEFAULT_TMP_DIRECTORY": lambda: get_daily_tmp_directory(tempfile.gettempdir()),
+}
 
 # Dictionary mapping common field names to corresponding environment variable names.
 # This is useful for extracting values from environment variables dynamically.
@@ -38,6 +48,41 @@ ENV_VAR_CONFIG = {
     "artist_id": "ARTIST_ID",         # The unique ID for the artist
 }
 
+
+@dataclass(frozen=True)
+class EnvConfig:
+    """
+    Snapshot of the environment variables listed in `ENV_VAR_CONFIG`.
+    Each attribute holds the value of the matching variable, or None if it is not set.
+    """
+
+    path: Optional[str] = None
+    version: Optional[str] = None
+    description: Optional[str] = None
+    project: Optional[str] = None
+    project_id: Optional[str] = None
+    entity_name: Optional[str] = None
+    entity_id: Optional[str] = None
+    entity_type: Optional[str] = None
+    task_name: Optional[str] = None
+    task_id: Optional[str] = None
+    artist_name: Optional[str] = None
+    artist_id: Optional[str] = None
+
+
+@lru_cache(maxsize=1)
+def get_env_config():
+    """
+    Reads the variables listed in `ENV_VAR_CONFIG` from the environment.
+    The values are read once per process, call `get_env_config.cache_clear()` to read them again
+    (e.g., after the environment has been updated for another shot or task).
+
+    Returns:
+        EnvConfig: The frozen environment configuration.
+    """
+    return EnvConfig(**{field: os.environ.get(name) for field, name in ENV_VAR_CONFIG.items()})
+
+
 # Frame padding format to ensure consistent frame numbering (e.g., "001", "002", "003", etc.).
 # This will be used to format frame numbers with leading zeros.
 FRAME_PADDING_FORMAT = '%03d'  # This means three digits with leading zeros, like "001"
@@ -60,3 +105,15 @@ PROJECT: {project}
 RESOLUTION: {resolution[0]}x{resolution[1]}
 FPS: {fps}
 """
+
+
+def __getattr__(name):
+    """
+    Resolves the lazy temporary directory constants on first access, then caches them
+    in the module globals so later lookups do not go through this function.
+    """
+    resolve = _LAZY_DIRECTORIES.get(name)
+    if resolve is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = globals()[name] = resolve()
+    return value
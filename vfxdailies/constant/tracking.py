@@ -1,37 +1,7 @@
 import os
-import logging
-
-from dailies.constant.main import LOG_FORMAT, LOG_FILE_PATH
-
-# Set up logger
-logger = logging.getLogger(__name__)
-logger.setLevel(logging.INFO)
-
-logging.basicConfig(
-    level=logging.INFO,
-    format=LOG_FORMAT,
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler(LOG_FILE_PATH),
-    ]
-)
-
-# Choose the tracking engine (e.g., 'shotgun', 'ftrack', 'kitsu')
-TRACKING_ENGINE = os.getenv("TRACKING_ENGINE", "shotgun")  # Default to 'shotgun' if not set in environment
-
-# Tracking credentials
-# If not set via environment variables, fallback to default values
-TRACKING_LOGIN_USR = os.getenv("TRACKING_LOGIN_USR", "USR")  # Set via environment or change here
-TRACKING_LOGIN_PWD = os.getenv("TRACKING_LOGIN_PWD", "PWD")  # Set via environment or change here
-TRACKING_API_TOKEN = os.getenv("TRACKING_API_TOKEN", "PWD")  # Set via environment or change here
-
-# Log warnings if credentials are missing or using default values
-if TRACKING_LOGIN_USR == "USR":
-    logger.warning("Tracking username is not set or is using the default value: 'USR'. Please set 'TRACKING_LOGIN_USER' in your environment variables.")
-if TRACKING_LOGIN_PWD == "PWD":
-    logger.warning("Tracking password is not set or is using the default value: 'PWD'. Please set 'TRACKING_LOGIN_PWD' in your environment variables.")
-if TRACKING_API_TOKEN == "PWD":
-    logger.warning("Tracking API token is not set or is using the default value: 'PWD'. Please set 'TRACKING_API_TOKEN' in your environment variables.")
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional
 
 # URLs for tracking engines
 API_URLS = {
@@ -40,18 +10,74 @@ API_URLS = {
     "kitsu": "https://your-kitsu-instance.com/api/v1",
 }
 
+# Names of the supported tracking engines, used for membership checks
+VALID_TRACKING_ENGINES = frozenset(API_URLS)
+
+
+@dataclass(frozen=True)
+class TrackingConfig:
+    """
+    Snapshot of the tracking configuration read from the environment variables.
+
+    Attributes:
+        engine (str): The tracking engine (e.g., 'shotgun', 'ftrack', 'kitsu').
+        login_user (str): The tracking login username.
+        login_pwd (str): The tracking login password.
+        api_token (str): The tracking API token.
+        api_url (str or None): The API URL of the tracking engine, or None if the engine is unknown.
+    """
+
+    engine: str
+    login_user: str
+    login_pwd: str
+    api_token: str
+    api_url: Optional[str]
+
+
+@lru_cache(maxsize=1)
+def get_tracking_config():
+    """
+    Reads the tracking configuration from the environment variables.
+    The tracking configuration does not change at runtime, so it is only read once per process.
+
+    Returns:
+        TrackingConfig: The frozen tracking configuration.
+    """
+    # Choose the tracking engine (e.g., 'shotgun', 'ftrack', 'kitsu')
+    engine = os.getenv("TRACKING_ENGINE", "shotgun")  # Default to 'shotgun' if not set in environment
+
+    # Tracking credentials
+    # If not set via environment variables, fallback to default values
+    return TrackingConfig(
+        engine=engine,
+        login_user=os.getenv("TRACKING_LOGIN_USR", "USR"),  # Set via environment or change here
+        login_pwd=os.getenv("TRACKING_LOGIN_PWD", "PWD"),  # Set via environment or change here
+        api_token=os.getenv("TRACKING_API_TOKEN", "PWD"),  # Set via environment or change here
+        api_url=API_URLS.get(engine),
+    )
+
+
+def clear_cache():
+    """
+    Clears the cached tracking configuration, so the next call to get_tracking_config
+    reads the environment variables again (e.g., in tests).
+    The module level constants below keep the values read at import time.
+    """
+    get_tracking_config.cache_clear()
+
+
+# Legacy view of the configuration read at import time, kept for existing scripts.
+# It is not refreshed by clear_cache, so the dailies code must use get_tracking_config() instead.
+_config = get_tracking_config()
+
+TRACKING_ENGINE = _config.engine
+TRACKING_LOGIN_USR = _config.login_user
+TRACKING_LOGIN_PWD = _config.login_pwd
+TRACKING_API_TOKEN = _config.api_token
+
 # Dictionary to map tracking software names to their respective class names
 TRACKING_SOFTWARE_CLASSES = {
     "shotgun": "dailies.tracking.shotgun_tracking.ShotgunTracking",
     "ftrack": "dailies.tracking.ftrack_tracking.FtrackTracking",
     "kitsu": "dailies.tracking.kitsu_tracking.KitsuTracking",
 }
-
-# Log the chosen tracking engine and its corresponding API URL
-logger.info(f"Using tracking engine: {TRACKING_ENGINE}")
-
-if TRACKING_ENGINE in API_URLS:
-    logger.info(f"API URL for {TRACKING_ENGINE}: {API_URLS[TRACKING_ENGINE]}")
-else:
-    logger.warning(f"Unknown tracking engine '{TRACKING_ENGINE}' specified. Defaulting to 'shotgun'.")
-    logger.info(f"API URL for 'shotgun': {API_URLS['shotgun']}")
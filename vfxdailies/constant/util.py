@@ -1,7 +1,9 @@
 import os
 from datetime import datetime
+from functools import lru_cache
 
 
+@lru_cache(maxsize=None)
 def get_daily_tmp_directory(base_path: str) -> str:
     """
     Creates a directory for the current date under the given base path.
@@ -9,6 +11,7 @@ def get_daily_tmp_directory(base_path: str) -> str:
     Otherwise, it creates the directory.
 
     Ensures the base path exists before proceeding.
+    The result is cached, so the checks and the directory creation only run once per base path.
 
     Args:
         base_path (str): The base path where the daily directory should be created.
@@ -51,6 +54,7 @@ def get_daily_tmp_directory(base_path: str) -> str:
     return tmp_directory
 
 
+@lru_cache(maxsize=1)
 def get_package_root_directory():
     """
     Returns the root directory of the package, which is the directory
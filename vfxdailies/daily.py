@@ -2,22 +2,18 @@ import argparse
 import json
 import logging
 
-from dailies.constant.main import LOG_FORMAT, LOG_FILE_PATH
 from dailies.factory import VideoEngineFactory, TrackingSoftwareFactory
+from dailies.logging_setup import configure_logging
 
-# Set up logging
-logging.basicConfig(
-    level=logging.INFO,  # Set the default logging level to INFO
-    format=LOG_FORMAT,
-    handlers=[
-        logging.StreamHandler(),  # Log to the console
-        logging.FileHandler(LOG_FILE_PATH),  # Log to a file for persistence
-    ],
-)
+# Set up logger
+logger = logging.getLogger(__name__)
 
 
 # Main workflow: Create Video and Update Tracking
 def main():
+    # Log to the console and to the log file
+    configure_logging()
+
     # Step 1: Set up argument parser
     parser = argparse.ArgumentParser(description="Create media and update tracking.")
 
@@ -112,7 +108,7 @@ def main():
         # Step 2: Create video using chosen video engine
         video_engine = VideoEngineFactory.get_video_engine(args.video_engine.lower())
 
-        logging.info(f"Creating output using {args.video_engine} engine.")
+        logger.info(f"Creating output using {args.video_engine} engine.")
 
         # Step 3: Handle slate data (if provided)
         slate_data = {}
@@ -121,14 +117,14 @@ def main():
             try:
                 # Try parsing as JSON first
                 slate_data = json.loads(args.slate_data)
-                logging.info(f"Slate data parsed as JSON: {slate_data}")
+                logger.info(f"Slate data parsed as JSON: {slate_data}")
             except json.JSONDecodeError:
                 # If JSON parsing fails, treat as comma-separated key-value pairs
                 slate_data = dict(
                     (key.strip(), value.strip())
                     for key, value in (item.split("=") for item in args.slate_data.split(","))
                 )
-                logging.info(f"Slate data parsed as comma-separated key-value pairs: {slate_data}")
+                logger.info(f"Slate data parsed as comma-separated key-value pairs: {slate_data}")
 
             # Provide default values if keys are missing
             slate_data.setdefault("artist", "Unknown Artist")
@@ -136,7 +132,7 @@ def main():
             slate_data.setdefault("fps", "24 FPS")
             slate_data.setdefault("version", "v001")
 
-            logging.info(f"Creating slate with data: {slate_data}")
+            logger.info(f"Creating slate with data: {slate_data}")
 
         # Step 4: Parse resolution (widthxheight format)
         try:
@@ -145,7 +141,7 @@ def main():
                 raise ValueError(
                     "Resolution must be in the format widthxheight (e.g., 1920x1080)."
                 )
-            logging.info(f"Resolution set to {resolution[0]}x{resolution[1]}")
+            logger.info(f"Resolution set to {resolution[0]}x{resolution[1]}")
         except ValueError:
             raise ValueError(
                 "Invalid resolution format. It should be 'widthxheight' (e.g., 1920x1080)."
@@ -157,11 +153,11 @@ def main():
             try:
                 # Try parsing as JSON first
                 options = json.loads(args.options)
-                logging.info(f"Options parsed as JSON: {options}")
+                logger.info(f"Options parsed as JSON: {options}")
             except json.JSONDecodeError:
                 # If JSON parsing fails, treat as comma-separated list
                 options = {opt.strip(): True for opt in args.options.split(",")}
-                logging.info(f"Options parsed as comma-separated list: {options}")
+                logger.info(f"Options parsed as comma-separated list: {options}")
 
         # Step 6: Call the appropriate create_media method based on video engine
         if args.video_engine == "nuke-template":
@@ -191,12 +187,12 @@ def main():
             args.project_id, args.version_number, args.output_path
         )
 
-        logging.info(
+        logger.info(
             f"Version {args.version_number} inserted into {args.tracking_software}."
         )
 
     except Exception as e:
-        logging.error(f"An error occurred: {e}")
+        logger.error(f"An error occurred: {e}")
         raise
 
 
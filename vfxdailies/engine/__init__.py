@@ -1,7 +1,13 @@
-from .ffmpeg_engine import FFmpegEngine
-from .nuke_engine import NukeEngine
-from .nuke_template_engine import NukeTemplateEngine
-from .rvio_engine import RVIOEngine
+import importlib
+
+# The engines are imported on first access (PEP 562), so e.g. using FFmpegEngine
+# does not import the Nuke or RV modules
+_LAZY_ENGINES = {
+    'FFmpegEngine': '.ffmpeg_engine',
+    'NukeEngine': '.nuke_engine',
+    'NukeTemplateEngine': '.nuke_template_engine',
+    'RVIOEngine': '.rvio_engine',
+}
 
 # If you want to create a list of all engines for convenience
 __all__ = [
@@ -10,3 +16,26 @@ __all__ = [
     'NukeTemplateEngine',
     'RVIOEngine',
 ]
+
+
+def __getattr__(name):
+    """
+    Imports the engine module on first access to one of its engine classes.
+
+    Args:
+        name (str): The requested attribute name.
+
+    Returns:
+        type: The engine class.
+    """
+    module_name = _LAZY_ENGINES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    engine_class = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = engine_class  # Cache it, so __getattr__ is not called again
+    return engine_class
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,39 +1,37 @@
 import os
 import logging
 import subprocess
+from functools import lru_cache
 from pathlib import Path
 
+from dailies.constant import main as constant_main
 from dailies.constant.main import (
-    DEFAULT_TMP_DIRECTORY,
-    LOG_FORMAT,
-    LOG_FILE_PATH,
     FRAME_PADDING_FORMAT,
     FRAME_START_NUMBER,
 )
 from dailies.constant.engine import (
-    SUPPORTED_FILE_TYPES,
+    SUPPORTED_FILE_TYPE_SETS,
     FORMAT_CODECS,
     FFMPEG_FONT_SIZE,
     FFMPEG_SPACING_SIZE,
     FFMPEG_FONT_PATH,
     IMAGE_SEQUENCES_FILE_TYPES,
     VIDEO_FILE_TYPES,
+    FFMPEG_HW_ENCODERS,
+    FFMPEG_HW_ENCODING,
+    FFMPEG_HW_FILE_TYPES,
 )
-from dailies.engine.video_engine import VideoEngine, generate_slate_text
+from dailies.engine.video_engine import (
+    VideoEngine,
+    generate_slate_text,
+    resolve_executable,
+)
+from dailies.logging_setup import configure_logging
 
 # Set up logger
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
-logging.basicConfig(
-    level=logging.INFO,
-    format=LOG_FORMAT,
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler(LOG_FILE_PATH),
-    ],
-)
-
 
 def validate_file_path(file_path):
     """
@@ -52,6 +50,61 @@ def validate_file_path(file_path):
     return True
 
 
+@lru_cache(maxsize=1)
+def get_hw_encoder():
+    """
+    Detects the first hardware H.264 encoder (see FFMPEG_HW_ENCODERS) usable on this machine.
+    The detection runs FFmpeg, so the result is cached for the lifetime of the process.
+
+    Returns:
+        str or None: The FFmpeg encoder name (e.g., "h264_nvenc"), or None to encode on the CPU.
+    """
+    if not FFMPEG_HW_ENCODING:
+        return None
+
+    try:
+        result = subprocess.run(
+            [resolve_executable("ffmpeg"), "-hide_banner", "-encoders"],
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+    except (OSError, subprocess.CalledProcessError) as e:
+        logger.warning("Could not list the FFmpeg encoders: %s", e)
+        return None
+
+    # Lines look like " V....D h264_nvenc  NVIDIA NVENC H.264 encoder (codec h264)"
+    compiled_encoders = {
+        fields[1] for fields in map(str.split, result.stdout.splitlines()) if len(fields) > 1
+    }
+
+    for encoder, settings in FFMPEG_HW_ENCODERS.items():
+        if encoder not in compiled_encoders:
+            continue
+
+        # Being compiled in does not mean the device is present, so encode a single test frame
+        command = [
+            resolve_executable("ffmpeg"), "-hide_banner", "-loglevel", "error",
+            *settings["input_args"],
+            "-f", "lavfi", "-i", "color=c=black:s=256x256",
+            "-frames:v", "1",
+        ]
+        if settings["filter"]:
+            command.extend(["-vf", settings["filter"].format(width=256, height=256)])
+        command.extend(["-c:v", encoder, "-f", "null", "-"])
+
+        try:
+            subprocess.run(command, check=True, capture_output=True, timeout=30)
+        except (OSError, subprocess.SubprocessError):
+            logger.debug("Hardware encoder %s is not usable on this machine.", encoder)
+            continue
+
+        logger.info("Using hardware encoder: %s", encoder)
+        return encoder
+
+    return None
+
+
 class FFmpegEngine(VideoEngine):
     """
     Media engine implementation using FFmpeg for creating media files (video or image sequences).
@@ -60,6 +113,8 @@ class FFmpegEngine(VideoEngine):
     It supports both video generation and other media types such as image sequences.
     """
 
+    __slots__ = ()
+
     def create_media(
         self,
         input_path,
@@ -87,7 +142,7 @@ class FFmpegEngine(VideoEngine):
             return
 
         # Check if the file extension is supported by FFmpeg
-        if extension not in SUPPORTED_FILE_TYPES["ffmpeg"]:
+        if extension not in SUPPORTED_FILE_TYPE_SETS["ffmpeg"]:
             logger.error(f"Unsupported file extension for FFmpeg: {extension}")
             return
 
@@ -101,19 +156,26 @@ class FFmpegEngine(VideoEngine):
             # Get codec and pixel format for the given file extension
             codec, pix_fmt = FORMAT_CODECS["ffmpeg"][extension]
 
+        # Encode videos on the GPU when possible, unless a codec is forced in the options
+        hw_encoder = None
+        if extension in FFMPEG_HW_FILE_TYPES and not (
+            options and ("c:v" in options or "vcodec" in options)
+        ):
+            hw_encoder = get_hw_encoder()
+
         # If slate data is provided, generate and add a slate frame (only for image sequences)
         slate_file = None
         if slate_data:
             # Get the file extension from the input image sequence to match the slate format
             file_extension = input_path.split(".")[-1]
-            slate_file = Path(DEFAULT_TMP_DIRECTORY) / f"slate_with_text.{file_extension}" # Single image for slate
+            slate_file = Path(constant_main.DEFAULT_TMP_DIRECTORY) / f"slate_with_text.{file_extension}" # Single image for slate
             slate_file = slate_file.as_posix()  # Ensures forward slashes
             logger.info("Generating slate file.")
             self.generate_slate_frame(slate_data, slate_file)
             logger.info(f"Slate file: {slate_file}")
 
         # Create the input list file (for image sequence or video)
-        input_list_file_path = Path(DEFAULT_TMP_DIRECTORY) / "temp_file_list.txt"
+        input_list_file_path = Path(constant_main.DEFAULT_TMP_DIRECTORY) / "temp_file_list.txt"
         input_list_file_path = input_list_file_path.as_posix()  # Ensures forward slashes
         try:
             with open(input_list_file_path, "w+") as fp:
@@ -123,7 +185,14 @@ class FFmpegEngine(VideoEngine):
                 fp.write(f"file '{input_path}'\n")
 
             ffmpeg_command = self.build_ffmpeg_command(
-                input_list_file_path, resolution, codec, pix_fmt, output_path, options, fps
+                input_list_file_path,
+                resolution,
+                codec,
+                pix_fmt,
+                output_path,
+                options,
+                fps,
+                hw_encoder=hw_encoder,
             )
 
             # Run the FFmpeg command to create the media
@@ -139,8 +208,103 @@ class FFmpegEngine(VideoEngine):
             logger.error(f"Unexpected error: {e}")
             logger.error(f"FFmpeg command: {' '.join(ffmpeg_command)}")
 
+    def create_media_from_stream(
+        self,
+        frames,
+        output_path,
+        resolution,
+        extension,
+        fps=24,
+        options=None,
+    ):
+        """
+        Creates a video from frames produced in memory (e.g., by Nuke or OpenImageIO), piping them
+        to FFmpeg's stdin instead of writing them to disk and reading them back.
+
+        Args:
+            frames (iterable): Frames as raw RGB24 buffers (bytes or C-contiguous arrays of
+                height x width x 3 uint8), in the order they should be encoded.
+            output_path (str): Path to save the output video file.
+            resolution (tuple): Resolution of the frames and of the output video in the form (width, height).
+            extension (str): Output file extension (e.g., "mov", "mp4").
+            fps (int, optional): Frames per second of the frames and the output video. Default is 24.
+            options (dict, optional): Additional options for FFmpeg, such as encoding settings or codec preferences.
+
+        Returns:
+            bool: True if the video was created, False otherwise.
+        """
+        if extension not in VIDEO_FILE_TYPES or extension not in SUPPORTED_FILE_TYPE_SETS["ffmpeg"]:
+            logger.error(f"Unsupported file extension for FFmpeg streaming: {extension}")
+            return False
+
+        # The frames are RGB, so the codec and pixel format of the output format are always set,
+        # unless a codec is forced in the options
+        codec_forced = bool(options) and ("c:v" in options or "vcodec" in options)
+        codec, pix_fmt = (None, None) if codec_forced else FORMAT_CODECS["ffmpeg"][extension]
+
+        # Encode videos on the GPU when possible, unless a codec is forced in the options
+        hw_encoder = None
+        if extension in FFMPEG_HW_FILE_TYPES and not codec_forced:
+            hw_encoder = get_hw_encoder()
+
+        width, height = resolution
+        ffmpeg_command = self.build_ffmpeg_command(
+            None,
+            resolution,
+            codec,
+            pix_fmt,
+            output_path,
+            options,
+            fps,
+            hw_encoder=hw_encoder,
+            input_args=[
+                "-f", "rawvideo",
+                "-pix_fmt", "rgb24",
+                "-s", f"{width}x{height}",
+                "-r", str(fps),
+                "-i", "-",  # Read the frames from stdin
+            ],
+        )
+
+        logger.info(f"Running FFmpeg command: {' '.join(ffmpeg_command)}")
+        try:
+            process = subprocess.Popen(ffmpeg_command, stdin=subprocess.PIPE)
+        except OSError as e:
+            logger.error(f"Failed to start FFmpeg: {e}")
+            return False
+
+        try:
+            for frame in frames:
+                process.stdin.write(frame)
+        except BrokenPipeError:
+            # FFmpeg exited early, its error is reported through the return code below
+            pass
+        finally:
+            try:
+                process.stdin.close()
+            except BrokenPipeError:
+                pass
+            return_code = process.wait()
+
+        if return_code != 0:
+            logger.error(f"Error during media creation with FFmpeg (exit code {return_code})")
+            logger.error(f"FFmpeg command: {' '.join(ffmpeg_command)}")
+            return False
+
+        logger.info(f"Media created successfully using FFmpeg at {output_path}")
+        return True
+
     def build_ffmpeg_command(
-        self, input_list_file, resolution, codec, pix_fmt, output_path, options=None, fps=None
+        self,
+        input_list_file,
+        resolution,
+        codec,
+        pix_fmt,
+        output_path,
+        options=None,
+        fps=None,
+        hw_encoder=None,
+        input_args=None,
     ):
         """
         Builds the FFmpeg command for processing media files.
@@ -153,20 +317,48 @@ class FFmpegEngine(VideoEngine):
             output_path (str): Path where the output media will be saved.
             options (dict, optional): Additional FFmpeg options.
             fps (int, optional): Frames per second for video output (only needed for image sequences). Default is None.
+            hw_encoder (str, optional): Hardware encoder from FFMPEG_HW_ENCODERS, replacing codec and pix_fmt.
+            input_args (list, optional): Input arguments replacing the concat input of input_list_file
+                (e.g., to read raw frames from stdin).
 
         Returns:
             list: FFmpeg command as a list of arguments.
         """
+        hw_settings = FFMPEG_HW_ENCODERS[hw_encoder] if hw_encoder else None
+
         ffmpeg_command = [
-            "ffmpeg",
+            resolve_executable("ffmpeg"),
             "-loglevel", "info",  # Add loglevel info for FFmpeg output
-            "-f", "concat",  # Specify concatenation mode
-            "-safe", "0",  # Allow unsafe file paths
-            "-i", input_list_file,  # Use the temporary file list
-            "-s", f"{resolution[0]}x{resolution[1]}",  # Resolution
-            "-threads", "4",  # Tell FFmpeg to use 4 threads
         ]
 
+        # Hardware device initialization must come before the inputs
+        if hw_settings:
+            ffmpeg_command.extend(hw_settings["input_args"])
+
+        if input_args:
+            ffmpeg_command.extend(input_args)
+        else:
+            ffmpeg_command.extend([
+                "-f", "concat",  # Specify concatenation mode
+                "-safe", "0",  # Allow unsafe file paths
+                "-thread_queue_size", "1024",  # Let the demuxer read ahead of the encoder
+                "-i", input_list_file,  # Use the temporary file list
+            ])
+
+        if hw_settings and hw_settings["filter"]:
+            # Scale on the CPU before uploading the frames to the device
+            ffmpeg_command.extend(
+                ["-vf", hw_settings["filter"].format(width=resolution[0], height=resolution[1])]
+            )
+        else:
+            ffmpeg_command.extend(["-s", f"{resolution[0]}x{resolution[1]}"])  # Resolution
+
+        ffmpeg_command.extend(["-threads", "0"])  # Let FFmpeg pick the number of threads
+
+        if hw_settings:
+            codec = hw_encoder
+            pix_fmt = hw_settings["pix_fmt"]
+
         # Only add codec if it's not None
         if codec:
             ffmpeg_command.extend(["-c:v", codec])
@@ -175,6 +367,10 @@ class FFmpegEngine(VideoEngine):
         if pix_fmt:
             ffmpeg_command.extend(["-pix_fmt", pix_fmt])
 
+        # Hardware encoder tuning
+        if hw_settings:
+            ffmpeg_command.extend(hw_settings["output_args"])
+
         # Only add fps if it's not None
         if fps:
             ffmpeg_command.append("-r")
@@ -248,7 +444,7 @@ class FFmpegEngine(VideoEngine):
 
         # Prepare the FFmpeg command with the dynamic resolution
         command = [
-            "ffmpeg",
+            resolve_executable("ffmpeg"),
             "-f", "lavfi",  # Using FFmpeg's 'lavfi' (libavfilter) to generate a static color
             "-t", "0.001",  # Generate a single frame
             "-i", f"color=c=black:s={resolution[0]}x{resolution[1]}",  # Use resolution as passed in slate data (e.g. 480x270)
@@ -277,6 +473,9 @@ class FFmpegEngine(VideoEngine):
 
 
 def main():
+    # Log to the console and to the log file
+    configure_logging()
+
     # Example test paths (replace these with actual paths)
     input_path = "C:/Users/info/Downloads/ezgif-split/ezgif-frame-%03d.jpg"  # Replace with a valid input media path
     output_path = "C:/Users/info/Downloads/ezgif-split/output.mov"  # Replace with a desired output path
@@ -1,15 +1,15 @@
+import glob
 import logging
 import os
+import re
 
 from dailies.constant.main import (
-    LOG_FORMAT,
-    LOG_FILE_PATH,
     FRAME_START_NUMBER,
     FRAME_PADDING_FORMAT,
 )
 from dailies.constant.engine import (
     SUPPORTED_FILE_TYPES,
-    FORMAT_CODECS,
+    SUPPORTED_FILE_TYPE_SETS,
     NUKE_FRAME_PADDING_FORMAT,
 )
 from dailies.engine.video_engine import VideoEngine
@@ -26,29 +26,12 @@ from dailies.nuke_write_config import (
     XPMConfigurator,
     YUVConfigurator,
 )
+from dailies.logging_setup import configure_logging
 
 # Set up logger
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
-logging.basicConfig(
-    level=logging.INFO,  # Set the default logger level to INFO
-    format=LOG_FORMAT,
-    handlers=[
-        logging.StreamHandler(),  # Log to the console
-        logging.FileHandler(LOG_FILE_PATH),
-    ],
-)
-
-# Only import nuke if available
-try:
-    import nuke
-
-    NukeAvailable = True
-except ImportError:
-    NukeAvailable = False
-    logger.warning("Nuke is not available. Media creation using Nuke cannot proceed.")
-
 
 def validate_file_path(file_path):
     """
@@ -76,6 +59,8 @@ class NukeEngine(VideoEngine):
     (video or image sequence) and optionally embedding a slate.
     """
 
+    __slots__ = ()
+
     def create_media(
         self,
         input_path,
@@ -99,7 +84,10 @@ class NukeEngine(VideoEngine):
             options (dict, optional): Additional options for configuring the output media (e.g., encoding settings).
             slate_data (dict, optional): Data for generating a slate frame (if applicable, e.g., for videos or image sequences).
         """
-        if not NukeAvailable:
+        # Nuke is only imported when media is created, so importing this module stays cheap
+        try:
+            import nuke
+        except ImportError:
             logger.error("Nuke is not available, cannot proceed with media creation.")
             return
 
@@ -107,10 +95,10 @@ class NukeEngine(VideoEngine):
         if not validate_file_path(input_path):
             return
 
-        # Check if the file extension is supported by Nuke via FORMAT_CODECS
-        if extension not in SUPPORTED_FILE_TYPES["nuke"]:
+        # Check if the file extension is supported by Nuke
+        if extension not in SUPPORTED_FILE_TYPE_SETS["nuke"]:
             logger.warning(
-                f"File extension '{extension}' is not supported by Nuke engine. Supported types: {FORMAT_CODECS['nuke']}"
+                f"File extension '{extension}' is not supported by Nuke engine. Supported types: {list(SUPPORTED_FILE_TYPES['nuke'])}"
             )
             return
 
@@ -151,7 +139,7 @@ class NukeEngine(VideoEngine):
 
             # Dynamically select the appropriate configurator based on the extension
             write_node_configurator = None
-            if extension in SUPPORTED_FILE_TYPES["nuke"] and options:
+            if extension in SUPPORTED_FILE_TYPE_SETS["nuke"] and options:
                 logger.info("Setting options")
 
                 if extension == "mov":
@@ -207,32 +195,44 @@ class NukeEngine(VideoEngine):
     def _get_sequence_range(self, input_path):
         """
         Helper function to extract the frame range from the image sequence.
+        The frame files are matched with a single glob over the sequence directory,
+        instead of checking each possible frame file.
+
         Args:
             input_path (str): Path to the input image sequence.
+
         Returns:
             tuple: (first_frame, last_frame) if sequence is found, None otherwise.
+
+        Raises:
+            ValueError: If the input path has no frame padding token.
         """
-        base_path = input_path.split("###")[0]
-        first_frame = None
-        last_frame = None
-
-        # Check for the first frame (assumes the first frame is 001)
-        for i in range(1, 1000):  # Assuming there are fewer than 1000 frames
-            file_path = (
-                base_path + str(i).zfill(3) + ".jpg"
-            )  # Adjust for your file extension
-            if os.path.exists(file_path):
-                if first_frame is None:
-                    first_frame = i
-            else:
-                if first_frame is not None:
-                    last_frame = i - 1
-                    break
+        input_path = input_path.replace(FRAME_PADDING_FORMAT, NUKE_FRAME_PADDING_FORMAT)
+        if NUKE_FRAME_PADDING_FORMAT not in input_path:
+            raise ValueError(f"No frame padding found in sequence path: {input_path}")
+
+        prefix, _, suffix = input_path.partition(NUKE_FRAME_PADDING_FORMAT)
+        # Match the file names only, glob may join the directory with another separator on Windows
+        frame_re = re.compile(
+            rf"{re.escape(os.path.basename(prefix))}(\d+){re.escape(suffix)}$"
+        )
+
+        frames = [
+            int(match.group(1))
+            for match in (
+                frame_re.match(os.path.basename(path))
+                for path in glob.iglob(f"{glob.escape(prefix)}[0-9]*{glob.escape(suffix)}")
+            )
+            if match
+        ]
 
-        return (first_frame, last_frame)
+        return (min(frames), max(frames)) if frames else None
 
 
 def main():
+    # Log to the console and to the log file
+    configure_logging()
+
     # Example test paths (replace these with actual paths)
     input_path = "C:/Users/info/Downloads/ezgif-split/ezgif-frame-###.jpg"  # Replace with a valid input media path
     output_path = "C:/Users/info/Downloads/ezgif-split/output.mov"  # Replace with a desired output path
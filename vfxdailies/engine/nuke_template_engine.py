@@ -1,34 +1,54 @@
+import hashlib
 import os
 import logging
-
-from dailies.constant.main import LOG_FORMAT, LOG_FILE_PATH, FRAME_PADDING_FORMAT
+import re
+import subprocess
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+from dailies.constant import main as constant_main
+from dailies.constant.main import FRAME_PADDING_FORMAT
 from dailies.constant.engine import (
     NUKE_READ_NODE,
     NUKE_WRITE_NODE,
     NUKE_FRAME_PADDING_FORMAT,
+    NUKE_RENDER_WORKERS,
+    NUKE_TEMPLATE_CACHE,
 )
+from dailies.engine.video_engine import copy_file
+from dailies.logging_setup import configure_logging
 
 # Set up logger
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
-logging.basicConfig(
-    level=logging.INFO,
-    format=LOG_FORMAT,
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler(LOG_FILE_PATH),
-    ],
-)
 
-# Only import nuke if available
-try:
-    import nuke
+# Frame padding tokens (e.g., "###" or "%03d") and the "<file name> <first>-<last>" entries
+# returned by nuke.getFileNameList for the sequences of a directory
+_PADDING_RE = re.compile(r"#+|%0?\d*d")
+_FILE_NAME_LIST_RE = re.compile(r"^(?P<name>.+) (?P<first>-?\d+)-(?P<last>-?\d+)$")
+
 
-    NukeAvailable = True
-except ImportError:
-    NukeAvailable = False
-    logger.warning("Nuke is not available. Media creation using Nuke cannot proceed.")
+@lru_cache(maxsize=32)
+def _hash_file(file_path, mtime_ns, size):
+    """
+    Returns the SHA-256 digest of a file's content.
+    The modification time and size are part of the cache key, so an edited file is hashed again.
+
+    Args:
+        file_path (str): The file path to hash.
+        mtime_ns (int): The modification time of the file, in nanoseconds.
+        size (int): The size of the file, in bytes.
+
+    Returns:
+        str: The hexadecimal digest.
+    """
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as fp:
+        for chunk in iter(lambda: fp.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
 
 
 def validate_file_path(file_path):
@@ -58,6 +78,8 @@ class NukeTemplateEngine:
     These node names are deterministic and must exist in the template.
     """
 
+    __slots__ = ()
+
     def create_media(self, input_path, output_path, template_path):
         """
         Applies a Nuke template to an image sequence or media file (video or image sequence) and
@@ -72,8 +94,11 @@ class NukeTemplateEngine:
             Errors if the template file, Read1 node, or Write1 node are not found.
             Success or failure during the media creation process.
         """
-        # Check if Nuke is available
-        if not NukeAvailable:
+        # Check if Nuke is available, it is only imported when media is created
+        # so importing this module stays cheap
+        try:
+            import nuke  # noqa: F401
+        except ImportError:
             logger.error("Nuke is not available in this environment!")
             return
 
@@ -88,6 +113,16 @@ class NukeTemplateEngine:
             )
             return
 
+        # Reuse a previous render of the same frames with the same template when possible
+        cache_path = self._get_cache_path(input_path, output_path, template_path)
+        if cache_path and os.path.exists(cache_path):
+            try:
+                copy_file(cache_path, output_path)
+                logger.info(f"Reused cached render {cache_path} for {output_path}")
+                return
+            except OSError as e:
+                logger.warning(f"Failed to copy the cached render {cache_path}: {e}")
+
         logger.info(f"Opening Nuke template: {template_path}")
 
         try:
@@ -95,10 +130,101 @@ class NukeTemplateEngine:
             self._open_template(template_path)
 
             # Proceed with setting up and rendering the media
-            self._setup_and_render(input_path, output_path)
+            rendered = self._setup_and_render(input_path, output_path)
 
         except Exception as e:
             logger.error(f"Error during media creation with template: {e}")
+            return
+
+        if rendered and cache_path and os.path.exists(output_path):
+            self._store_in_cache(output_path, cache_path)
+
+    def _get_cache_path(self, input_path, output_path, template_path):
+        """
+        Returns the path of the cached render for the given input sequence, output format and template.
+
+        The cache key hashes the template content, the input path and the name, size and
+        modification time of every frame, so editing the template or re-rendering any input frame
+        leads to a new key.
+        Only image sequence inputs rendered to a single file output (a movie) are cached.
+
+        Args:
+            input_path (str): Path to the input image sequence.
+            output_path (str): Path to save the rendered output media.
+            template_path (str): Path to the Nuke template.
+
+        Returns:
+            str or None: The cache file path, or None if the render cannot be cached.
+        """
+        if not NUKE_TEMPLATE_CACHE:
+            return None
+
+        # Movie inputs and image sequence outputs are not cached
+        if not _PADDING_RE.search(os.path.basename(input_path)) or _PADDING_RE.search(
+            os.path.basename(output_path)
+        ):
+            return None
+
+        try:
+            frames = self._scan_sequence(input_path, stat_frames=True)
+            if not frames:
+                return None
+
+            template_stat = os.stat(template_path)
+            key = hashlib.sha256()
+            key.update(
+                _hash_file(template_path, template_stat.st_mtime_ns, template_stat.st_size).encode()
+            )
+            key.update(input_path.encode())
+            for _, name, size, mtime_ns in frames:
+                key.update(f"|{name}:{size}:{mtime_ns}".encode())
+        except (OSError, ValueError) as e:
+            logger.warning(f"Render cache disabled for {input_path}: {e}")
+            return None
+
+        extension = os.path.splitext(output_path)[1].lower()
+        return os.path.join(constant_main.DEFAULT_TMP_DIRECTORY, "cache", f"{key.hexdigest()}{extension}")
+
+    def _store_in_cache(self, output_path, cache_path):
+        """
+        Copies a rendered output into the render cache.
+        The file is copied under a temporary name, then renamed, so a partial copy is never reused.
+
+        Args:
+            output_path (str): Path of the rendered output media.
+            cache_path (str): Path of the cache file.
+        """
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            copy_file(output_path, tmp_path)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            logger.warning(f"Failed to store the render in the cache: {e}")
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+    @staticmethod
+    def _get_frame_path(input_path, frame):
+        """
+        Returns the path of a frame of an image sequence.
+
+        Args:
+            input_path (str): Path to the image sequence, with a "###" or "%03d" frame padding.
+            frame (int): The frame number.
+
+        Returns:
+            str: The path of the frame file.
+        """
+
+        def _format_frame(match):
+            token = match.group(0)
+            width = len(token) if token.startswith("#") else int(token[1:-1] or 0)
+            return str(frame).zfill(width)
+
+        return _PADDING_RE.sub(_format_frame, input_path, count=1)
 
     def _open_template(self, template_path):
         """
@@ -107,6 +233,8 @@ class NukeTemplateEngine:
         Args:
             template_path (str): Path to the Nuke template to be opened.
         """
+        import nuke
+
         os.environ["NUKE_NO_UPGRADE"] = "1"
         try:
             logger.info(f"Opening Nuke template: {template_path}")
@@ -123,7 +251,12 @@ class NukeTemplateEngine:
         Args:
             input_path (str): Path to the input media file (image sequence/video).
             output_path (str): Path to save the output media file.
+
+        Returns:
+            bool: True if the media was rendered, None otherwise.
         """
+        import nuke
+
         try:
             # Locate the Read node (input media)
             read_node = nuke.toNode(NUKE_READ_NODE)
@@ -133,9 +266,11 @@ class NukeTemplateEngine:
 
             read_node["file"].setValue(input_path)
 
-            # Manually check the sequence range
-            # Get the first and last frame from the file sequence
-            frame_range = self._get_sequence_range(input_path)
+            # Get the first and last frame from the file sequence, using Nuke's own
+            # (cached) directory listing and only scanning the directory as a fallback
+            frame_range = self._get_nuke_sequence_range(input_path)
+            if not frame_range:
+                frame_range = self._get_sequence_range(input_path)
             if not frame_range:
                 logger.error(f"Failed to detect frame range for sequence: {input_path}")
                 return
@@ -155,45 +290,176 @@ class NukeTemplateEngine:
             write_node["file"].setValue(output_path)
 
             # Execute the render process in Nuke
-            nuke.execute(write_node, first_frame, last_frame)
+            self._render(write_node, first_frame, last_frame, output_path)
             logger.info(f"Media created successfully with template at {output_path}")
+            return True
 
         except Exception as e:
             logger.error(f"Error during media creation with template: {e}")
 
+    def _render(self, write_node, first_frame, last_frame, output_path):
+        """
+        Renders the Write node over the frame range.
+
+        Image sequence outputs (with a frame padding in their path) are split into
+        NUKE_RENDER_WORKERS chunks of frames, rendered in parallel by separate Nuke processes.
+        Movie outputs are always rendered in the current session, as a single file
+        cannot be written by several processes.
+
+        Args:
+            write_node (nuke.Node): The Write node to render.
+            first_frame (int): The first frame to render.
+            last_frame (int): The last frame to render.
+            output_path (str): The output path set on the Write node.
+
+        Raises:
+            subprocess.CalledProcessError: If one of the render processes fails.
+        """
+        import nuke
+
+        workers = min(NUKE_RENDER_WORKERS, last_frame - first_frame + 1)
+        if workers <= 1 or not _PADDING_RE.search(os.path.basename(output_path)):
+            nuke.execute(write_node, first_frame, last_frame)
+            return
+
+        # Split the frame range into contiguous chunks of (almost) the same size
+        frame_count = last_frame - first_frame + 1
+        chunk_size, remainder = divmod(frame_count, workers)
+        chunks = []
+        start = first_frame
+        for i in range(workers):
+            end = start + chunk_size + (1 if i < remainder else 0) - 1
+            chunks.append((start, end))
+            start = end + 1
+
+        with tempfile.TemporaryDirectory() as tmp_directory:
+            # The render processes read the script as set up in this session
+            script_path = os.path.join(tmp_directory, "render.nk")
+            nuke.scriptSaveAs(script_path, overwrite=1)
+
+            logger.info(f"Rendering frames {first_frame}-{last_frame} with {workers} Nuke processes")
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [
+                    executor.submit(
+                        subprocess.run,
+                        [
+                            nuke.EXE_PATH,
+                            "-x",
+                            "-X",
+                            write_node.name(),
+                            "-F",
+                            f"{start}-{end}",
+                            script_path,
+                        ],
+                        check=True,
+                        capture_output=True,
+                    )
+                    for start, end in chunks
+                ]
+                for future in futures:
+                    future.result()
+
+    def _get_nuke_sequence_range(self, input_path):
+        """
+        Helper function to get the frame range of the image sequence from Nuke's sequence detection.
+
+        Args:
+            input_path (str): Path to the input image sequence.
+
+        Returns:
+            tuple: (first_frame, last_frame) if Nuke lists the sequence, None otherwise.
+        """
+        import nuke
+
+        dir_path, file_name = os.path.split(input_path)
+        file_name = _PADDING_RE.sub("#", file_name)
+
+        try:
+            entries = nuke.getFileNameList(dir_path or ".")
+        except Exception as e:
+            logger.warning(f"Failed to list the sequences of {dir_path}: {e}")
+            return None
+
+        for entry in entries or ():
+            match = _FILE_NAME_LIST_RE.match(entry)
+            if match and _PADDING_RE.sub("#", match.group("name")) == file_name:
+                return (int(match.group("first")), int(match.group("last")))
+
+        return None
+
     def _get_sequence_range(self, input_path):
         """
         Helper function to extract the frame range from the image sequence.
+        The sequence directory is listed once, instead of probing each possible frame file.
+
         Args:
             input_path (str): Path to the input image sequence.
+
         Returns:
             tuple: (first_frame, last_frame) if sequence is found, None otherwise.
+
+        Raises:
+            ValueError: If the input path has no frame padding token.
         """
-        if NUKE_FRAME_PADDING_FORMAT in input_path:
-            base_path = input_path.split(NUKE_FRAME_PADDING_FORMAT)[0]
-        if FRAME_PADDING_FORMAT in input_path:
-            base_path = input_path.split(FRAME_PADDING_FORMAT)[0]
+        frames = self._scan_sequence(input_path)
+        if not frames:
+            return None
 
-        first_frame = None
-        last_frame = None
+        return (frames[0][0], frames[-1][0])
 
-        # Check for the first frame (assumes the first frame is 001)
-        for i in range(1, 1000):  # Assuming there are fewer than 1000 frames
-            file_path = (
-                base_path + str(i).zfill(3) + ".jpg"
-            )  # Adjust for your file extension
-            if os.path.exists(file_path):
-                if first_frame is None:
-                    first_frame = i
-            else:
-                if first_frame is not None:
-                    last_frame = i - 1
-                    break
+    def _scan_sequence(self, input_path, stat_frames=False):
+        """
+        Lists the frame files of an image sequence, reading its directory once.
+
+        Args:
+            input_path (str): Path to the input image sequence.
+            stat_frames (bool, optional): Also read the size and modification time of each frame.
 
-        return (first_frame, last_frame)
+        Returns:
+            list: (frame, file name, size, mtime_ns) tuples sorted by frame, the size and
+                modification time are None unless stat_frames is set.
 
+        Raises:
+            ValueError: If the input path has no frame padding token.
+        """
+        if NUKE_FRAME_PADDING_FORMAT in input_path:
+            padding = NUKE_FRAME_PADDING_FORMAT
+        elif FRAME_PADDING_FORMAT in input_path:
+            padding = FRAME_PADDING_FORMAT
+        else:
+            raise ValueError(f"No frame padding found in sequence path: {input_path}")
+
+        dir_path, file_name = os.path.split(input_path)
+        prefix, _, suffix = file_name.partition(padding)
+
+        frames = []
+
+        # Keep the files named <prefix><frame number><suffix> (the suffix holds the extension)
+        with os.scandir(dir_path or ".") as entries:
+            for entry in entries:
+                name = entry.name
+                if len(name) <= len(prefix) + len(suffix):
+                    continue
+                if not (name.startswith(prefix) and name.endswith(suffix)):
+                    continue
+
+                frame = name[len(prefix) : len(name) - len(suffix)]
+                if not frame.isdigit():
+                    continue
+
+                if stat_frames:
+                    frame_stat = entry.stat()
+                    frames.append((int(frame), name, frame_stat.st_size, frame_stat.st_mtime_ns))
+                else:
+                    frames.append((int(frame), name, None, None))
+
+        frames.sort()
+        return frames
 
 def main():
+    # Log to the console and to the log file
+    configure_logging()
+
     # Example test paths (replace these with actual paths)
     input_path = "C:/Users/info/Downloads/ezgif-split/ezgif-frame-###.jpg"  # Replace with a valid input media path
     output_path = "C:/Users/info/Downloads/ezgif-split/output.mov"  # Replace with a desired output path
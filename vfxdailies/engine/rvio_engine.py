@@ -1,35 +1,51 @@
 import logging
 import os
+import shutil
 import subprocess
-
-from dailies.constant.main import DEFAULT_TMP_DIRECTORY, LOG_FORMAT, LOG_FILE_PATH
-from dailies.constant.engine import SUPPORTED_FILE_TYPES, FORMAT_CODECS
-from dailies.engine.video_engine import VideoEngine, generate_slate_text
+import tempfile
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from itertools import chain
+
+from dailies.constant import main as constant_main
+from dailies.constant.engine import SUPPORTED_FILE_TYPE_SETS, FORMAT_CODECS, VFXDAILIES_CONCURRENT
+from dailies.engine.video_engine import (
+    VideoEngine,
+    generate_slate_text,
+    resolve_executable,
+)
+from dailies.logging_setup import configure_logging, stop_logging
 
 # Set up logger
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
-logging.basicConfig(
-    level=logging.INFO,
-    format=LOG_FORMAT,
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler(LOG_FILE_PATH),
-    ],
-)
 
-# Attempt to import RVIO (rv). If not available, log a warning.
-try:
-    import rv  # Assuming `rv` is the RVIO library you are using
+# File types and codecs supported by RVIO, looked up once rather than on every render
+_RVIO_TYPES = SUPPORTED_FILE_TYPE_SETS["rvio"]
+_RVIO_CODECS = FORMAT_CODECS["rvio"]
 
-    RVIOAvailable = True
-except ImportError:
-    rv = None
-    RVIOAvailable = False
-    logger.warning(
-        "RVIO (rv) library not found. Slate frame generation and overlay will be skipped."
-    )
+
+@lru_cache(maxsize=1)
+def get_rv():
+    """
+    Imports the RVIO (rv) library on first use, as it is heavy to load (OpenGL, Qt)
+    and importing this module should stay cheap.
+
+    Returns:
+        module: The rv module, or None if it is not available (a warning is logged once).
+    """
+    try:
+        import rv  # Assuming `rv` is the RVIO library you are using
+
+        return rv
+    except ImportError:
+        logger.warning(
+            "RVIO (rv) library not found. Slate frame generation and overlay will be skipped."
+        )
+        return None
 
 
 def validate_file_path(file_path):
@@ -48,6 +64,59 @@ def validate_file_path(file_path):
     return True
 
 
+def _drain(stream, lines=None):
+    """
+    Reads a subprocess output stream line by line until it is closed, logging each line.
+
+    Args:
+        stream (io.TextIOBase): The stdout or stderr stream of the subprocess.
+        lines (deque, optional): Collects the last lines read, to report them on failure.
+    """
+    for line in stream:
+        line = line.rstrip()
+        logger.debug("rvio: %s", line)
+        if lines is not None:
+            lines.append(line)
+
+
+def run_rvio_command(command):
+    """
+    Runs an RVIO command, logging its output while it runs.
+
+    Both output pipes are drained by background threads, so RVIO never stalls on a full pipe,
+    and the progress of long encodes shows up in the debug log.
+
+    Args:
+        command (list): The RVIO command as a list of arguments.
+
+    Raises:
+        subprocess.CalledProcessError: If RVIO exits with a non-zero code, with the last
+            lines of its error output in `stderr`.
+    """
+    stderr_lines = deque(maxlen=50)
+    with subprocess.Popen(
+        command,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        bufsize=1,
+    ) as process:
+        drains = [
+            threading.Thread(target=_drain, args=(process.stdout,), daemon=True),
+            threading.Thread(target=_drain, args=(process.stderr, stderr_lines), daemon=True),
+        ]
+        for drain in drains:
+            drain.start()
+        return_code = process.wait()
+        for drain in drains:
+            drain.join()
+
+    if return_code:
+        raise subprocess.CalledProcessError(
+            return_code, command, stderr="\n".join(stderr_lines)
+        )
+
+
 class RVIOEngine(VideoEngine):
     """
     Media engine implementation using RVIO for creating media files (video, image sequences) and slate generation.
@@ -56,6 +125,8 @@ class RVIOEngine(VideoEngine):
     and it supports the generation and overlay of slate frames onto media.
     """
 
+    __slots__ = ()
+
     def create_media(
         self,
         input_path,
@@ -65,6 +136,7 @@ class RVIOEngine(VideoEngine):
         fps=None,
         options=None,
         slate_data=None,
+        fast_exec=False,
     ):
         """
         Creates a media file (video or image sequence) from input using RVIO.
@@ -77,35 +149,86 @@ class RVIOEngine(VideoEngine):
             fps (int, optional): Frames per second for the output media (used for videos).
             options (dict, optional): Additional options such as encoding or compression settings.
             slate_data (dict, optional): Data for generating a slate frame (if applicable).
+            fast_exec (bool, optional): Replace the Python process with RVIO instead of running it
+                as a subprocess, when there is no slate to clean up afterwards (POSIX only).
+                Meant for command-line wrappers with nothing left to do, as this call then never
+                returns and the exit code is the one of RVIO.
+
+        Returns:
+            bool: True if the media was created, None otherwise.
         """
         # Validate input file path
         if not validate_file_path(input_path):
             return
 
-        if not RVIOAvailable:
+        if get_rv() is None:
             logger.error("RVIO is not available, cannot proceed with media creation.")
             return
 
-        if extension not in SUPPORTED_FILE_TYPES["rvio"]:
+        if extension not in _RVIO_TYPES:
             logger.error(f"Unsupported file extension for RVIO: {extension}")
             return
 
         # Get codec for the given file extension
-        codec = FORMAT_CODECS["rvio"][extension]
+        codec = _RVIO_CODECS[extension]
+
+        if not slate_data:
+            return self._run_rvio(
+                input_path, output_path, resolution, codec, fps, options, fast_exec=fast_exec
+            )
 
-        # Generate the slate frame if slate data is provided
-        slate_file = None
-        if slate_data:
-            slate_file = self.generate_slate_frame(slate_data, resolution, extension)
+        # The slate is written to its own temporary directory, removed with the slate once the
+        # media is encoded, so concurrent renders (see create_media_batch) never share a slate file
+        with tempfile.TemporaryDirectory(
+            prefix="vfxdailies_slate_", dir=constant_main.DEFAULT_TMP_DIRECTORY
+        ) as slate_directory:
+            slate_file = self.generate_slate_frame(
+                slate_data, resolution, extension, slate_directory
+            )
             if not slate_file:
                 logger.error("Failed to generate slate frame. Aborting media creation.")
                 return
 
-        # Handle the media creation based on the input (video or image sequence)
-        rvio_command = [
-            "rvio",
+            return self._run_rvio(
+                input_path, output_path, resolution, codec, fps, options, slate_file
+            )
+
+    def _run_rvio(
+        self,
+        input_path,
+        output_path,
+        resolution,
+        codec,
+        fps,
+        options,
+        slate_file=None,
+        fast_exec=False,
+    ):
+        """
+        Builds and runs the RVIO command creating the media file.
+
+        Args:
+            input_path (str): Path to the input image sequence, video file, or other media source.
+            output_path (str): Path to save the output media file.
+            resolution (tuple): Resolution of the output media in the form (width, height).
+            codec (str): The RVIO codec of the output media.
+            fps (int): Frames per second for the output media.
+            options (dict): Additional options such as encoding or compression settings.
+            slate_file (str, optional): Path to the slate frame to insert before the media.
+            fast_exec (bool, optional): Replace the Python process with RVIO (see create_media).
+
+        Returns:
+            bool: True if the media was created, None otherwise.
+        """
+        # Handle the media creation based on the input (video or image sequence).
+        # The slate is passed as the first input, so RVIO concatenates it in front of the media
+        # in the same encode, instead of re-encoding the media a second time to add it.
+        rvio_command = [resolve_executable("rvio")]
+        if slate_file:
+            rvio_command.extend(["--input", slate_file])
+        rvio_command.extend([
             "--input",
-            os.path.join(input_path),
+            input_path,
             "--output",
             output_path,
             "--codec",
@@ -114,57 +237,110 @@ class RVIOEngine(VideoEngine):
             str(fps),
             "--resolution",
             f"{resolution[0]}x{resolution[1]}",
-        ]
+        ])
 
         # Add any additional options to the RVIO command
+        # (flags without a value, e.g. {"verbose": None}, are passed alone)
         if options:
-            for key, value in options.items():
-                rvio_command.append(f"--{key}")
-                if value is not None:
-                    rvio_command.append(str(value))
+            rvio_command.extend(
+                chain.from_iterable(
+                    (f"--{key}",) if value is None else (f"--{key}", str(value))
+                    for key, value in options.items()
+                )
+            )
+
+        # Nothing is left to do once RVIO is done, so the interpreter is replaced by RVIO rather
+        # than forking a copy of it first. Skipped if rvio cannot be found, so the error is logged.
+        if (
+            fast_exec
+            and not slate_file
+            and os.name == "posix"
+            and shutil.which(rvio_command[0])
+        ):
+            logger.info(f"Replacing the process with RVIO to create {output_path}")
+            stop_logging()
+            os.execvp(rvio_command[0], rvio_command)
 
         # Run the RVIO command to create the media file
         try:
-            subprocess.run(rvio_command, check=True)
+            run_rvio_command(rvio_command)
             logger.info(f"Media created successfully using RVIO at {output_path}")
-
-            # If slate was generated, overlay it on the media
-            if slate_file:
-                self.add_slate_to_media(slate_file, output_path, output_path)
-                # Clean up slate file after adding it
-                if os.path.exists(slate_file):
-                    os.remove(slate_file)
-                    logger.info(f"Slate file {slate_file} has been deleted.")
-            else:
-                logger.info("No slate to add, media created successfully.")
+            return True
 
         except subprocess.CalledProcessError as e:
             logger.error(f"Error during media creation with RVIO: {e}")
+            logger.error(f"Error Output:\n{e.stderr}")
         except Exception as e:
             logger.error(f"Unexpected error: {e}")
 
-    def generate_slate_frame(self, data, resolution, extension):
+    def create_media_batch(self, jobs, max_workers=None):
+        """
+        Creates several media files, running up to max_workers RVIO processes at the same time.
+        Each job is rendered exactly like a create_media call (slate included), and a failing job
+        does not stop the others.
+
+        Args:
+            jobs (list): The create_media keyword arguments of each media (input_path, output_path,
+                resolution, extension and optionally fps, options and slate_data).
+            max_workers (int, optional): Maximum number of concurrent RVIO processes.
+                Defaults to VFXDAILIES_CONCURRENT.
+
+        Returns:
+            list: For each job, in order, True if its media was created, False otherwise.
+        """
+        results = [False] * len(jobs)
+        if not jobs:
+            return results
+
+        # The jobs mostly wait on their rvio subprocess, so threads are enough to overlap them
+        max_workers = min(max_workers or VFXDAILIES_CONCURRENT, len(jobs))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self.create_media, **job): index
+                for index, job in enumerate(jobs)
+            }
+            for future in as_completed(futures):
+                index = futures[future]
+                try:
+                    results[index] = bool(future.result())
+                except Exception as e:
+                    logger.error(f"Error during batch media creation with RVIO: {e}")
+                if not results[index]:
+                    logger.error(f"Failed to create {jobs[index].get('output_path')}")
+
+        logger.info(f"Created {sum(results)} of {len(jobs)} media using RVIO")
+        return results
+
+    def generate_slate_frame(self, data, resolution, extension=None, output_directory=None):
         """
         Generate a slate frame (e.g., for videos or image sequences) based on the provided data.
         The slate will always be a single frame.
 
+        The slate is only white text on black, so it is always written as an 8-bit PNG, whatever
+        the output format: a half-float EXR would be several times larger to write and read back.
+
         Args:
             data (dict): Data for creating the slate (e.g., text, color, resolution, position).
             resolution (tuple): The resolution to generate the slate at (width, height).
-            extension (str): The desired output extension (e.g., "exr", "png", "jpg").
+            extension (str, optional): The output extension of the media (e.g., "exr", "mov"),
+                it does not change the slate format.
+            output_directory (str, optional): Directory to write the slate to.
+                Defaults to DEFAULT_TMP_DIRECTORY.
+
+        Returns:
+            str: The path of the slate frame, or None if it could not be created.
         """
-        if not RVIOAvailable:
+        rv = get_rv()
+        if rv is None:
             logger.warning("RVIO is not available. Skipping slate frame creation.")
             return None
 
         width, height = resolution
-        slate_format = (
-            extension.lower() if extension in ["jpg", "png", "exr"] else "exr"
-        )  # Default to EXR for unrecognized formats
+        slate_format = "png"
 
         try:
             slate_file = os.path.join(
-                DEFAULT_TMP_DIRECTORY, f"generated_slate.{slate_format}"
+                output_directory or constant_main.DEFAULT_TMP_DIRECTORY, f"generated_slate.{slate_format}"
             )
             slate_image = rv.createImage(
                 width, height, rv.Color(0, 0, 0)
@@ -185,45 +361,11 @@ class RVIOEngine(VideoEngine):
             logger.error(f"Error creating slate frame: {e}")
             return None
 
-    def add_slate_to_media(self, slate_file, media_file, output_file):
-        """
-        Add a slate (e.g., for videos or image sequences) to a media file.
-        The slate is always applied as a single frame at the beginning.
-
-        Args:
-            slate_file (str): Path to the slate frame image.
-            media_file (str): Path to the input media file (video or image sequence).
-            output_file (str): Path to save the output media with slate added.
-        """
-        if not RVIOAvailable:
-            logger.warning("RVIO is not available. Skipping slate addition to media.")
-            return
-
-        try:
-            media = rv.loadFile(media_file)  # Load the media file
-            slate = rv.loadFile(slate_file)  # Load the slate image
-
-            if media.type() == "video":
-                # If the media is a video, we add the slate as the first frame
-                media.addFrames(
-                    slate, position=0
-                )  # Insert slate at the beginning of the video
-                media.write(output_file)  # Write the modified video to the output file
-            else:
-                # For image sequences, we need to prepend the slate frame
-                media.addFrames(
-                    slate, position=0
-                )  # Insert slate as the first frame in the sequence
-                media.write(
-                    output_file
-                )  # Write the modified image sequence to the output file
-
-            logger.info(f"Media with slate saved to {output_file}")
-        except Exception as e:
-            logger.error(f"Error adding slate to media: {e}")
-
 
 def main():
+    # Log to the console and to the log file
+    configure_logging()
+
     # Example test paths (replace these with actual paths)
     input_path = "path/to/your/input_media.mov"  # Replace with a valid input media path
     output_path = "path/to/your/output_media.mov"  # Replace with a desired output path
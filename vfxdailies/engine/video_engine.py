@@ -1,8 +1,58 @@
-from abc import ABC, abstractmethod
+import os
+import shutil
+from collections import defaultdict
+from functools import lru_cache
 
 from dailies.constant.main import DEFAULT_SLATE_TEMPLATE
 
 
+# CopyFileExW flag bypassing the system cache, large media is not read again after the copy
+_COPY_FILE_NO_BUFFERING = 0x00001000
+
+
+def copy_file(source_path, destination_path):
+    """
+    Copies a (possibly large) media file, without going through a Python-level buffer.
+
+    shutil.copyfile already copies in the kernel on Linux (sendfile) and macOS (fcopyfile).
+    On Windows, the file is copied with CopyFileExW and unbuffered I/O, falling back to
+    shutil.copyfile if the call fails.
+
+    Args:
+        source_path (str): Path of the file to copy.
+        destination_path (str): Path of the copy, replaced if it exists.
+
+    Raises:
+        OSError: If the file cannot be copied.
+    """
+    if os.name == "nt":
+        import ctypes
+
+        copy_file_ex = ctypes.windll.kernel32.CopyFileExW
+        if copy_file_ex(
+            str(source_path), str(destination_path), None, None, None, _COPY_FILE_NO_BUFFERING
+        ):
+            return
+
+    shutil.copyfile(source_path, destination_path)
+
+
+@lru_cache(maxsize=None)
+def resolve_executable(name):
+    """
+    Resolves the full path of an executable (e.g., "ffmpeg" or "rvio") from the PATH.
+    The PATH lookup stats every PATH entry, so the result is cached for the lifetime of the process.
+
+    Args:
+        name (str): The name of the executable.
+
+    Returns:
+        str: The full path of the executable, or the name itself if it is not found on the PATH
+             (running it then fails with the usual error).
+    """
+    return shutil.which(name) or name
+
+
 def generate_slate_text(data, template=DEFAULT_SLATE_TEMPLATE):
     """
     Generates a formatted string containing slate text using the provided data and template.
@@ -14,28 +64,21 @@ def generate_slate_text(data, template=DEFAULT_SLATE_TEMPLATE):
     Returns:
         str: A formatted string representing the slate text with relevant information.
     """
-    return template.format(
-        file=data.get("file", ""),
-        version=data.get("version", ""),
-        description=data.get("description", ""),
-        artist=data.get("artist", ""),
-        link=data.get("link", ""),
-        task=data.get("task", ""),
-        project=data.get("project", ""),
-        resolution=data.get("resolution", ""),
-        fps=data.get("fps", ""),
-    )
+    # Missing values are left empty
+    return template.format_map(defaultdict(str, data))
 
 
-class VideoEngine(ABC):
+class VideoEngine:
     """
-    Abstract base class for media engines, defining the interface for creating media files
+    Base class for media engines, defining the interface for creating media files
     from various input formats, such as image sequences, videos, or other media types.
 
-    This class should be inherited by specific media engine implementations, such as RVIO, FFmpeg, or Nuke.
+    This class should be inherited by specific media engine implementations, such as RVIO, FFmpeg, or Nuke,
+    which must implement `create_media`. The engines are stateless, so they declare empty slots.
     """
 
-    @abstractmethod
+    __slots__ = ()
+
     def create_media(
         self,
         input_path,
@@ -47,7 +90,7 @@ class VideoEngine(ABC):
         slate_data=None,
     ):
         """
-        Abstract method for creating a media file (video or image sequence) from an input source.
+        Creates a media file (video or image sequence) from an input source.
 
         Args:
             input_path (str): Path to the input media (image sequence, video file, etc.).
@@ -58,4 +101,4 @@ class VideoEngine(ABC):
             options (dict, optional): Additional options for media creation (e.g., compression, format-specific settings).
             slate_data (dict, optional): Data for generating a slate (if applicable). This is relevant for media formats like video.
         """
-        pass
+        raise NotImplementedError
@@ -1,22 +1,12 @@
-import os
 import logging
 
-from dailies.constant.main import ENV_VAR_CONFIG, LOG_FILE_PATH, LOG_FORMAT
-from dailies.constant.tracking import TRACKING_ENGINE
+from dailies.constant.main import get_env_config
+from dailies.constant.tracking import get_tracking_config
 
 # Set up logging
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
-logging.basicConfig(
-    level=logging.INFO,
-    format=LOG_FORMAT,
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler(LOG_FILE_PATH),
-    ],
-)
-
 
 class Environment:
     """
@@ -39,6 +29,11 @@ class Environment:
 
     VALID_ENTITY_TYPES = {"shot", "sequence", "asset"}
 
+    # Project and entity IDs do not change during a run, so they are shared across
+    # instances to avoid a round-trip to the tracking software for every new Environment
+    _project_id_cache = {}
+    _entity_id_cache = {}
+
     def __init__(
         self,
         project_name: str = None,
@@ -57,16 +52,16 @@ class Environment:
         :param task_name: Optional task name to override environment variable.
         :param artist_name: Optional artist name to override environment variable.
         """
-        self.project_name = project_name or os.getenv(ENV_VAR_CONFIG["project"])
-        self.entity_name = entity_name or os.getenv(ENV_VAR_CONFIG["entity_name"])
-        self.task_name = task_name or os.getenv(ENV_VAR_CONFIG["task_name"])
-        self.artist_name = artist_name or os.getenv(ENV_VAR_CONFIG["artist_name"])
+        env = get_env_config()
 
-        self.project_id = os.getenv(ENV_VAR_CONFIG["project_id"])
-        self.entity_id = os.getenv(ENV_VAR_CONFIG["entity_id"])
-        self.entity_type = (
-            entity_type or os.getenv(ENV_VAR_CONFIG["entity_type"], "shot")
-        ).lower()
+        self.project_name = project_name or env.project
+        self.entity_name = entity_name or env.entity_name
+        self.task_name = task_name or env.task_name
+        self.artist_name = artist_name or env.artist_name
+
+        self.project_id = env.project_id
+        self.entity_id = env.entity_id
+        self.entity_type = (entity_type or env.entity_type or "shot").lower()
 
         if self.entity_type not in self.VALID_ENTITY_TYPES:
             raise ValueError(
@@ -74,32 +69,14 @@ class Environment:
                 f"{', '.join(self.VALID_ENTITY_TYPES)}"
             )
 
-        self.task_id = os.getenv(ENV_VAR_CONFIG["task_id"])
-        self.artist_id = os.getenv(ENV_VAR_CONFIG["artist_id"])
+        self.task_id = env.task_id
+        self.artist_id = env.artist_id
 
         # Lazy-loaded tracking software
         self._tracking_software = None
 
         # Auto-fetch IDs if not set
-        if not self.project_id and self.project_name:
-            self.project_id = self.fetch_project_id()
-            if not self.tracking_software.project_id:
-                self.tracking_software.project_id = self.project_id
-
-        if not self.entity_id and self.entity_name and self.entity_type:
-            self.entity_id = self.fetch_entity_id()
-            if not self.tracking_software.entity_id:
-                self.tracking_software.entity_id = self.entity_id
-
-        if not self.task_id and self.entity_name:
-            self.task_id = self.fetch_task_id()
-            if not self.tracking_software.task_id:
-                self.tracking_software.task_id = self.task_id
-
-        if not self.artist_id and self.artist_name:
-            self.artist_id = self.fetch_artist_id()
-            if not self.tracking_software.artist_id:
-                self.tracking_software.artist_id = self.artist_id
+        self._fetch_missing_ids()
 
     @property
     def tracking_software(self):
@@ -113,7 +90,7 @@ class Environment:
             from dailies.factory import TrackingSoftwareFactory
 
             self._tracking_software = TrackingSoftwareFactory.get_tracking_software(
-                TRACKING_ENGINE
+                get_tracking_config().engine
             )
         return self._tracking_software
 
@@ -133,7 +110,13 @@ class Environment:
         :return: The project ID, or None if not available.
         """
         if not self.project_id and self.project_name:
-            self.project_id = self.tracking_software.get_project_id(self.project_name)
+            key = (get_tracking_config().engine, self.project_name)
+            project_id = self._project_id_cache.get(key)
+            if project_id is None:
+                project_id = self.tracking_software.get_project_id(self.project_name)
+                if project_id is not None:
+                    self._project_id_cache[key] = project_id
+            self.project_id = project_id
         return self.project_id
 
     def fetch_entity_id(self):
@@ -144,11 +127,33 @@ class Environment:
         :return: The entity ID, or None if not available.
         """
         if not self.entity_id and self.entity_name and self.entity_type:
-            self.entity_id = self.tracking_software.get_entity_id(
-                self.entity_name, self.entity_type
+            key = (
+                get_tracking_config().engine,
+                self.project_name,
+                self.entity_name,
+                self.entity_type,
             )
+            entity_id = self._entity_id_cache.get(key)
+            if entity_id is None:
+                entity_id = self.tracking_software.get_entity_id(
+                    self.entity_name, self.entity_type
+                )
+                if entity_id is not None:
+                    self._entity_id_cache[key] = entity_id
+            self.entity_id = entity_id
         return self.entity_id
 
+    @classmethod
+    def invalidate(cls):
+        """
+        Clears the project and entity IDs cached across Environment instances,
+        e.g., after an entity has been renamed or recreated in the tracking software,
+        and the environment variables read by `get_env_config`.
+        """
+        get_env_config.cache_clear()
+        cls._project_id_cache.clear()
+        cls._entity_id_cache.clear()
+
     def fetch_task_id(self):
         """
         Retrieves the task ID based on the task name and project ID from the tracking software.
@@ -171,6 +176,81 @@ class Environment:
             self.artist_id = self.tracking_software.get_artist_id(self.artist_name)
         return self.artist_id
 
+    def _fetch_missing_ids(self):
+        """
+        Fetches the IDs that are not set yet, and sets them on the tracking software as well,
+        as its entity lookups are made in its own project.
+        The IDs are fetched in order, the entity lookup depending on the project
+        and the task lookup on the entity.
+        """
+        for id_attribute, fetch in (
+            ("project_id", self.fetch_project_id),
+            ("entity_id", self.fetch_entity_id),
+            ("task_id", self.fetch_task_id),
+            ("artist_id", self.fetch_artist_id),
+        ):
+            if getattr(self, id_attribute):
+                continue
+            value = fetch()
+            if value and not getattr(self.tracking_software, id_attribute):
+                setattr(self.tracking_software, id_attribute, value)
+
+    def update(
+        self,
+        project_name: str = None,
+        entity_name: str = None,
+        task_name: str = None,
+        artist_name: str = None,
+    ):
+        """
+        Updates the names of the environment (e.g., after they were edited in the UI).
+        Only the IDs depending on a changed name are looked up again, they are cleared on the
+        tracking software as well, so e.g. the entity is looked up in the new project.
+
+        :param project_name: Optional new project name.
+        :param entity_name: Optional new entity name.
+        :param task_name: Optional new task name.
+        :param artist_name: Optional new artist name.
+        :return: True if a name changed, False otherwise.
+        """
+        changed = False
+        for name_attribute, value, id_attributes in (
+            ("project_name", project_name, ("project_id", "entity_id", "task_id")),
+            ("entity_name", entity_name, ("entity_id", "task_id")),
+            ("task_name", task_name, ("task_id",)),
+            ("artist_name", artist_name, ("artist_id",)),
+        ):
+            if not value or value == getattr(self, name_attribute):
+                continue
+
+            setattr(self, name_attribute, value)
+            if self._tracking_software is not None:
+                setattr(self._tracking_software, name_attribute, value)
+            for id_attribute in id_attributes:
+                setattr(self, id_attribute, None)
+                if self._tracking_software is not None:
+                    setattr(self._tracking_software, id_attribute, None)
+            changed = True
+
+        if changed:
+            self._fetch_missing_ids()
+        return changed
+
+    def fetch_ids(self):
+        """
+        Retrieves the project, entity, task and artist IDs from the tracking software.
+        The lookups run in order, as the entity lookup depends on the project,
+        and the task lookup on the entity.
+
+        :return: A (project_id, entity_id, task_id, artist_id) tuple, with None for the unavailable IDs.
+        """
+        return (
+            self.fetch_project_id(),
+            self.fetch_entity_id(),
+            self.fetch_task_id(),
+            self.fetch_artist_id(),
+        )
+
     def log_configuration(self):
         """
         Logs the current environment configuration using the logging module.
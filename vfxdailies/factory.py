@@ -1,7 +1,7 @@
 import importlib
 import logging
+from functools import lru_cache
 
-from dailies.constant.main import LOG_FORMAT, LOG_FILE_PATH
 from dailies.constant.engine import ENGINE_CLASSES
 from dailies.constant.tracking import TRACKING_SOFTWARE_CLASSES
 from dailies.environment import Environment
@@ -10,14 +10,37 @@ from dailies.environment import Environment
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
-logging.basicConfig(
-    level=logging.INFO,
-    format=LOG_FORMAT,
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler(LOG_FILE_PATH),
-    ],
-)
+
+@lru_cache(maxsize=None)
+def _resolve(class_path: str):
+    """
+    Imports and returns the class at the given path. The resolved classes are cached,
+    so the import and attribute lookups only run the first time a class is requested.
+
+    :param class_path: Full path of the class, in 'module.class' format.
+    :return: The class object.
+    :raises ValueError: If the path is invalid or the class cannot be imported.
+    """
+    # Attempt to split the full class path into module and class
+    if "." not in class_path:
+        logger.error(
+            f"Invalid class name: {class_path}. Expected 'module.class' format."
+        )
+        raise ValueError(
+            f"Invalid class name: {class_path}. Expected 'module.class' format."
+        )
+
+    module_name, class_name = class_path.rsplit(".", 1)
+    try:
+        logger.debug("Importing module: %s", module_name)
+        module = importlib.import_module(module_name)
+        resolved_class = getattr(module, class_name)
+        logger.debug("Successfully imported %s from %s", class_name, module_name)
+    except (ImportError, AttributeError) as e:
+        logger.error(f"Error importing class {class_path}: {e}")
+        raise ValueError(f"Error importing class {class_path}: {e}")
+
+    return resolved_class
 
 
 class VideoEngineFactory:
@@ -33,7 +56,7 @@ class VideoEngineFactory:
         :param engine_name: 'ffmpeg', 'rvio', 'nuke', 'nuke-template', or potentially more.
         :return: An instance of the correct video engine.
         """
-        logger.info(f"Requesting video engine for: {engine_name}")
+        logger.debug("Requesting video engine for: %s", engine_name)
 
         engine_class_name = ENGINE_CLASSES.get(engine_name)
 
@@ -41,28 +64,10 @@ class VideoEngineFactory:
             logger.error(f"Unsupported engine type: {engine_name}")
             raise ValueError(f"Unsupported engine type: {engine_name}")
 
-        # Dynamically import the module that contains the engine class
-        try:
-            # Attempt to split the full class path into module and class
-            if "." not in engine_class_name:
-                logger.error(
-                    f"Invalid engine class name: {engine_class_name}. Expected 'module.class' format."
-                )
-                raise ValueError(
-                    f"Invalid engine class name: {engine_class_name}. Expected 'module.class' format."
-                )
-
-            module_name, class_name = engine_class_name.rsplit(".", 1)
-            logger.info(f"Importing module: {module_name}")
-            module = importlib.import_module(module_name)
-            engine_class = getattr(module, class_name)
-            logger.info(f"Successfully imported {class_name} from {module_name}")
-
-        except (ValueError, ImportError, AttributeError) as e:
-            logger.error(f"Error importing class {engine_class_name}: {e}")
-            raise ValueError(f"Error importing class {engine_class_name}: {e}")
-
-        logger.info(f"Returning instance of {engine_class_name}")
+        # Dynamically import the module that contains the engine class (once per class)
+        engine_class = _resolve(engine_class_name)
+
+        logger.debug("Returning instance of %s", engine_class_name)
         return engine_class()  # Instantiate and return the video engine
 
 
@@ -82,7 +87,7 @@ class TrackingSoftwareFactory:
         :param environment: An optional Environment object. If not provided, a new one will be created.
         :return: An instance of the correct tracking software.
         """
-        logger.info(f"Requesting tracking software for: {tracking_software_name}")
+        logger.debug("Requesting tracking software for: %s", tracking_software_name)
 
         tracking_class_name = TRACKING_SOFTWARE_CLASSES.get(tracking_software_name)
 
@@ -90,35 +95,22 @@ class TrackingSoftwareFactory:
             logger.error(f"Unsupported tracking software: {tracking_software_name}")
             raise ValueError(f"Unsupported tracking software: {tracking_software_name}")
 
-        # Dynamically import the module that contains the tracking software class
-        try:
-            if "." not in tracking_class_name:
-                logger.error(
-                    f"Invalid tracking software class name: {tracking_class_name}. Expected 'module.class' format."
-                )
-                raise ValueError(
-                    f"Invalid tracking software class name: {tracking_class_name}. Expected 'module.class' format."
-                )
-
-            module_name, class_name = tracking_class_name.rsplit(".", 1)
-            logger.info(f"Importing module: {module_name}")
-            module = importlib.import_module(module_name)
-            tracking_class = getattr(module, class_name)
-            logger.info(f"Successfully imported {class_name} from {module_name}")
-
-        except (ValueError, ImportError, AttributeError) as e:
-            logger.error(f"Error importing class {tracking_class_name}: {e}")
-            raise ValueError(f"Error importing class {tracking_class_name}: {e}")
+        # Dynamically import the module that contains the tracking software class (once per class)
+        tracking_class = _resolve(tracking_class_name)
 
         # Use provided Environment or create one
         env = environment or Environment()
 
-        logger.info(f"Returning instance of {tracking_class_name} with Environment")
+        logger.debug("Returning instance of %s with Environment", tracking_class_name)
         return tracking_class(env)
 
 
 # Example usage
 if __name__ == "__main__":
+    from dailies.logging_setup import configure_logging
+
+    configure_logging()
+
     # Test video engine
     video_engine_name = "nuke"  # Example: "ffmpeg", "rvio", "nuke", "nuke-template"
     logger.info(f"Testing with video engine: {video_engine_name}")
@@ -0,0 +1,66 @@
+import atexit
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+from dailies.constant.main import LOG_FORMAT, LOG_FILE_PATH
+
+# Rotate the log file once it reaches 10 MB, keeping the last 3 files
+LOG_FILE_MAX_BYTES = 10_000_000
+LOG_FILE_BACKUP_COUNT = 3
+
+# The listener writing the queued records, once configure_logging has run
+_listener = None
+
+
+def configure_logging():
+    """
+    Configures the root logger to log to the console and to the log file.
+
+    The records are only put on a queue by the calling thread (e.g., the Qt GUI thread),
+    a background listener thread writes them to the actual handlers, so slow log storage
+    never blocks the UI.
+
+    This should be called once by the application entry points. It does nothing if the
+    root logger already has handlers (e.g., when the tool runs inside a DCC application).
+    """
+    global _listener
+
+    root_logger = logging.getLogger()
+    if root_logger.handlers:
+        return
+
+    formatter = logging.Formatter(LOG_FORMAT)
+
+    stream_handler = logging.StreamHandler()  # Log to the console
+    stream_handler.setFormatter(formatter)
+
+    # Log to a file for persistence
+    file_handler = RotatingFileHandler(
+        LOG_FILE_PATH, maxBytes=LOG_FILE_MAX_BYTES, backupCount=LOG_FILE_BACKUP_COUNT
+    )
+    file_handler.setFormatter(formatter)
+
+    log_queue = queue.Queue(-1)
+    _listener = QueueListener(log_queue, stream_handler, file_handler)
+    _listener.start()
+
+    # Flush the pending records when the interpreter exits
+    atexit.register(stop_logging)
+
+    root_logger.setLevel(logging.INFO)
+    root_logger.addHandler(QueueHandler(log_queue))
+
+
+def stop_logging():
+    """
+    Writes the pending records and stops the listener thread started by configure_logging.
+
+    This runs automatically when the interpreter exits, but it must be called explicitly
+    before replacing the process (e.g., with os.execvp), as the exit handlers are then skipped.
+    """
+    global _listener
+
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
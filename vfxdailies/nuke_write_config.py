@@ -1,27 +1,15 @@
 import logging
 
-from abc import ABC, abstractmethod
-
-from dailies.constant.main import LOG_FORMAT, LOG_FILE_PATH
-
 # Set up logger
 logger = logging.getLogger(__name__)
-logging.basicConfig(
-    level=logging.INFO,  # Set the default logger level to INFO
-    format=LOG_FORMAT,
-    handlers=[
-        logging.StreamHandler(),  # Log to the console
-        logging.FileHandler(LOG_FILE_PATH),
-    ],
-)
 
 
-class WriteNodeConfigurator(ABC):
+class WriteNodeConfigurator:
     """
     Base class for configuring write nodes for different file types.
+    Subclasses must implement `configure`.
     """
 
-    @abstractmethod
     def configure(self, write_node, frame_rate=None, **kwargs):
         """
         Configure the write node with the given parameters and any additional options in kwargs.
@@ -30,7 +18,7 @@ class WriteNodeConfigurator(ABC):
         :param frame_rate: The frame rate for the video (if applicable).
         :param kwargs: Additional parameters for the write node.
         """
-        pass
+        raise NotImplementedError
 
     def apply_kwargs(self, write_node, kwargs):
         """
@@ -42,7 +30,7 @@ class WriteNodeConfigurator(ABC):
         for key, value in kwargs.items():
             if key in write_node.knobs():
                 # Log the type of the value before setting
-                logging.info(f"Setting knob: {key} with value: {value}")
+                logger.info(f"Setting knob: {key} with value: {value}")
                 print(f"Setting knob: {key} with value: {value}")
 
                 # If the value is a string and contains a number, convert it to an integer
@@ -56,13 +44,13 @@ class WriteNodeConfigurator(ABC):
                     knob = write_node[key]
                     knob.setValue(value)
                 except Exception as e:
-                    logging.error(
+                    logger.error(
                         f"Error applying '{key}' with value '{value}' to write node: {e}"
                     )
                     continue  # Continue processing other kwargs even if one fails
 
             else:
-                logging.warning(
+                logger.warning(
                     f"Unknown key '{key}' for {write_node['file_type'].getValue()} write node configuration."
                 )
 
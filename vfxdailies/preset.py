@@ -1,47 +1,130 @@
+import copy
 import json
 import os
 import logging
 
-from dailies.constant.main import LOG_FORMAT, LOG_FILE_PATH, DEFAULT_PRESET_DIRECTORY
+from dailies.constant.main import (
+    DEFAULT_PRESET_DIRECTORY,
+    PRESET_BUNDLE_FILENAME,
+)
 
 # Set up logging
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
-logging.basicConfig(
-    level=logging.INFO,
-    format=LOG_FORMAT,
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler(LOG_FILE_PATH),
-    ],
-)
+
+# orjson is optional, it only speeds up decoding of the preset bundle
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# Presets already loaded in this process, keyed by folder, along with the preset files they were
+# loaded from. A DCC session keeps the module loaded, so edited presets must still be picked up.
+_PRESETS_CACHE = {}
+
+
+def _scan_preset_files(folder_path):
+    """
+    Lists the preset JSON files of a folder along with their modification times.
+
+    :param folder_path: Path to the folder containing preset JSON files.
+    :return: Dictionary mapping each preset filename to its modification time in nanoseconds.
+    """
+    with os.scandir(folder_path) as entries:
+        return {
+            entry.name: entry.stat().st_mtime_ns
+            for entry in entries
+            if entry.name.endswith(".json") and entry.is_file()
+        }
+
+
+def _read_bundle(bundle_path, sources):
+    """
+    Reads the preset bundle if it is up to date with the preset files.
+
+    :param bundle_path: Path to the preset bundle file.
+    :param sources: Dictionary mapping the current preset filenames to their modification times.
+    :return: Dictionary of presets, or None if the bundle is missing, invalid or stale.
+    """
+    try:
+        with open(bundle_path, "rb") as file:
+            content = file.read()
+        bundle = orjson.loads(content) if ORJSON_AVAILABLE else json.loads(content)
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(bundle, dict) or bundle.get("sources") != sources:
+        return None
+    return bundle.get("presets")
+
+
+def _write_bundle(bundle_path, sources, presets):
+    """
+    Writes the preset bundle. Failures are ignored (e.g., read-only preset folder),
+    the presets are then simply loaded from the individual files next time.
+
+    :param bundle_path: Path to the preset bundle file.
+    :param sources: Dictionary mapping the preset filenames to their modification times.
+    :param presets: Dictionary containing the preset configurations, keyed by preset name.
+    """
+    tmp_path = f"{bundle_path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "w") as file:
+            json.dump({"sources": sources, "presets": presets}, file)
+        os.replace(tmp_path, bundle_path)
+    except OSError as e:
+        logger.debug("Could not write preset bundle %s: %s", bundle_path, e)
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
 
 
 def load_presets_from_folder(folder_path=DEFAULT_PRESET_DIRECTORY):
     """
     Loads all preset data from JSON files in the given folder.
 
+    The presets are read from a single bundle file when it is up to date with the preset
+    files, otherwise each JSON file is loaded and the bundle is rebuilt. The result is
+    kept in memory per folder, and reused as long as no preset file is added, removed or modified.
+
     :param folder_path: Path to the folder containing preset JSON files.
     :return: Dictionary containing the preset configurations, keyed by preset name.
+             It is a copy, so callers may modify it without altering the cached presets.
     """
-    presets = {}
-
     if not os.path.isdir(folder_path):
         raise FileNotFoundError(
             f"The presets folder at {folder_path} does not exist or is not a directory."
         )
 
-    for filename in os.listdir(folder_path):
-        if filename.endswith(".json"):
-            preset_name = filename.replace(".json", "")  # Use filename as preset name
-            preset_file_path = os.path.join(folder_path, filename)
+    sources = _scan_preset_files(folder_path)
+    cached = _PRESETS_CACHE.get(folder_path)
+    if cached is not None and cached[0] == sources:
+        return copy.deepcopy(cached[1])
+
+    bundle_path = os.path.join(folder_path, PRESET_BUNDLE_FILENAME)
+
+    presets = _read_bundle(bundle_path, sources)
+    if presets is not None:
+        _PRESETS_CACHE[folder_path] = (sources, presets)
+        return copy.deepcopy(presets)
+
+    presets = {}
+    for filename in sources:
+        preset_name = filename[: -len(".json")]  # Use filename as preset name
+        preset_file_path = os.path.join(folder_path, filename)
 
-            try:
-                with open(preset_file_path, "r") as file:
-                    preset_data = json.load(file)
-                    presets[preset_name] = preset_data
-            except json.JSONDecodeError as e:
-                logging.error(f"Error decoding JSON in preset {filename}: {e}")
+        try:
+            with open(preset_file_path, "r") as file:
+                preset_data = json.load(file)
+                presets[preset_name] = preset_data
+        except json.JSONDecodeError as e:
+            logger.error(f"Error decoding JSON in preset {filename}: {e}")
 
-    return presets
+    _write_bundle(bundle_path, sources, presets)
+    _PRESETS_CACHE[folder_path] = (sources, presets)
+    return copy.deepcopy(presets)
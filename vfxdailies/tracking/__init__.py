@@ -1,6 +1,12 @@
-from .shotgun_tracking import ShotgunTracking
-from .ftrack_tracking import FtrackTracking
-from .kitsu_tracking import KitsuTracking
+import importlib
+
+# The tracking backends are imported on first access (PEP 562), so e.g. using KitsuTracking
+# does not import the shotgun_api3 or ftrack_api SDKs
+_LAZY_TRACKING = {
+    "ShotgunTracking": ".shotgun_tracking",
+    "FtrackTracking": ".ftrack_tracking",
+    "KitsuTracking": ".kitsu_tracking",
+}
 
 # If you want to create a list of all engines for convenience
 __all__ = [
@@ -8,3 +14,23 @@ __all__ = [
     "FtrackTracking",
     "KitsuTracking",
 ]
+
+
+def __getattr__(name):
+    """
+    Imports the tracking module on first access to one of its tracking classes.
+
+    :param name: The requested attribute name.
+    :return: The tracking software class.
+    """
+    module_name = _LAZY_TRACKING.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    tracking_class = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = tracking_class  # Cache it, so __getattr__ is not called again
+    return tracking_class
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
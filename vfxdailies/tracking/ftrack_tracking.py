@@ -1,5 +1,4 @@
 import logging
-from dailies.constant.main import LOG_FORMAT, LOG_FILE_PATH
 from dailies.environment import Environment
 from dailies.tracking.tracking import TrackingSoftware
 
@@ -7,14 +6,6 @@ from dailies.tracking.tracking import TrackingSoftware
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
-logging.basicConfig(
-    level=logging.INFO,
-    format=LOG_FORMAT,
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler(LOG_FILE_PATH),
-    ],
-)
 
 # Try importing ftrack_api and set availability flag
 try:
@@ -23,7 +14,7 @@ try:
     FTRACK_API_AVAILABLE = True
 except ImportError as e:
     FTRACK_API_AVAILABLE = False
-    logging.error(f"Failed to import ftrack_api module: {e}")
+    logger.error(f"Failed to import ftrack_api module: {e}")
 
 
 class FtrackTracking(TrackingSoftware):
@@ -32,6 +23,8 @@ class FtrackTracking(TrackingSoftware):
     Handles interactions with Ftrack's API.
     """
 
+    __slots__ = ("session",)
+
     def __init__(self, environment: Environment):
         """
         Initializes the FtrackTracking instance.
@@ -42,7 +35,7 @@ class FtrackTracking(TrackingSoftware):
 
         # Initialize the session property if Ftrack API is available
         if not FTRACK_API_AVAILABLE:
-            logging.error("Ftrack API is not available.")
+            logger.error("Ftrack API is not available.")
             self.session = None
         else:
             self.session = ftrack_api.Session()
@@ -55,12 +48,12 @@ class FtrackTracking(TrackingSoftware):
         :return: The project ID, or None if not found.
         """
         if not FTRACK_API_AVAILABLE:
-            logging.error("Ftrack API is not available.")
+            logger.error("Ftrack API is not available.")
             return None
 
         try:
             if not self.session:
-                logging.error("Ftrack API session is not available.")
+                logger.error("Ftrack API session is not available.")
                 return None
 
             project = self.session.query(
@@ -68,7 +61,7 @@ class FtrackTracking(TrackingSoftware):
             ).one()
             return project["id"] if project else None
         except Exception as e:
-            logging.error(f"Error fetching project ID from Ftrack: {e}")
+            logger.error(f"Error fetching project ID from Ftrack: {e}")
             return None
 
     def get_entity_id(self, entity_name, entity_type=None):
@@ -80,12 +73,12 @@ class FtrackTracking(TrackingSoftware):
         :return: The entity ID, or None if not found.
         """
         if not FTRACK_API_AVAILABLE:
-            logging.error("Ftrack API is not available.")
+            logger.error("Ftrack API is not available.")
             return None
 
         try:
             if not self.session:
-                logging.error("Ftrack API session is not available.")
+                logger.error("Ftrack API session is not available.")
                 return None
 
             entity_type = entity_type or self.entity_type
@@ -94,7 +87,7 @@ class FtrackTracking(TrackingSoftware):
             ).one()
             return entity["id"] if entity else None
         except Exception as e:
-            logging.error(f"Error fetching entity ID from Ftrack: {e}")
+            logger.error(f"Error fetching entity ID from Ftrack: {e}")
             return None
 
     def get_task_id(self, entity_id, task_name):
@@ -106,12 +99,12 @@ class FtrackTracking(TrackingSoftware):
         :return: The task ID, or None if not found.
         """
         if not FTRACK_API_AVAILABLE:
-            logging.error("Ftrack API is not available.")
+            logger.error("Ftrack API is not available.")
             return None
 
         try:
             if not self.session:
-                logging.error("Ftrack API session is not available.")
+                logger.error("Ftrack API session is not available.")
                 return None
 
             task = self.session.query(
@@ -119,7 +112,7 @@ class FtrackTracking(TrackingSoftware):
             ).one()
             return task["id"] if task else None
         except Exception as e:
-            logging.error(f"Error fetching task ID from Ftrack: {e}")
+            logger.error(f"Error fetching task ID from Ftrack: {e}")
             return None
 
     def get_artist_id(self, artist_name):
@@ -130,12 +123,12 @@ class FtrackTracking(TrackingSoftware):
         :return: The artist ID, or None if not found.
         """
         if not FTRACK_API_AVAILABLE:
-            logging.error("Ftrack API is not available.")
+            logger.error("Ftrack API is not available.")
             return None
 
         try:
             if not self.session:
-                logging.error("Ftrack API session is not available.")
+                logger.error("Ftrack API session is not available.")
                 return None
 
             artist = self.session.query(
@@ -143,7 +136,7 @@ class FtrackTracking(TrackingSoftware):
             ).one()
             return artist["id"] if artist else None
         except Exception as e:
-            logging.error(f"Error fetching artist ID from Ftrack: {e}")
+            logger.error(f"Error fetching artist ID from Ftrack: {e}")
             return None
 
     def insert_version(self, version_name, video_path, comment):
@@ -155,12 +148,12 @@ class FtrackTracking(TrackingSoftware):
         :param comment: A comment describing the version.
         """
         if not FTRACK_API_AVAILABLE:
-            logging.error("Ftrack API is not available.")
+            logger.error("Ftrack API is not available.")
             return None
 
         try:
             if not self.session:
-                logging.error("Ftrack API session is not available.")
+                logger.error("Ftrack API session is not available.")
                 return None
 
             project = self.session.query(
@@ -174,7 +167,7 @@ class FtrackTracking(TrackingSoftware):
 
             self.session.add(version)
             self.session.commit()
-            logging.info(f"Version '{version_name}' inserted into Ftrack.")
+            logger.info(f"Version '{version_name}' inserted into Ftrack.")
 
             # Add comment
             comment_entity = ftrack_api.Entity("Note")
@@ -183,10 +176,10 @@ class FtrackTracking(TrackingSoftware):
             comment_entity["entity"] = version
             self.session.add(comment_entity)
             self.session.commit()
-            logging.info(f"Added comment: '{comment}'")
+            logger.info(f"Added comment: '{comment}'")
 
         except Exception as e:
-            logging.error(f"Error inserting version into Ftrack: {e}")
+            logger.error(f"Error inserting version into Ftrack: {e}")
 
 
 def main():
@@ -194,7 +187,9 @@ def main():
     Main function to test the FtrackTracking class.
     """
     # Set up logging
-    logging.basicConfig(level=logging.INFO)
+    from dailies.logging_setup import configure_logging
+
+    configure_logging()
 
     # Assume we have an environment object
     environment = Environment(project_name="pipeline_test")
@@ -205,17 +200,17 @@ def main():
     # Test fetching project ID
     project_name = "MyProject"  # Replace with an actual project name
     project_id = ftrack_tracker.get_project_id(project_name)
-    logging.info(f"Project ID for '{project_name}': {project_id}")
+    logger.info(f"Project ID for '{project_name}': {project_id}")
 
     # Test fetching entity ID
     entity_name = "MyAsset"  # Replace with an actual entity name
     entity_id = ftrack_tracker.get_entity_id(entity_name)
-    logging.info(f"Entity ID for '{entity_name}': {entity_id}")
+    logger.info(f"Entity ID for '{entity_name}': {entity_id}")
 
     # Test fetching artist ID by name
     artist_name = "John Doe"  # Replace with an actual artist name
     artist_id = ftrack_tracker.get_artist_id(artist_name)
-    logging.info(f"Artist ID for '{artist_name}': {artist_id}")
+    logger.info(f"Artist ID for '{artist_name}': {artist_id}")
 
     # Test inserting a version
     version_name = "v001"
@@ -1,12 +1,7 @@
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
-from dailies.constant.main import LOG_FORMAT, LOG_FILE_PATH
-from dailies.constant.tracking import (
-    API_URLS,
-    TRACKING_ENGINE,
-    TRACKING_LOGIN_USR,
-    TRACKING_LOGIN_PWD,
-)
+from dailies.constant.tracking import get_tracking_config
 from dailies.environment import Environment
 from dailies.tracking.tracking import TrackingSoftware
 
@@ -14,14 +9,6 @@ from dailies.tracking.tracking import TrackingSoftware
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
-logging.basicConfig(
-    level=logging.INFO,
-    format=LOG_FORMAT,
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler(LOG_FILE_PATH),
-    ],
-)
 
 try:
     import gazu
@@ -29,7 +16,75 @@ try:
     GAZU_AVAILABLE = True
 except ImportError as e:
     GAZU_AVAILABLE = False
-    logging.error(f"Failed to import gazu module: {e}")
+    logger.error(f"Failed to import gazu module: {e}")
+
+# orjson is optional, it only speeds up decoding of the gazu responses
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# requests is a dependency of gazu, it is used to pool the connections of the gazu session
+try:
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    REQUESTS_AVAILABLE = True
+except ImportError:
+    REQUESTS_AVAILABLE = False
+
+
+def _orjson_response_hook(response, *args, **kwargs):
+    """
+    Requests response hook decoding the JSON body with orjson instead of the stdlib json module.
+
+    :param response: The requests response returned by the Kitsu API.
+    :return: The same response, with its json method using orjson.
+    """
+    response.json = lambda **_: orjson.loads(response.content)
+    return response
+
+
+def _use_orjson_decoder():
+    """
+    Registers the orjson response hook on the session of the default gazu client.
+    Large listings such as all_shots_for_project are decoded noticeably faster with orjson.
+    """
+    client = getattr(gazu.client, "default_client", None)
+    session = getattr(client, "session", None)
+    if session is None:
+        return
+
+    hooks = session.hooks["response"]
+    if _orjson_response_hook not in hooks:
+        hooks.append(_orjson_response_hook)
+
+
+def _use_pooled_adapter():
+    """
+    Mounts a pooled HTTPS adapter with retries on the session of the default gazu client.
+    The session keeps its connections alive, so consecutive API calls reuse the same
+    TCP/TLS connection instead of opening a new one, and transient gateway errors are retried.
+    """
+    client = getattr(gazu.client, "default_client", None)
+    session = getattr(client, "session", None)
+    if session is None or getattr(session, "_dailies_pooled", False):
+        return
+
+    # raise_on_status=False returns the last 5xx response once the retries are exhausted,
+    # so gazu raises its own error instead of a urllib3 MaxRetryError
+    adapter = HTTPAdapter(
+        pool_connections=8,
+        pool_maxsize=16,
+        max_retries=Retry(
+            total=3, backoff_factor=0.2, status_forcelist=[502, 503, 504], raise_on_status=False
+        ),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session._dailies_pooled = True
 
 
 class KitsuTracking(TrackingSoftware):
@@ -38,6 +93,8 @@ class KitsuTracking(TrackingSoftware):
     Handles interactions with Kitsu's API using gazu.
     """
 
+    __slots__ = ("session",)
+
     def __init__(self, environment: Environment):
         """
         Initializes the KitsuTracking instance.
@@ -48,18 +105,23 @@ class KitsuTracking(TrackingSoftware):
         self.session = None
 
         if not GAZU_AVAILABLE:
-            logging.error("Gazu module is not available.")
+            logger.error("Gazu module is not available.")
             return
 
         try:
-            gazu.client.set_host(API_URLS.get(TRACKING_ENGINE))
-            self.session = gazu.log_in(TRACKING_LOGIN_USR, TRACKING_LOGIN_PWD)
+            gazu.client.set_host(self.api_url)
+            if REQUESTS_AVAILABLE:
+                _use_pooled_adapter()
+            if ORJSON_AVAILABLE:
+                _use_orjson_decoder()
+            config = get_tracking_config()
+            self.session = gazu.log_in(config.login_user, config.login_pwd)
             if self.session:
-                logging.info("Logged into Kitsu via gazu.")
+                logger.info("Logged into Kitsu via gazu.")
             else:
-                logging.error("Failed to log in. Session not available.")
+                logger.error("Failed to log in. Session not available.")
         except Exception as e:
-            logging.error(f"Failed to login to Kitsu with gazu: {e}")
+            logger.error(f"Failed to login to Kitsu with gazu: {e}")
 
     def _validate(self):
         """
@@ -68,10 +130,10 @@ class KitsuTracking(TrackingSoftware):
         :return: True if both conditions are met, False otherwise.
         """
         if not GAZU_AVAILABLE:
-            logging.error("Gazu module is not available.")
+            logger.error("Gazu module is not available.")
             return False
         if not self.session:
-            logging.error("Session not available. Please login first.")
+            logger.error("Session not available. Please login first.")
             return False
         return True
 
@@ -90,10 +152,10 @@ class KitsuTracking(TrackingSoftware):
             if project:
                 return project["id"]
             else:
-                logging.warning(f"Project '{project_name}' not found in Kitsu.")
+                logger.warning(f"Project '{project_name}' not found in Kitsu.")
                 return None
         except Exception as e:
-            logging.error(f"Error fetching project ID from Kitsu via gazu: {e}")
+            logger.error(f"Error fetching project ID from Kitsu via gazu: {e}")
             return None
 
     def get_entity_id(self, entity_name, entity_type="Shot"):
@@ -109,7 +171,7 @@ class KitsuTracking(TrackingSoftware):
 
         try:
             if not self.project_id:
-                logging.error("Project not found. Cannot fetch entity.")
+                logger.error("Project not found. Cannot fetch entity.")
                 return None
 
             if entity_type.lower() == "shot":
@@ -119,18 +181,18 @@ class KitsuTracking(TrackingSoftware):
             elif entity_type.lower() == "sequence":
                 entities = gazu.sequence.all_sequences_for_project(self.project_id)
             else:
-                logging.error(f"Unsupported entity type: {entity_type}")
+                logger.error(f"Unsupported entity type: {entity_type}")
                 return None
 
             for entity in entities:
                 if entity["name"] == entity_name:
                     return entity["id"]
 
-            logging.warning(f"{entity_type} '{entity_name}' not found in project.")
+            logger.warning(f"{entity_type} '{entity_name}' not found in project.")
             return None
 
         except Exception as e:
-            logging.error(f"Error fetching entity ID via gazu: {e}")
+            logger.error(f"Error fetching entity ID via gazu: {e}")
             return None
 
     def get_task_id(self, entity_id, task_name):
@@ -147,21 +209,21 @@ class KitsuTracking(TrackingSoftware):
         try:
             task_type = gazu.task.get_task_type_by_name(task_name)
             if not task_type:
-                logging.error(f"Task type '{task_name}' not found.")
+                logger.error(f"Task type '{task_name}' not found.")
                 return None
 
             tasks = gazu.task.all_tasks_for_entity_and_task_type(
                 entity_id, task_type["id"]
             )
             if not tasks:
-                logging.warning(
+                logger.warning(
                     f"No tasks found for entity {entity_id} with task type {task_name}."
                 )
                 return None
 
             return tasks[0]["id"]
         except Exception as e:
-            logging.error(f"Error fetching task ID: {e}")
+            logger.error(f"Error fetching task ID: {e}")
             return None
 
     def get_artist_id(self, artist_name):
@@ -180,11 +242,11 @@ class KitsuTracking(TrackingSoftware):
                 if person.get("full_name", "").lower() == artist_name.lower():
                     return person["id"]
 
-            logging.warning(f"Artist '{artist_name}' not found.")
+            logger.warning(f"Artist '{artist_name}' not found.")
             return None
 
         except Exception as e:
-            logging.error(f"Error fetching artist ID for '{artist_name}': {e}")
+            logger.error(f"Error fetching artist ID for '{artist_name}': {e}")
             return None
 
     def insert_version(self, version_name, video_path, comment):
@@ -195,15 +257,29 @@ class KitsuTracking(TrackingSoftware):
         :param video_path: The full path to the QuickTime file.
         :param comment: A comment describing the version being uploaded.
         """
+        return self.insert_versions([(version_name, video_path, comment)])
+
+    def insert_versions(self, versions):
+        """
+        Creates several versions (dailies) for a shot, sequence, or asset and uploads their previews to Kitsu.
+        The entity, task and task status are looked up once and shared by all the versions,
+        so only the comment and preview requests are sent per version.
+        A version failing to upload is logged, and the next versions are still uploaded.
+
+        :param versions: A list of (version_name, video_path, comment) tuples.
+        """
         if not self._validate():
             return None
 
+        if not versions:
+            return None
+
         if not self.environment.entity_id and not self.environment.entity_name:
-            logging.error("Missing entity_name in environment.")
+            logger.error("Missing entity_name in environment.")
             return None
 
         if not self.environment.task_id and not self.environment.task_name:
-            logging.error("Missing task_name in environment.")
+            logger.error("Missing task_name in environment.")
             return None
 
         try:
@@ -215,23 +291,23 @@ class KitsuTracking(TrackingSoftware):
             elif self.environment.entity_type == "asset":
                 entity = gazu.asset.get_asset(self.environment.entity_id)
             else:
-                logging.error(
+                logger.error(
                     f"Unsupported entity type: {self.environment.entity_type}"
                 )
                 return None
 
             if not entity:
-                logging.error(f"Entity ({self.environment.entity_type}) not found.")
+                logger.error(f"Entity ({self.environment.entity_type}) not found.")
                 return None
 
             task_type = gazu.task.get_task_type_by_name(self.environment.task_name)
             if not task_type:
-                logging.error(f"Task type '{self.environment.task_name}' not found.")
+                logger.error(f"Task type '{self.environment.task_name}' not found.")
                 return None
 
             task_id = self.get_task_id(self.environment.entity_id, task_type["name"])
             if not task_id:
-                logging.warning(
+                logger.warning(
                     f"No task found for {self.environment.entity_type}. Creating default one."
                 )
                 task = gazu.task.new_task(self.environment.entity_id, task_type)
@@ -240,44 +316,66 @@ class KitsuTracking(TrackingSoftware):
 
             status = gazu.task.get_task_status(task["task_status_id"])
 
-            file_string = f"\n\n<hr><b><u>FILE :</b></u><i>\n{str(video_path)}</i>\n"
-            gazu_comment = gazu.task.add_comment(task, status, comment + file_string)
+        except Exception as e:
+            logger.error(f"Error inserting version into Kitsu: {e}")
+            return None
 
-            preview = gazu.task.add_preview(task, gazu_comment, video_path)
-            if preview:
-                logging.info(f"Created version {version_name} for task {task['id']}")
-                logging.info(f"Uploaded QuickTime preview for version {version_name}")
+        # Each version is uploaded on its own, so a failed upload does not abort the others
+        for version_name, video_path, comment in versions:
+            try:
+                file_string = f"\n\n<hr><b><u>FILE :</b></u><i>\n{str(video_path)}</i>\n"
+                gazu_comment = gazu.task.add_comment(task, status, comment + file_string)
 
-        except Exception as e:
-            logging.error(f"Error inserting version into Kitsu: {e}")
+                preview = gazu.task.add_preview(task, gazu_comment, video_path)
+                if preview:
+                    logger.info(f"Created version {version_name} for task {task['id']}")
+                    logger.info(f"Uploaded QuickTime preview for version {version_name}")
+            except Exception as e:
+                logger.error(f"Error inserting version {version_name} into Kitsu: {e}")
 
 
 def main():
     """
     Main function to test the KitsuTracking class.
     """
+    # Set up logging
+    from dailies.logging_setup import configure_logging
+
+    configure_logging()
+
     environment = Environment(project_name="pipeline_test")
     kitsu_tracker = KitsuTracking(environment)
 
-    # Test fetching project ID
     project_name = "pipeline_test"
-    project_id = kitsu_tracker.get_project_id(project_name)
-    logging.info(f"Project ID for '{project_name}': {project_id}")
+    entity_name = "MR_LGP_01_0320"
+    task_name = "fx"
+    artist_name = "User"  # Update user here
+
+    # The project, entity and artist lookups are independent, so run them concurrently.
+    # Only the task lookup has to wait for the entity ID.
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        project_future = executor.submit(kitsu_tracker.get_project_id, project_name)
+        entity_future = executor.submit(kitsu_tracker.get_entity_id, entity_name)
+        artist_future = executor.submit(kitsu_tracker.get_artist_id, artist_name)
+
+        entity_id = entity_future.result()
+        task_future = executor.submit(kitsu_tracker.get_task_id, entity_id, task_name)
+
+        project_id = project_future.result()
+        artist_id = artist_future.result()
+        task_id = task_future.result()
+
+    # Test fetching project ID
+    logger.info(f"Project ID for '{project_name}': {project_id}")
 
     # Test fetching entity ID
-    entity_name = "MR_LGP_01_0320"
-    entity_id = kitsu_tracker.get_entity_id(entity_name)
-    logging.info(f"Entity ID for '{entity_name}': {entity_id}")
+    logger.info(f"Entity ID for '{entity_name}': {entity_id}")
 
     # Test fetching task ID
-    task_name = "fx"
-    task_id = kitsu_tracker.get_task_id(entity_id, task_name)
-    logging.info(f"Task ID for '{task_name}': {task_id}")
+    logger.info(f"Task ID for '{task_name}': {task_id}")
 
     # Test fetching artist ID by name
-    artist_name = "User"  # Update user here
-    artist_id = kitsu_tracker.get_artist_id(artist_name)
-    logging.info(f"Artist ID for '{artist_name}': {artist_id}")
+    logger.info(f"Artist ID for '{artist_name}': {artist_id}")
 
     # Test inserting a version (daily)
     environment = Environment(
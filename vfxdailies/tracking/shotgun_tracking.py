@@ -1,7 +1,6 @@
 import logging
 
-from dailies.constant.main import LOG_FORMAT, LOG_FILE_PATH
-from dailies.constant.tracking import TRACKING_LOGIN_USR
+from dailies.constant.tracking import get_tracking_config
 from dailies.environment import Environment
 from dailies.tracking.tracking import TrackingSoftware
 
@@ -9,14 +8,6 @@ from dailies.tracking.tracking import TrackingSoftware
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
-logging.basicConfig(
-    level=logging.INFO,
-    format=LOG_FORMAT,
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler(LOG_FILE_PATH),
-    ],
-)
 
 # Try importing shotgun_api3 and set availability flag
 try:
@@ -25,7 +16,29 @@ try:
     SHOTGUN_API_AVAILABLE = True
 except ImportError as e:
     SHOTGUN_API_AVAILABLE = False
-    logging.error(f"Failed to import shotgun_api3 module: {e}")
+    logger.error(f"Failed to import shotgun_api3 module: {e}")
+
+# Shotgun connections shared by all the ShotgunTracking instances, keyed by (API URL, login).
+# A Shotgun instance keeps its HTTP connection alive, so reusing it avoids a new TCP/TLS
+# handshake (and a new authentication) for every tracking instance.
+_SHOTGUN_CONNECTIONS = {}
+
+
+def _get_connection(api_url, login, password):
+    """
+    Returns the shared Shotgun connection for the given site and user, creating it if needed.
+
+    :param api_url: The URL of the Shotgun site.
+    :param login: The login of the Shotgun user.
+    :param password: The password (or API token) of the Shotgun user.
+    :return: The shotgun_api3.Shotgun connection.
+    """
+    key = (api_url, login)
+    connection = _SHOTGUN_CONNECTIONS.get(key)
+    if connection is None:
+        connection = shotgun_api3.Shotgun(api_url, login=login, password=password)
+        _SHOTGUN_CONNECTIONS[key] = connection
+    return connection
 
 
 class ShotgunTracking(TrackingSoftware):
@@ -34,6 +47,8 @@ class ShotgunTracking(TrackingSoftware):
     Handles interactions with Shotgun's API.
     """
 
+    __slots__ = ("sg",)
+
     def __init__(self, environment: Environment):
         """
         Initializes the ShotgunTracking instance.
@@ -44,12 +59,12 @@ class ShotgunTracking(TrackingSoftware):
 
         # Initialize the session property if Shotgun API is available
         if not SHOTGUN_API_AVAILABLE:
-            logging.error("Shotgun API is not available.")
+            logger.error("Shotgun API is not available.")
             self.sg = None
             return None
         else:
-            self.sg = shotgun_api3.Shotgun(
-                self.api_url, login=TRACKING_LOGIN_USR, password=self.api_token
+            self.sg = _get_connection(
+                self.api_url, get_tracking_config().login_user, self.api_token
             )
 
     def get_project_id(self, project_name):
@@ -60,18 +75,18 @@ class ShotgunTracking(TrackingSoftware):
         :return: The project ID, or None if not found.
         """
         if not SHOTGUN_API_AVAILABLE:
-            logging.error("Shotgun API is not available.")
+            logger.error("Shotgun API is not available.")
             return None
 
         try:
             if not self.sg:
-                logging.error("Shotgun API session is not available.")
+                logger.error("Shotgun API session is not available.")
                 return None
 
             project = self.sg.find_one("Project", [["name", "is", project_name]])
             return project["id"] if project else None
         except Exception as e:
-            logging.error(f"Error fetching project ID from Shotgun: {e}")
+            logger.error(f"Error fetching project ID from Shotgun: {e}")
             return None
 
     def get_entity_id(self, entity_name, entity_type=None):
@@ -83,19 +98,19 @@ class ShotgunTracking(TrackingSoftware):
         :return: The entity ID, or None if not found.
         """
         if not SHOTGUN_API_AVAILABLE:
-            logging.error("Shotgun API is not available.")
+            logger.error("Shotgun API is not available.")
             return None
 
         try:
             if not self.sg:
-                logging.error("Shotgun API session is not available.")
+                logger.error("Shotgun API session is not available.")
                 return None
 
             entity_type = entity_type or self.entity_type
             entity = self.sg.find_one(entity_type, [["code", "is", entity_name]])
             return entity["id"] if entity else None
         except Exception as e:
-            logging.error(f"Error fetching entity ID from Shotgun: {e}")
+            logger.error(f"Error fetching entity ID from Shotgun: {e}")
             return None
 
     def get_task_id(self, entity_id, task_name):
@@ -107,12 +122,12 @@ class ShotgunTracking(TrackingSoftware):
         :return: The task ID, or None if not found.
         """
         if not SHOTGUN_API_AVAILABLE:
-            logging.error("Shotgun API is not available.")
+            logger.error("Shotgun API is not available.")
             return None
 
         try:
             if not self.sg:
-                logging.error("Shotgun API session is not available.")
+                logger.error("Shotgun API session is not available.")
                 return None
 
             task = self.sg.find_one(
@@ -120,7 +135,7 @@ class ShotgunTracking(TrackingSoftware):
             )
             return task["id"] if task else None
         except Exception as e:
-            logging.error(f"Error fetching task ID from Shotgun: {e}")
+            logger.error(f"Error fetching task ID from Shotgun: {e}")
             return None
 
     def get_artist_id(self, artist_name):
@@ -131,18 +146,18 @@ class ShotgunTracking(TrackingSoftware):
         :return: The artist ID, or None if not found.
         """
         if not SHOTGUN_API_AVAILABLE:
-            logging.error("Shotgun API is not available.")
+            logger.error("Shotgun API is not available.")
             return None
 
         try:
             if not self.sg:
-                logging.error("Shotgun API session is not available.")
+                logger.error("Shotgun API session is not available.")
                 return None
 
             artist = self.sg.find_one("HumanUser", [["name", "is", artist_name]])
             return artist["id"] if artist else None
         except Exception as e:
-            logging.error(f"Error fetching artist ID from Shotgun: {e}")
+            logger.error(f"Error fetching artist ID from Shotgun: {e}")
             return None
 
     def insert_version(self, version_name, video_path, comment):
@@ -153,51 +168,83 @@ class ShotgunTracking(TrackingSoftware):
         :param video_path: The path to the video file to be uploaded.
         :param comment: A comment describing the version.
         """
+        return self.insert_versions([(version_name, video_path, comment)])
+
+    def insert_versions(self, versions):
+        """
+        Inserts several versions into Shotgun at once. The versions and their comments
+        are created with a single batch request, instead of two requests per version.
+
+        :param versions: A list of (version_name, video_path, comment) tuples.
+        """
         if not SHOTGUN_API_AVAILABLE:
-            logging.error("Shotgun API is not available.")
+            logger.error("Shotgun API is not available.")
+            return None
+
+        if not versions:
             return None
 
         try:
             if not self.sg:
-                logging.error("Shotgun API session is not available.")
+                logger.error("Shotgun API session is not available.")
                 return None
 
-            # Create version
-            data = {
-                "project": {"type": "Project", "id": self.project_id},
-                "code": version_name,
-                "entity": {"type": self.entity_type, "id": self.entity_id},
-                "sg_uploaded_movie": video_path,
-                "sg_task": {
-                    "type": "Task",
-                    "id": self.get_task_id(self.entity_id, "Render"),
-                },  # Example task type
-                "sg_status_list": "rev",  # This status may vary
-            }
-
-            # Create the version entry
-            self.sg.create("Version", data)
-            logging.info(f"Version '{version_name}' inserted into Shotgun.")
-
-            # Add comment
-            self.sg.create(
-                "Note",
-                {
-                    "content": comment,
-                    "entity": {"type": self.entity_type, "id": self.entity_id},
-                    "project": {"type": "Project", "id": self.project_id},
-                },
-            )
-            logging.info(f"Added comment: '{comment}'")
+            project = {"type": "Project", "id": self.project_id}
+            entity = {"type": self.entity_type, "id": self.entity_id}
+            # The task is the same for all the versions, so it is only looked up once
+            task = {
+                "type": "Task",
+                "id": self.get_task_id(self.entity_id, "Render"),
+            }  # Example task type
+
+            batch_requests = []
+            for version_name, video_path, comment in versions:
+                # Create version
+                batch_requests.append(
+                    {
+                        "request_type": "create",
+                        "entity_type": "Version",
+                        "data": {
+                            "project": project,
+                            "code": version_name,
+                            "entity": entity,
+                            "sg_uploaded_movie": video_path,
+                            "sg_task": task,
+                            "sg_status_list": "rev",  # This status may vary
+                        },
+                    }
+                )
+                # Add comment
+                batch_requests.append(
+                    {
+                        "request_type": "create",
+                        "entity_type": "Note",
+                        "data": {
+                            "content": comment,
+                            "entity": entity,
+                            "project": project,
+                        },
+                    }
+                )
+
+            self.sg.batch(batch_requests)
+            for version_name, _, comment in versions:
+                logger.info(f"Version '{version_name}' inserted into Shotgun.")
+                logger.info(f"Added comment: '{comment}'")
 
         except Exception as e:
-            logging.error(f"Error inserting version into Shotgun: {e}")
+            logger.error(f"Error inserting version into Shotgun: {e}")
 
 
 def main():
     """
     Main function to test the ShotgunTracking class.
     """
+    # Set up logging
+    from dailies.logging_setup import configure_logging
+
+    configure_logging()
+
     environment = Environment(
         project_name="pipeline_test", entity_name="MyAsset", task_name="render"
     )
@@ -206,17 +253,17 @@ def main():
     # Test fetching project ID
     project_name = "MyProject"  # Replace with an actual project name
     project_id = shotgun_tracker.get_project_id(project_name)
-    logging.info(f"Project ID for '{project_name}': {project_id}")
+    logger.info(f"Project ID for '{project_name}': {project_id}")
 
     # Test fetching entity ID
     entity_name = "MyAsset"  # Replace with an actual entity name
     entity_id = shotgun_tracker.get_entity_id(entity_name)
-    logging.info(f"Entity ID for '{entity_name}': {entity_id}")
+    logger.info(f"Entity ID for '{entity_name}': {entity_id}")
 
     # Test fetching artist ID by name
     artist_name = "John Doe"  # Replace with an actual artist name
     artist_id = shotgun_tracker.get_artist_id(artist_name)
-    logging.info(f"Artist ID for '{artist_name}': {artist_id}")
+    logger.info(f"Artist ID for '{artist_name}': {artist_id}")
 
     # Test inserting a version
     version_name = "v001"
@@ -1,89 +1,149 @@
 import logging
-from abc import ABC, abstractmethod
-
-from dailies.constant.main import LOG_FORMAT, LOG_FILE_PATH
-from dailies.constant.tracking import (
-    API_URLS,
-    TRACKING_ENGINE,
-    TRACKING_API_TOKEN,
-    TRACKING_LOGIN_USR,
-)
+from functools import lru_cache
+from types import MappingProxyType
+from typing import TYPE_CHECKING
+
+from dailies.constant.tracking import VALID_TRACKING_ENGINES, get_tracking_config
 from dailies.environment import Environment
 
 # Set up logger
 logger = logging.getLogger(__name__)
-logger.setLevel(logging.INFO)
-
-logging.basicConfig(
-    level=logging.INFO,
-    format=LOG_FORMAT,
-    handlers=[
-        logging.StreamHandler(),
-        LOG_FILE_PATH,
-    ],
-)
-
-# Check the validity of TRACKING_ENGINE
-if not TRACKING_ENGINE or TRACKING_ENGINE not in API_URLS:
-    logging.error(
-        f"Invalid TRACKING_ENGINE specified: {TRACKING_ENGINE}. Please check the configuration."
-    )
-    exit(1)
 
-# Log warnings if credentials are missing or using default values
-if not TRACKING_LOGIN_USR or TRACKING_LOGIN_USR == "USR":
-    logging.error(
-        "Tracking username is missing or invalid. Please set 'TRACKING_LOGIN_USER' in the environment variables."
-    )
 
-if not TRACKING_API_TOKEN or TRACKING_API_TOKEN == "PWD":
-    logging.error(
-        "Tracking API token is missing or invalid. Please set 'TRACKING_API_TOKEN' in the environment variables."
-    )
+class TrackingConfigError(ValueError):
+    """
+    Raised when the tracking configuration (e.g., the tracking engine) is invalid.
+    """
+
+
+@lru_cache(maxsize=1)
+def _validate_config(config):
+    """
+    Validates the tracking configuration the first time a tracking software is instantiated.
+    A valid configuration is memoized, so the checks and log messages only run once per process.
+
+    :param config: The TrackingConfig snapshot to validate.
+    :raises TrackingConfigError: If the tracking engine is missing or unknown.
+    """
+    # Check the validity of the tracking engine
+    if not config.engine or config.engine not in VALID_TRACKING_ENGINES:
+        logger.error(
+            "Invalid TRACKING_ENGINE specified: %s. Please check the configuration.",
+            config.engine,
+        )
+        raise TrackingConfigError(
+            f"Invalid TRACKING_ENGINE specified: {config.engine}. Please check the configuration."
+        )
+
+    # Log warnings if credentials are missing or using default values
+    if not config.login_user or config.login_user == "USR":
+        logger.error(
+            "Tracking username is missing or invalid. Please set 'TRACKING_LOGIN_USER' in the environment variables."
+        )
+
+    if not config.login_pwd or config.login_pwd == "PWD":
+        logger.error(
+            "Tracking password is missing or invalid. Please set 'TRACKING_LOGIN_PWD' in the environment variables."
+        )
+
+    if not config.api_token or config.api_token == "PWD":
+        logger.error(
+            "Tracking API token is missing or invalid. Please set 'TRACKING_API_TOKEN' in the environment variables."
+        )
+
+    # Log the chosen tracking engine and its corresponding API URL
+    logger.info("Using tracking engine: %s", config.engine)
+    logger.info("API URL for %s: %s", config.engine, config.api_url)
+
+
+if TYPE_CHECKING:
+    from typing import Protocol
+
+    class TrackingSoftwareProtocol(Protocol):
+        """
+        Static interface implemented by the tracking software classes.
+        """
 
-# Log the chosen tracking engine and its corresponding API URL
-logger.info(f"Using tracking engine: {TRACKING_ENGINE}")
-logger.info(f"API URL for {TRACKING_ENGINE}: {API_URLS[TRACKING_ENGINE]}")
+        def get_project_id(self, project_name): ...
+
+        def get_entity_id(self, entity_name, entity_type=None): ...
+
+        def get_task_id(self, entity_id, task_name): ...
+
+        def get_artist_id(self, artist_name): ...
+
+        def insert_version(self, version_name, video_path): ...
+
+        def insert_versions(self, versions): ...
 
 
 # Base class for tracking software systems like Shotgun, Ftrack, Kitsu, and Flow.
-class TrackingSoftware(ABC):
+class TrackingSoftware:
     """
     Base class for tracking software systems like Shotgun, Ftrack, Kitsu, and Flow.
     Provides common methods for interacting with various tracking systems.
+    Subclasses must implement the lookup methods and `insert_version`.
     """
 
+    # Fixed attribute layout, subclasses declare their own extra slots
+    __slots__ = (
+        "environment",
+        "api_url",
+        "api_token",
+        "project_name",
+        "project_id",
+        "entity_name",
+        "entity_id",
+        "entity_type",
+        "task_name",
+        "task_id",
+        "artist_name",
+        "artist_id",
+        "_headers",
+    )
+
     def __init__(self, environment: Environment):
         """
         Initializes the TrackingSoftware instance with the given environment.
 
         :param environment: The environment instance that contains project and entity details.
+        :raises TrackingConfigError: If the tracking configuration is invalid.
         """
+        config = get_tracking_config()
+        _validate_config(config)
+
         self.environment = environment
-        self.api_url = API_URLS.get(TRACKING_ENGINE)
-        self.api_token = TRACKING_API_TOKEN
+        self.api_url = config.api_url
+        self.api_token = config.api_token
         self.project_name = self.environment.project_name
-        self.project_id = self.environment.fetch_project_id()
         self.entity_name = self.environment.entity_name
-        self.entity_id = self.environment.fetch_entity_id()
         self.entity_type = self.environment.entity_type
         self.task_name = self.environment.task_name
-        self.task_id = self.environment.fetch_task_id()
         self.artist_name = self.environment.artist_name
-        self.artist_id = self.environment.fetch_artist_id()
+        (
+            self.project_id,
+            self.entity_id,
+            self.task_id,
+            self.artist_id,
+        ) = self.environment.fetch_ids()
+
+        # The API token does not change for the lifetime of the instance, so the headers
+        # are built once and shared as a read-only mapping
+        self._headers = MappingProxyType(
+            {
+                "Authorization": f"Bearer {self.api_token}",
+                "Content-Type": "application/json",
+            }
+        )
 
     def _get_headers(self):
         """
         Returns the headers required for API requests.
 
-        :return: A dictionary containing the Authorization and Content-Type headers.
+        :return: A read-only mapping containing the Authorization and Content-Type headers.
         """
-        return {
-            "Authorization": f"Bearer {self.api_token}",
-            "Content-Type": "application/json",
-        }
+        return self._headers
 
-    @abstractmethod
     def get_project_id(self, project_name):
         """
         Retrieves the project ID based on the project name.
@@ -91,9 +151,8 @@ class TrackingSoftware(ABC):
         :param project_name: The project name to search for.
         :return: The project ID, or None if not found.
         """
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def get_entity_id(self, entity_name, entity_type=None):
         """
         Retrieves the entity ID based on the entity name from the tracking system.
@@ -102,9 +161,8 @@ class TrackingSoftware(ABC):
         :param entity_type: The entity type to use (defaults to the one in the environment).
         :return: The entity ID, or None if not found.
         """
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def get_task_id(self, entity_id, task_name):
         """
         Retrieves the task ID for a given entity and task type name.
@@ -113,9 +171,8 @@ class TrackingSoftware(ABC):
         :param task_name: The name of the task type.
         :return: The task ID, or None if not found.
         """
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def get_artist_id(self, artist_name):
         """
         Retrieves the artist ID based on the artist's name.
@@ -123,9 +180,8 @@ class TrackingSoftware(ABC):
         :param artist_name: The full name of the artist.
         :return: The artist ID, or None if not found.
         """
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def insert_version(self, version_name, video_path):
         """
         Inserts a version into the tracking system.
@@ -133,4 +189,14 @@ class TrackingSoftware(ABC):
         :param version_name: The version name to be created.
         :param video_path: The path to the video file to be uploaded.
         """
-        pass
+        raise NotImplementedError
+
+    def insert_versions(self, versions):
+        """
+        Inserts several versions into the tracking system.
+        Subclasses whose API supports it override this to send the versions in fewer requests.
+
+        :param versions: A list of tuples holding the `insert_version` arguments of each version.
+        """
+        for version in versions:
+            self.insert_version(*version)
@@ -1,15 +1,31 @@
-from dailies.ui.ui import DailiesUI
 from dailies.environment import Environment
+from dailies.logging_setup import configure_logging
 from dailies.preset import load_presets_from_folder
+from dailies.ui.ui import DailiesUI
+
+
+def launch():
+    """
+    Launches the dailies tool inside a DCC application (e.g., from a menu command).
+
+    :return: The DailiesUI window, the caller should keep a reference to it.
+    """
+    # Set up logging, this is a no-op if the host application already installed handlers
+    configure_logging()
+
+    # Fetch data from environment variables
+    environment = Environment()
+
+    # Load presets
+    presets = load_presets_from_folder()
 
-# Fetch data from environment variables
-environment = Environment()
+    # Initialize the UI
+    dailies_ui = DailiesUI(environment=environment, presets=presets)
 
-# Load presets
-presets = load_presets_from_folder()
+    # Show the UI window
+    dailies_ui.show()
+    return dailies_ui
 
-# Initialize the UI
-dailies_ui = DailiesUI(environment=environment, presets=presets)
 
-# Show the UI window
-dailies_ui.show()
+if __name__ == "__main__":
+    dailies_ui = launch()
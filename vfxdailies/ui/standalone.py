@@ -1,25 +1,115 @@
-import sys
+def main():
+    """
+    Entry point of the standalone dailies tool.
 
-from PySide6.QtWidgets import QApplication
+    Imports are deferred so that importing this module stays cheap,
+    and PySide6 is only loaded when the standalone tool is actually launched.
+    """
+    import sys
 
-from dailies.ui.ui import DailiesUI
-from dailies.environment import Environment
-from dailies.preset import load_presets_from_folder
+    from dailies.logging_setup import configure_logging
+
+    configure_logging()
+
+    from PySide6.QtCore import QObject, QRunnable, QThreadPool, Qt, Signal, Slot
+    from PySide6.QtGui import QColor, QPixmap
+    from PySide6.QtWidgets import QApplication, QMessageBox, QSplashScreen
 
-if __name__ == "__main__":
     app = QApplication(sys.argv)
 
-    # Load environment
-    environment = Environment()
+    # Show a splash screen right away, the environment and presets are loaded in the background
+    splash_pixmap = QPixmap(400, 120)
+    splash_pixmap.fill(QColor("#2b2b2b"))
+    splash = QSplashScreen(splash_pixmap)
+    splash.show()
+    splash.showMessage(
+        "Loading dailies environment and presets...",
+        Qt.AlignHCenter | Qt.AlignBottom,
+        QColor("white"),
+    )
+    app.processEvents()
+
+    def _warm_imports():
+        """
+        Imports the configured tracking backend module (and its SDK) in the background,
+        so it is already loaded by the time the user submits.
+        """
+        import importlib
+
+        from dailies.constant.tracking import TRACKING_SOFTWARE_CLASSES, get_tracking_config
+
+        class_path = TRACKING_SOFTWARE_CLASSES.get(get_tracking_config().engine)
+        if class_path:
+            try:
+                importlib.import_module(class_path.rsplit(".", 1)[0])
+            except Exception:
+                # The import is retried (and any error reported) when the backend is used
+                pass
+
+    import threading
+
+    threading.Thread(target=_warm_imports, daemon=True).start()
+
+    class StartupLoader(QObject):
+        """
+        Lives on the GUI thread and creates the UI once the background loading is done.
+        The signals are emitted from the worker thread and delivered through queued connections.
+        """
+
+        finished = Signal(object, object)
+        failed = Signal(str)
 
-    # Load presets
-    presets = load_presets_from_folder()
+        def __init__(self):
+            super().__init__()
+            self.dailies_ui = None
+            self.finished.connect(self.on_finished)
+            self.failed.connect(self.on_failed)
 
-    # Initialize the UI
-    dailies_ui = DailiesUI(environment=environment, presets=presets)
+        @Slot(object, object)
+        def on_finished(self, environment, presets):
+            from dailies.ui.ui import DailiesUI
 
-    # Show the UI window
-    dailies_ui.show()
+            # Initialize and show the UI window
+            self.dailies_ui = DailiesUI(environment=environment, presets=presets)
+            self.dailies_ui.show()
+            splash.finish(self.dailies_ui)
+
+        @Slot(str)
+        def on_failed(self, message):
+            splash.close()
+            QMessageBox.critical(None, "Dailies", f"Failed to start the dailies tool:\n{message}")
+            app.exit(1)
+
+    class StartupTask(QRunnable):
+        """
+        Builds the environment and loads the presets off the GUI thread.
+        """
+
+        def __init__(self, loader):
+            super().__init__()
+            self.loader = loader
+
+        def run(self):
+            try:
+                from dailies.environment import Environment
+                from dailies.preset import load_presets_from_folder
+
+                # Load environment
+                environment = Environment()
+
+                # Load presets
+                presets = load_presets_from_folder()
+            except Exception as e:
+                self.loader.failed.emit(str(e))
+                return
+            self.loader.finished.emit(environment, presets)
+
+    loader = StartupLoader()
+    QThreadPool.globalInstance().start(StartupTask(loader))
 
     # Start the event loop
     sys.exit(app.exec())
+
+
+if __name__ == "__main__":
+    main()
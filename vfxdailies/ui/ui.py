@@ -1,7 +1,10 @@
 import os
 import logging
 import re
+from collections import namedtuple
 
+from PySide6.QtCore import QRegularExpression, QSignalBlocker
+from PySide6.QtGui import QIntValidator, QRegularExpressionValidator
 from PySide6.QtWidgets import (
     QWidget,
     QVBoxLayout,
@@ -19,31 +22,62 @@ from PySide6.QtWidgets import (
 )
 
 from dailies.constant.main import (
-    LOG_FORMAT,
-    LOG_FILE_PATH,
     DEFAULT_TEMPLATE_DIRECTORY,
     FRAME_PADDING_FORMAT,
     FRAME_START_NUMBER,
 )
 from dailies.constant.engine import SUPPORTED_FILE_TYPES, IMAGE_SEQUENCES_FILE_TYPES
-from dailies.constant.tracking import TRACKING_ENGINE
+from dailies.constant.tracking import get_tracking_config
 from dailies.environment import Environment
 from dailies.factory import VideoEngineFactory, TrackingSoftwareFactory
 
-# Set up logger
+# Set up logger, the handlers are installed by the entry points (see dailies.logging_setup)
 logger = logging.getLogger(__name__)
-logger.setLevel(logging.INFO)
-
-logging.basicConfig(
-    level=logging.INFO,  # Set the default logger level to INFO
-    format=LOG_FORMAT,
-    handlers=[
-        logging.StreamHandler(),  # Log to the console
-        logging.FileHandler(LOG_FILE_PATH),
+
+# Matches an image sequence file path, capturing the name, the frame number and the extension
+_SEQ_RE = re.compile(r"(\D+)(\d+)(\.\w+)$")
+
+# Matches a single render option, either a standalone value or a key=value pair
+_OPT_TOKEN = re.compile(r"[A-Za-z0-9_]+(?:=[^,]+)?\Z")
+
+# Form values, read once per submission and passed to the submission steps
+Submission = namedtuple(
+    "Submission",
+    [
+        "path",
+        "version",
+        "description",
+        "artist",
+        "link",
+        "task",
+        "project",
+        "tracking",
+        "preset",
+        "engine",
+        "extension",
+        "fps",
+        "resolution",
+        "options",
+        "template",
+        "output_path",
+        "slate",
     ],
 )
 
 
+def _ext(file_path):
+    """
+    Returns the lowercase extension of a file path, without the leading dot.
+
+    Args:
+        file_path (str): The file path.
+
+    Returns:
+        str: The file extension.
+    """
+    return file_path.rpartition(".")[2].lower()
+
+
 class DailiesUI(QWidget):
     """UI for managing video & image rendering and tracking software options for vfx/animation workflow."""
 
@@ -59,17 +93,65 @@ class DailiesUI(QWidget):
         super().__init__(parent)
         self.setWindowTitle("Dailies Tool")
         self.setGeometry(100, 100, 400, 600)
+
+        # Build and fill the widgets without intermediate repaints, the render settings
+        # are refreshed when the window is first shown (see showEvent)
+        self.setUpdatesEnabled(False)
         self._setup_ui(presets)
         self._set_field_tooltips()
 
+        # Render settings that can only be edited when no preset is selected,
+        # the template widgets are added once they are built
+        self._preset_gated = (
+            self.engine_input,
+            self.extension_input,
+            self.resolution_input,
+            self.fps_input,
+            self.options_input,
+            self.slate_checkbox,
+        )
+
         self._is_error = False
+        self._err_msg = None
         self.presets = presets
         self.environment = environment
 
+        # Engine and extensions currently listed in the extension combo box
+        self._last_engine_items = (None, None)
+
+        # Video engines already created, keyed by engine name (the engines are stateless)
+        self._engine_cache = {}
+
+        # Slate file name derived from the input path, computed on demand
+        self._cached_slate_filename = None
+        self.input_path.textChanged.connect(self._invalidate_slate_filename)
+
         if environment:
             self.prefill_form(environment)
 
-        self.update_render_settings()
+        # Whether self.environment was checked to be complete and matches the form fields.
+        # Connected after the prefill, so only user edits invalidate it.
+        self._env_is_valid = False
+        for field in (self.project_input, self.link_input, self.task_input, self.artist_input):
+            field.textChanged.connect(self._invalidate_env)
+
+        self._initial_refresh_done = False
+        self.setUpdatesEnabled(True)
+
+    def showEvent(self, event):
+        """
+        Refreshes the render settings the first time the window is shown,
+        so creating the UI (e.g., from a DCC menu callback) returns quickly.
+
+        Args:
+            event (QShowEvent): The show event.
+        """
+        super().showEvent(event)
+        if not self._initial_refresh_done:
+            self._initial_refresh_done = True
+            self.setUpdatesEnabled(False)
+            self.update_render_settings()
+            self.setUpdatesEnabled(True)
 
     def _setup_ui(self, presets):
         """
@@ -127,31 +209,30 @@ class DailiesUI(QWidget):
         self.fps_input = QLineEdit(self)
         self.options_input = QLineEdit(self)
 
+        # Reject invalid keystrokes in the FPS and resolution fields directly
+        self.fps_input.setValidator(QIntValidator(1, 240, self))
+        self.resolution_input.setValidator(
+            QRegularExpressionValidator(QRegularExpression(r"\d+x\d+"), self)
+        )
+
         # Create combo box for the preset options
         self.preset_input = QComboBox(self)
-        self.preset_input.addItem("None")  # Add the "None" option
-        for preset_name in presets:
-            self.preset_input.addItem(preset_name)
-        self.preset_input.currentTextChanged.connect(self.update_render_settings)
+        self.preset_input.addItems(["None", *(presets or {})])  # "None" first, then the presets
 
         # Create combo box for the engine selection
         self.engine_input = QComboBox(self)
-        self.engine_input.addItem("FFmpeg")
-        self.engine_input.addItem("Nuke")
-        self.engine_input.addItem("Nuke-Template")
-        self.engine_input.addItem("RVIO")
+        self.engine_input.addItems(["FFmpeg", "Nuke", "Nuke-Template", "RVIO"])
+
+        # Connect the combo boxes only once they are populated, so filling them
+        # does not trigger update_render_settings for every item
+        self.preset_input.currentTextChanged.connect(self.update_render_settings)
         self.engine_input.currentTextChanged.connect(self.update_render_settings)
 
-        # Create template input field and button (visible only if 'NukeTemplate' engine is selected)
-        self.template_input = QLineEdit(self)
-        self.template_input.setObjectName("template_input")
-        self.template_button = QPushButton("Browse...", self)
-        self.template_button.clicked.connect(self._browse_file_nuke_template)
-
-        # Create a horizontal layout for the template field and the browse button
-        template_layout = QHBoxLayout()
-        template_layout.addWidget(self.template_input)
-        template_layout.addWidget(self.template_button)
+        # Template input field and button are only built once the 'Nuke-Template' engine is selected
+        # (see _build_template_row)
+        self.template_label = None
+        self.template_input = None
+        self.template_button = None
 
         # Create output path input field and "Browse" button to open the file dialog
         self.output_path = QLineEdit(self)
@@ -179,18 +260,17 @@ class DailiesUI(QWidget):
         self.resolution_label = QLabel("Resolution:")
         self.fps_label = QLabel("FPS:")
         self.options_label = QLabel("Options:")
-        self.template_label = QLabel("Template:")
         self.output_path_label = QLabel("Output Path:")
 
         render_layout.addRow(self.extension_label, self.extension_input)
         render_layout.addRow(self.resolution_label, self.resolution_input)
         render_layout.addRow(self.fps_label, self.fps_input)
         render_layout.addRow(self.options_label, self.options_input)
-        render_layout.addRow(self.template_label, template_layout)
         render_layout.addRow(self.output_path_label, output_path_layout)
         render_layout.addRow(slate_checkbox_layout)
 
         render_group.setLayout(render_layout)
+        self._render_layout = render_layout
 
         # Create submit button
         self.submit_button = QPushButton("Submit", self)
@@ -204,6 +284,28 @@ class DailiesUI(QWidget):
 
         self.setLayout(main_layout)
 
+    def _build_template_row(self):
+        """
+        Builds the Nuke template input field and browse button, and inserts them
+        in the render settings right after the options.
+        """
+        self.template_label = QLabel("Template:")
+        self.template_input = QLineEdit(self)
+        self.template_input.setObjectName("template_input")
+        self.template_input.setToolTip("Select the Nuke template file.")
+        self.template_button = QPushButton("Browse...", self)
+        self.template_button.clicked.connect(self._browse_file_nuke_template)
+
+        # Create a horizontal layout for the template field and the browse button
+        template_layout = QHBoxLayout()
+        template_layout.addWidget(self.template_input)
+        template_layout.addWidget(self.template_button)
+
+        row = self._render_layout.getWidgetPosition(self.options_input)[0] + 1
+        self._render_layout.insertRow(row, self.template_label, template_layout)
+
+        self._preset_gated += (self.template_input, self.template_button)
+
     def _browse_file(self, title, filter, callback):
         """
         Opens a file dialog and sets the file path using the provided callback.
@@ -216,8 +318,7 @@ class DailiesUI(QWidget):
         file_path, _ = QFileDialog.getOpenFileName(self, title, "", filter)
         if file_path:
 
-            file_extension = os.path.splitext(file_path)[1][1:].lower()
-            if file_extension in IMAGE_SEQUENCES_FILE_TYPES:
+            if _ext(file_path) in IMAGE_SEQUENCES_FILE_TYPES:
                 file_path = self._get_image_sequence_file_path(file_path)
 
             # Set the path input with the processed path
@@ -234,8 +335,7 @@ class DailiesUI(QWidget):
         )
         if file_path:
 
-            file_extension = os.path.splitext(file_path)[1][1:].lower()
-            if file_extension in IMAGE_SEQUENCES_FILE_TYPES:
+            if _ext(file_path) in IMAGE_SEQUENCES_FILE_TYPES:
                 file_path = self._get_image_sequence_file_path(file_path)
 
             self.output_path.setText(file_path.replace("\\", "/"))
@@ -272,7 +372,7 @@ class DailiesUI(QWidget):
             options (dict, optional): Additional options.
             slate (dict, optional): Additional slate data.
         """
-        video_engine = VideoEngineFactory.get_video_engine(engine.lower())
+        video_engine = self._get_video_engine(engine)
         try:
             if engine == "Nuke-Template":
                 video_engine.create_media(input_path, output_path, template)
@@ -291,25 +391,42 @@ class DailiesUI(QWidget):
             self._show_error("Submission Error", f"{e}")
             self._is_error = True
 
-    def _create_tracking_version(self, version, output_path):
+    def _get_video_engine(self, engine):
+        """
+        Returns the video engine instance for the given engine, creating it on first use.
+
+        Args:
+            engine (str): The engine to use (e.g., 'FFmpeg', 'Nuke', 'Nuke-Template', 'RVIO').
+
+        Returns:
+            VideoEngine: The video engine instance.
+        """
+        key = engine.lower()
+        video_engine = self._engine_cache.get(key)
+        if video_engine is None:
+            video_engine = self._engine_cache[key] = VideoEngineFactory.get_video_engine(key)
+        return video_engine
+
+    def _create_tracking_version(self, version, output_path, description=None):
         """
         Handles tracking the version by calling the appropriate tracking software.
 
         Args:
             version (str): The version information to be inserted into the tracked media.
             output_path (str): The path to the output media that needs to be tracked.
+            description (str, optional): The version description, read from the form if not provided.
 
         Raises:
             Exception: If an error occurs during version insertion, an exception will be logged
                       and the error is shown to the user.
         """
         tracking = TrackingSoftwareFactory.get_tracking_software(
-            TRACKING_ENGINE, self._get_environment()
+            get_tracking_config().engine, self._get_environment()
         )
         try:
-            tracking.insert_version(
-                version, output_path, self.description_input.toPlainText()
-            )
+            if description is None:
+                description = self.description_input.toPlainText()
+            tracking.insert_version(version, output_path, description)
         except Exception as e:
             logger.error(f"Error during version creation: {e}")
             self._show_error("Tracking Error", f"{e}")
@@ -318,19 +435,23 @@ class DailiesUI(QWidget):
     def _get_environment(self):
         """
         Ensures a valid Environment instance exists by checking required fields.
-        If any are missing, it re-creates the Environment using the UI values.
+        If any are missing, it re-creates the Environment using the UI values,
+        otherwise the existing Environment is updated with the edited form fields.
 
         Returns:
             Environment or None: A fully initialized Environment object or None on error.
         """
-        if (
-            not self.environment
-            or not self.environment.project_name
-            or not self.environment.entity_name
-            or not self.environment.task_name
-            or not self.environment.artist_name
-        ):
-            try:
+        if self._env_is_valid:
+            return self.environment
+
+        try:
+            if (
+                not self.environment
+                or not self.environment.project_name
+                or not self.environment.entity_name
+                or not self.environment.task_name
+                or not self.environment.artist_name
+            ):
                 self.environment = Environment(
                     project_name=self.project_input.text(),
                     entity_name=self.link_input.text(),
@@ -338,14 +459,37 @@ class DailiesUI(QWidget):
                     artist_name=self.artist_input.text(),
                 )
                 self.environment.log_configuration()
-            except Exception as e:
-                logger.error(f"Failed to initialize environment: {e}")
-                self._show_error("Environment Error", str(e))
-                self._is_error = True
-                return None
+            else:
+                self._refresh_environment()
+        except Exception as e:
+            logger.error(f"Failed to initialize environment: {e}")
+            self._show_error("Environment Error", str(e))
+            self._is_error = True
+            return None
 
+        self._env_is_valid = True
         return self.environment
 
+    def _refresh_environment(self):
+        """
+        Updates the existing environment with the edited form fields.
+        Only the IDs depending on a changed name are looked up again in the tracking software.
+        """
+        if self.environment.update(
+            project_name=self.project_input.text(),
+            entity_name=self.link_input.text(),
+            task_name=self.task_input.text(),
+            artist_name=self.artist_input.text(),
+        ):
+            self.environment.log_configuration()
+
+    def _invalidate_env(self):
+        """
+        Marks the environment as out of date when one of its form fields is edited,
+        so it is updated from the form values on the next submission.
+        """
+        self._env_is_valid = False
+
     def _get_image_sequence_file_path(self, file_path):
         """
         Processes a file path for image sequences and replaces the frame number
@@ -358,42 +502,79 @@ class DailiesUI(QWidget):
             str: The file path with the frame number replaced by the padding format.
         """
         # Check if the file path contains a sequence of numbers
-        # Captures the name, number, and extension
-        sequence_pattern = r"(\D+)(\d+)(\.\w+)$"
-        match = re.match(sequence_pattern, file_path)
+        match = _SEQ_RE.match(file_path)
 
         if match:
-            # Extract the frame number and calculate the padding length dynamically
-            frame_number = match.group(2)
-            padding_length = len(frame_number)
-            padding_format = f"%0{padding_length}d"
+            # Calculate the padding length dynamically from the frame number
+            start, end = match.span(2)
+            padding_format = f"%0{end - start}d"
 
             # Replace the frame number with the dynamic padding format
-            file_path = file_path.replace(frame_number, padding_format)
+            file_path = file_path[:start] + padding_format + file_path[end:]
 
         return file_path
 
-    def _log_submission(self):
-        """Logs the data from the form submission."""
-        logger.info("*****************************************************************")
-        logger.info(f"Path: {self.input_path.text()}")
-        logger.info(f"Version: {self.version_input.text()}")
-        logger.info(f"Description: {self.description_input.toPlainText()}")
-        logger.info(f"Artist: {self.artist_input.text()}")
-        logger.info(f"Link: {self.link_input.text()}")
-        logger.info(f"Task: {self.task_input.text()}")
-        logger.info(f"Project: {self.project_input.text()}")
-        logger.info(f"Tracking: {self.tracking_checkbox.isChecked()}")
-        logger.info("*****************************************************************")
-        logger.info(f"Preset: {self.preset_input.currentText()}")
-        logger.info(f"Engine: {self.engine_input.currentText()}")
-        logger.info(f"FPS: {self.fps_input.text()}")
-        logger.info(f"Resolution: {self.resolution_input.text()}")
-        logger.info(f"Options: {self.options_input.text()}")
-        logger.info(f"Template: {self.template_input.text()}")
-        logger.info(f"Output Path: {self.output_path.text()}")
-        logger.info(f"Slate: {self.slate_checkbox.isChecked()}")
-        logger.info("*****************************************************************")
+    def _log_submission(self, submission):
+        """
+        Logs the data from the form submission.
+
+        Args:
+            submission (Submission): The form values of the submission.
+        """
+        if not logger.isEnabledFor(logging.INFO):
+            return
+
+        separator = "*" * 65
+        lines = [
+            separator,
+            f"Path: {submission.path}",
+            f"Version: {submission.version}",
+            f"Description: {submission.description}",
+            f"Artist: {submission.artist}",
+            f"Link: {submission.link}",
+            f"Task: {submission.task}",
+            f"Project: {submission.project}",
+            f"Tracking: {submission.tracking}",
+            separator,
+            f"Preset: {submission.preset}",
+            f"Engine: {submission.engine}",
+            f"FPS: {submission.fps}",
+            f"Resolution: {submission.resolution}",
+            f"Options: {submission.options}",
+            f"Template: {submission.template}",
+            f"Output Path: {submission.output_path}",
+            f"Slate: {submission.slate}",
+            separator,
+        ]
+        # A single record, so the handlers are locked, written and flushed only once
+        logger.info("Submission:\n%s", "\n".join(lines))
+
+    def _read_submission(self):
+        """
+        Reads all the form values at once.
+
+        Returns:
+            Submission: The current form values.
+        """
+        return Submission(
+            path=self.input_path.text(),
+            version=self.version_input.text(),
+            description=self.description_input.toPlainText(),
+            artist=self.artist_input.text(),
+            link=self.link_input.text(),
+            task=self.task_input.text(),
+            project=self.project_input.text(),
+            tracking=self.tracking_checkbox.isChecked(),
+            preset=self.preset_input.currentText(),
+            engine=self.engine_input.currentText(),
+            extension=self.extension_input.currentText(),
+            fps=self.fps_input.text(),
+            resolution=self.resolution_input.text(),
+            options=self.options_input.text(),
+            template=self.template_input.text() if self.template_input is not None else "",
+            output_path=self.output_path.text(),
+            slate=self.slate_checkbox.isChecked(),
+        )
 
     def _set_fields_enabled(self, enabled):
         """
@@ -402,67 +583,63 @@ class DailiesUI(QWidget):
         Args:
             enabled (bool): Whether the fields should be enabled or disabled.
         """
-        self.engine_input.setEnabled(enabled)
-        self.extension_input.setEnabled(enabled)
-        self.resolution_input.setEnabled(enabled)
-        self.fps_input.setEnabled(enabled)
-        self.options_input.setEnabled(enabled)
-        self.slate_checkbox.setEnabled(enabled)
-        self.template_input.setEnabled(enabled)
-        self.template_button.setEnabled(enabled)
+        # Repaint once for all the fields, keeping updates disabled if they already were
+        updates_enabled = self.updatesEnabled()
+        self.setUpdatesEnabled(False)
+        for widget in self._preset_gated:
+            widget.setEnabled(enabled)
+        self.setUpdatesEnabled(updates_enabled)
 
     def _set_field_tooltips(self):
         """
         Sets helpful tooltips for each field in the UI to guide the user.
         """
-        self.input_path.setToolTip("Select the input video or image file.")
-        self.version_input.setToolTip(
-            "Enter the version name of the media (e.g., 'foobar_v001')."
-        )
-        self.description_input.setToolTip(
-            "Provide a brief description of the daily submission."
-        )
-        self.artist_input.setToolTip(
-            "Enter the artist's name responsible for the media."
-        )
-        self.link_input.setToolTip(
-            "Provide an entity name (e.g. asset, sequence or shot) for the daily."
-        )
-        self.task_input.setToolTip("Enter the task associated with this media.")
-        self.project_input.setToolTip("Enter the project name.")
-        self.tracking_checkbox.setToolTip(
-            "Check this box to create a version for the entity in the tracking software."
-        )
-        self.preset_input.setToolTip("Select a render preset (if any).")
-        self.engine_input.setToolTip(
-            "Select the rendering engine to use (e.g., FFmpeg, Nuke)."
-        )
-        self.resolution_input.setToolTip(
-            "Enter the resolution in the format 'width x height' (e.g., 1920x1080)."
-        )
-        self.fps_input.setToolTip(
-            "Enter the FPS (Frames Per Second) for the media (e.g., 24)."
-        )
-        self.options_input.setToolTip(
-            "Enter any additional options as key-value pairs (e.g., 'key=value')."
-        )
-        self.template_input.setToolTip("Select the Nuke template file.")
-        self.output_path.setToolTip(
-            "Select the output file path where the rendered media will be saved."
-        )
-        self.slate_checkbox.setToolTip(
-            "Check this box if you want to generate a slate for the video."
+        tooltips = (
+            (self.input_path, "Select the input video or image file."),
+            (self.version_input, "Enter the version name of the media (e.g., 'foobar_v001')."),
+            (self.description_input, "Provide a brief description of the daily submission."),
+            (self.artist_input, "Enter the artist's name responsible for the media."),
+            (
+                self.link_input,
+                "Provide an entity name (e.g. asset, sequence or shot) for the daily.",
+            ),
+            (self.task_input, "Enter the task associated with this media."),
+            (self.project_input, "Enter the project name."),
+            (
+                self.tracking_checkbox,
+                "Check this box to create a version for the entity in the tracking software.",
+            ),
+            (self.preset_input, "Select a render preset (if any)."),
+            (self.engine_input, "Select the rendering engine to use (e.g., FFmpeg, Nuke)."),
+            (
+                self.resolution_input,
+                "Enter the resolution in the format 'width x height' (e.g., 1920x1080).",
+            ),
+            (self.fps_input, "Enter the FPS (Frames Per Second) for the media (e.g., 24)."),
+            (
+                self.options_input,
+                "Enter any additional options as key-value pairs (e.g., 'key=value').",
+            ),
+            (
+                self.output_path,
+                "Select the output file path where the rendered media will be saved.",
+            ),
+            (self.slate_checkbox, "Check this box if you want to generate a slate for the video."),
         )
+        for widget, tooltip in tooltips:
+            widget.setToolTip(tooltip)
 
     def _show_error(self, title, message):
         """Displays an error message box."""
-        msg = QMessageBox(self)
-        msg.setIcon(QMessageBox.Critical)  # Change to Critical for error
-        msg.setWindowTitle(title)
-        msg.setText(message)
-        msg.setStandardButtons(QMessageBox.Ok)
-        msg.exec()
-        return
+        # The message box is created on the first error and reused afterwards
+        if self._err_msg is None:
+            self._err_msg = QMessageBox(self)
+            self._err_msg.setIcon(QMessageBox.Critical)  # Change to Critical for error
+            self._err_msg.setStandardButtons(QMessageBox.Ok)
+
+        self._err_msg.setWindowTitle(title)
+        self._err_msg.setText(message)
+        self._err_msg.exec()
 
     def _update_render_fields_visibility(self):
         """
@@ -471,10 +648,14 @@ class DailiesUI(QWidget):
         engine = self.engine_input.currentText()
         is_visible = engine != "Nuke-Template"
 
-        # First update template fields visibility
-        self.template_label.setVisible(not is_visible)
-        self.template_input.setVisible(not is_visible)
-        self.template_button.setVisible(not is_visible)
+        # First update template fields visibility, building them the first time they are needed
+        if self.template_input is None and not is_visible:
+            self._build_template_row()
+
+        if self.template_input is not None:
+            self.template_label.setVisible(not is_visible)
+            self.template_input.setVisible(not is_visible)
+            self.template_button.setVisible(not is_visible)
 
         # Second update the remaining render fields visibility
         self.extension_label.setVisible(is_visible)
@@ -494,14 +675,19 @@ class DailiesUI(QWidget):
         Returns:
             int or None: The FPS as an integer or None if invalid.
         """
-        try:
-            return int(self.fps_input.text()) if self.fps_input.text() else None
-        except ValueError:
-            logger.error(f"Invalid FPS: {self.fps_input.text()}.")
-            self._show_error("Invalid FPS", "FPS should be an integer value.")
+        fps = self.fps_input.text()
+        if not fps:
+            return None
+
+        # The validator only prevents typing invalid values, text set by a preset is checked here
+        if not self.fps_input.hasAcceptableInput():
+            logger.error(f"Invalid FPS: {fps}.")
+            self._show_error("Invalid FPS", "FPS should be an integer value between 1 and 240.")
             self._is_error = True
             return None
 
+        return int(fps)
+
     def get_resolution(self):
         """
         Retrieves and validates the resolution input.
@@ -509,11 +695,12 @@ class DailiesUI(QWidget):
         Returns:
             tuple or None: A tuple (width, height) or None if invalid.
         """
-        try:
-            width, height = map(int, self.resolution_input.text().split("x"))
-            return (width, height)
-        except ValueError:
-            logger.error(f"Invalid resolution: {self.resolution_input.text()}.")
+        resolution = self.resolution_input.text()
+
+        # The validator only prevents typing invalid values, an empty or partial
+        # resolution (e.g., '1920x') or one set by a preset is checked here
+        if not self.resolution_input.hasAcceptableInput():
+            logger.error(f"Invalid resolution: {resolution}.")
             self._show_error(
                 "Invalid Resolution",
                 "Resolution should be in the format 'width x height' (e.g., 1920x1080).",
@@ -521,6 +708,9 @@ class DailiesUI(QWidget):
             self._is_error = True
             return None
 
+        width, _, height = resolution.partition("x")
+        return (int(width), int(height))
+
     def get_options(self):
         """
         Retrieves and validates the options input into key-value pairs or standalone values.
@@ -528,58 +718,65 @@ class DailiesUI(QWidget):
         Returns:
             dict or None: A dictionary of key-value pairs or None if invalid.
         """
-        options = {}
         options_input = self.options_input.text()
+        if not options_input:
+            return None
 
-        if options_input:
-            # Define a regex pattern to match key-value pairs and standalone values with spaces allowed
-            pattern = r"([a-zA-Z0-9_]+=[^,]+|[a-zA-Z0-9_]+)(?:,([a-zA-Z0-9_]+=[^,]+|[a-zA-Z0-9_]+))*"
-
-            if re.fullmatch(pattern, options_input):
-                pairs = options_input.split(",")
-                for pair in pairs:
-                    pair = pair.strip()
-                    if "=" in pair:
-                        key, value = pair.split("=")
-                        options[key.strip()] = value.strip()
-                    else:
-                        options[pair] = None
-            else:
-                self._show_error(
-                    "Invalid Options",
-                    "Options must be in the format 'key=value' or standalone values separated by commas.",
-                )
-                self._is_error = True
-                return None
+        # Validate each comma separated option on its own
+        pairs = [pair.strip() for pair in options_input.split(",")]
+        if not all(_OPT_TOKEN.match(pair) for pair in pairs):
+            self._show_error(
+                "Invalid Options",
+                "Options must be in the format 'key=value' or standalone values separated by commas.",
+            )
+            self._is_error = True
+            return None
 
+        # Build the options in one pass, standalone values map to None
+        options = {
+            key: value.strip() if separator else None
+            for key, separator, value in (pair.partition("=") for pair in pairs)
+        }
         return options if options else None
 
-    def get_slate_data(self):
+    def get_slate_data(self, submission=None, fps=None):
         """
         Collects and returns the slate data for video rendering or tracking.
 
+        Args:
+            submission (Submission, optional): The form values, read from the form if not provided.
+            fps (int, optional): The validated FPS, converted from the form value if not provided.
+
         Returns:
             dict: A dictionary containing the collected slate data,
                   including version, file, description, artist, link, task,
                   project, resolution, and FPS.
         """
-        slate_data = {}
-        file_name = os.path.basename(self.input_path.text()).replace(
-            FRAME_PADDING_FORMAT, FRAME_START_NUMBER
-        )
+        if submission is None:
+            submission = self._read_submission()
+
+        if self._cached_slate_filename is None:
+            self._cached_slate_filename = os.path.basename(submission.path).replace(
+                FRAME_PADDING_FORMAT, FRAME_START_NUMBER
+            )
+
         slate_data = {
-            "version": self.version_input.text(),
-            "file": file_name,
-            "description": self.description_input.toPlainText(),
-            "artist": self.artist_input.text(),
-            "link": self.link_input.text(),
-            "task": self.task_input.text(),
-            "project": self.project_input.text(),
-            "resolution": self.resolution_input.text(),
-            "fps": int(self.fps_input.text()),
+            "version": submission.version,
+            "file": self._cached_slate_filename,
+            "description": submission.description,
+            "artist": submission.artist,
+            "link": submission.link,
+            "task": submission.task,
+            "project": submission.project,
+            "resolution": submission.resolution,
+            "fps": fps if fps is not None else int(submission.fps),
         }
         return slate_data
 
+    def _invalidate_slate_filename(self):
+        """Discards the cached slate file name when the input path changes."""
+        self._cached_slate_filename = None
+
     def set_options(self, options):
         """
         Sets the options input field with a comma-separated string of key-value pairs or flags
@@ -605,13 +802,13 @@ class DailiesUI(QWidget):
         """
         self._is_error = False
 
-        input_path = self.input_path.text()
-        version = self.version_input.text()
-        is_tracking = self.tracking_checkbox.isChecked()
-        is_slate = self.slate_checkbox.isChecked()
-        engine = self.engine_input.currentText()
+        # Read each widget once, the values are then passed down to the submission steps
+        submission = self._read_submission()
+        engine = submission.engine
+        template = submission.template
 
         # FPS, resolution, options are only supported for 'Nuke', 'FFmpeg', 'RVIO' engine
+        fps = resolution = options = None
         if engine != "Nuke-Template":
             fps = self.get_fps()
             resolution = self.get_resolution()
@@ -619,27 +816,22 @@ class DailiesUI(QWidget):
             if self._is_error:
                 return
 
-        extension = self.extension_input.currentText()
-        template = self.template_input.text()
-        output_path = self.output_path.text()
-        is_slate = self.slate_checkbox.isChecked()
-
         if engine == "Nuke-Template" and not os.path.isfile(template):
             template = os.path.join(DEFAULT_TEMPLATE_DIRECTORY, template)
 
-        self._log_submission()
+        self._log_submission(submission)
 
         slate_data = None
-        if is_slate:
-            slate_data = self.get_slate_data()
+        if submission.slate:
+            slate_data = self.get_slate_data(submission, fps=fps)
 
         # Create media
         if not self._is_error:
             self._create_media(
                 engine,
-                input_path,
-                output_path,
-                extension,
+                submission.path,
+                submission.output_path,
+                submission.extension,
                 resolution,
                 fps,
                 template,
@@ -648,8 +840,10 @@ class DailiesUI(QWidget):
             )
 
         # Create tracking version
-        if not self._is_error and is_tracking:
-            self._create_tracking_version(version, output_path)
+        if not self._is_error and submission.tracking:
+            self._create_tracking_version(
+                submission.version, submission.output_path, submission.description
+            )
 
         logger.info("Data submitted successfully!")
 
@@ -674,30 +868,42 @@ class DailiesUI(QWidget):
         """
         Updates render settings based on selected preset and engine.
         """
+        preset = self.preset_input.currentText()
+        preset_info = self.presets.get(preset) if preset != "None" else None
+        if preset_info is not None:
+            # Apply the preset engine first, so the extension list below is built only once
+            # for it, without re-entering this method through currentTextChanged
+            with QSignalBlocker(self.engine_input):
+                self.engine_input.setCurrentText(preset_info.get("engine", ""))
+
         self._update_render_fields_visibility()
 
-        preset = self.preset_input.currentText()
         engine = self.engine_input.currentText()
 
-        extension = None
-        if self.extension_input.count():
-            extension = self.extension_input.currentText()
-            self.extension_input.clear()
-
-        items = SUPPORTED_FILE_TYPES.get(engine.lower(), [])
-        if items:
-            self.extension_input.addItems(items)
-            if extension in items:
-                self.extension_input.setCurrentText(extension)
-
-        if preset != "None" and preset in self.presets:
-            preset_info = self.presets[preset]
-            self.extension_input.setCurrentText(preset_info.get("extension", ""))
-            self.resolution_input.setText(preset_info.get("resolution", ""))
-            self.fps_input.setText(preset_info.get("fps", ""))
-            self.set_options(preset_info.get("options", {}))
-            self.slate_checkbox.setChecked(preset_info.get("slate", False))
-            self.engine_input.setCurrentText(preset_info.get("engine", ""))
-            self.template_input.setText(preset_info.get("template", ""))
+        # Only rebuild the extension list when the engine changed
+        items = list(SUPPORTED_FILE_TYPES.get(engine.lower(), ()))
+        if (engine, items) != self._last_engine_items:
+            with QSignalBlocker(self.extension_input):
+                extension = None
+                if self.extension_input.count():
+                    extension = self.extension_input.currentText()
+                    self.extension_input.clear()
+
+                if items:
+                    self.extension_input.addItems(items)
+                    if extension in items:
+                        self.extension_input.setCurrentText(extension)
+
+            self._last_engine_items = (engine, items)
+
+        if preset_info is not None:
+            with QSignalBlocker(self.extension_input), QSignalBlocker(self.slate_checkbox):
+                self.extension_input.setCurrentText(preset_info.get("extension", ""))
+                self.resolution_input.setText(preset_info.get("resolution", ""))
+                self.fps_input.setText(preset_info.get("fps", ""))
+                self.set_options(preset_info.get("options", {}))
+                self.slate_checkbox.setChecked(preset_info.get("slate", False))
+                if self.template_input is not None:
+                    self.template_input.setText(preset_info.get("template", ""))
 
         self._set_fields_enabled(preset == "None")